@@ -4,8 +4,7 @@ import numpy as np
 from PyQt6.QtCore import pyqtSignal
 
 from compmath.api.base import APIBase, urljoin
-from compmath.models.graphic import Graphic, PolygonModel, RectModel, GraphModel, PointModel
-from compmath.utils.data import dicts_to_dataclasses
+from compmath.models.graphic import Graphic, ScatterModel, decode_graphs
 
 
 class AIFClient(APIBase):
@@ -35,8 +34,9 @@ class AIFClient(APIBase):
                 "x_limits": x_limits,
                 "y_limits": y_limits
             },
-            [self._alsm_calculated],
-            [self.alsmError.emit]
+            [self.alsmCalculated.emit],
+            [self.alsmError.emit],
+            decoder=self._decode_alsm
         )
 
     def calc_interp(
@@ -63,79 +63,65 @@ class AIFClient(APIBase):
                 "y_limits": y_limits,
                 "x": x
             },
-            [self._interp_calculated],
-            [self.interpError.emit]
+            [self.interpCalculated.emit],
+            [self.interpError.emit],
+            decoder=self._decode_interp
         )
 
-    def _interp_calculated(self, content: list[dict[str, Any]]):
+    @staticmethod
+    def _scatter(points: dict[str, Any]) -> ScatterModel:
+        """
+        Общее для всех моделей облако исходных точек (возможно, прореженное сервером)
+        """
+        return ScatterModel(
+            x_data=np.asarray(points['x_data'], dtype=float),
+            y_data=np.asarray(points['y_data'], dtype=float),
+            color=points['color'],
+            total=points['total']
+        )
+
+    @classmethod
+    def _decode_interp(cls, content: dict[str, Any]) -> list[tuple[Graphic, list[str], str]]:
+        scatter = cls._scatter(content['points'])
         result = []
-        for el in content:
+        for el in content['results']:
             graphs = el['graphic_items']
             logs = el['log']
             title = el['title']
-            plot_items = dicts_to_dataclasses(
-                graphs,
-                [
-                    PolygonModel,
-                    RectModel,
-                    GraphModel,
-                    PointModel
-                ]
-            )
-
-            for item in plot_items:
-                if isinstance(item, GraphModel):
-                    if None in item.x_data:
-                        for i, coord in enumerate(item.x_data):
-                            if coord is None:
-                                item.x_data[i] = np.nan
-                    if None in item.y_data:
-                        for i, coord in enumerate(item.y_data):
-                            if coord is None:
-                                item.y_data[i] = np.nan
+            plot_items = decode_graphs(graphs)
 
             graphic = Graphic()
+            graphic.graphs.append(scatter)
             graphic.graphs.extend(plot_items)
 
             result.append((graphic, logs, title))
-        self.interpCalculated.emit(result)
+        return result
+
+    @classmethod
+    def _decode_alsm(cls, content: dict[str, Any]) -> list[tuple[Graphic, list[str], tuple[float, float], str]]:
+        return cls._alsm_results(content['results'], cls._scatter(content['points']))
 
-    def _alsm_calculated(self, content: list[dict[str, Any]]):
+    @staticmethod
+    def _alsm_results(
+            content: list[dict[str, Any]],
+            scatter: ScatterModel
+    ) -> list[tuple[Graphic, list[str], tuple[float, float], str]]:
         result = []
         for el in content:
             graphs = el['graphic_items']
             logs = el['log']
             results = (el['sum_diff'], el["coefficient"])
             title = el['title']
-            plot_items = dicts_to_dataclasses(
-                graphs,
-                [
-                    PolygonModel,
-                    RectModel,
-                    GraphModel,
-                    PointModel
-                ]
-            )
-
-            for item in plot_items:
-                if isinstance(item, GraphModel):
-                    if None in item.x_data:
-                        for i, coord in enumerate(item.x_data):
-                            if coord is None:
-                                item.x_data[i] = np.nan
-                    if None in item.y_data:
-                        for i, coord in enumerate(item.y_data):
-                            if coord is None:
-                                item.y_data[i] = np.nan
+            plot_items = decode_graphs(graphs)
             if results[1] is None:
                 results = (results[0], np.nan)
 
             if results[0] is None:
                 results = (np.nan, results[1])
 
-
             graphic = Graphic()
+            graphic.graphs.append(scatter)
             graphic.graphs.extend(plot_items)
 
             result.append((graphic, logs, results, title))
-        self.alsmCalculated.emit(result)
+        return result
@@ -1,10 +1,23 @@
+import gzip
 import json
+import zlib
+from collections import OrderedDict
 from functools import reduce
 from typing import Callable, Any, Literal
 
-from PyQt6.QtCore import QObject, QUrl
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QUrl, pyqtSignal
 from PyQt6.QtNetwork import QNetworkReply, QNetworkRequest, QNetworkAccessManager
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Сжатие ответов, которое клиент распаковывает сам (заголовок Accept-Encoding)
+ACCEPT_ENCODING = b"zstd, gzip" if zstandard is not None else b"gzip"
+
+DECOMPRESS_ERRORS = (OSError, EOFError, zlib.error) + ((zstandard.ZstdError,) if zstandard is not None else ())
+
 
 def join_slash(a, b):
     return a.rstrip('/') + '/' + b.lstrip('/')
@@ -14,78 +27,329 @@ def urljoin(*args):
     return reduce(join_slash, args) if args else ''
 
 
+def decompress(body: bytes, encoding: str) -> bytes:
+    """
+    Распаковка тела ответа по заголовку Content-Encoding
+
+    :param body: тело ответа
+    :param encoding: значение Content-Encoding (пустое - без сжатия)
+    :return: распакованное тело
+    :raises ValueError: поврежденные данные
+    """
+    encoding = encoding.strip().lower()
+    try:
+        if encoding == "gzip":
+            return gzip.decompress(body)
+        if encoding == "zstd" and zstandard is not None:
+            return zstandard.ZstdDecompressor().decompress(body)
+    except DECOMPRESS_ERRORS as error:
+        raise ValueError(f"Не удалось распаковать ответ ({encoding}): {error}") from error
+    return body
+
+
+class DecodedResponse:
+    """
+    Разобранный ответ: содержимое (после decoder) или сообщение об ошибке
+    """
+    __slots__ = ("body", "content", "error", "failed", "empty")
+
+    def __init__(
+            self,
+            body: bytes,
+            content: Any = None,
+            error: str | None = None,
+            failed: bool = False,
+            empty: bool = False
+    ):
+        self.body = body
+        self.content = content
+        self.error = error
+        self.failed = failed
+        self.empty = empty
+
+
+def error_message(response_json: Any) -> str:
+    message = "Неизвестная ошибка"
+    if isinstance(response_json, dict) and (error := response_json.get("error")):
+        error_type = error.get("type")
+        if error_type == 1:
+            message = error.get("content")
+        elif error_type == 2:
+            first_error_item = error.get("content")[0]
+            message = f"Ошибка в поле: {first_error_item.get("field")}: {first_error_item.get("message")}"
+    return message
+
+
+def decode_response(
+        body: bytes,
+        encoding: str,
+        failed: bool,
+        decoder: Callable[[Any], Any] | None = None
+) -> DecodedResponse:
+    """
+    Распаковка, разбор JSON и преобразование содержимого ответа
+
+    Выполняется в пуле потоков: в поток GUI возвращается готовый результат.
+
+    :param body: тело ответа
+    :param encoding: Content-Encoding (пустой для тела из кэша ETag)
+    :param failed: ответ с ошибкой (сетевой или HTTP)
+    :param decoder: преобразование содержимого (content) ответа, например в модели графиков
+    """
+    try:
+        body = decompress(body, encoding)
+    except ValueError:
+        body = b""
+
+    try:
+        response_json = json.loads(body.decode())
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        response_json = None
+
+    if failed:
+        return DecodedResponse(body, error=error_message(response_json), failed=True)
+    if not response_json:
+        return DecodedResponse(body, empty=True)
+
+    content = response_json.get("content")
+    if decoder is not None:
+        try:
+            content = decoder(content)
+        except (KeyError, TypeError, ValueError) as error:
+            return DecodedResponse(body, error=f"Некорректный ответ сервера: {error}", failed=True)
+    return DecodedResponse(body, content=content)
+
+
+class _DecodeSignals(QObject):
+    decoded = pyqtSignal(object)
+
+
+class DecodeTask(QRunnable):
+    """
+    Разбор ответа в пуле потоков; результат приходит сигналом в поток GUI
+    """
+
+    def __init__(self, body: bytes, encoding: str, failed: bool, decoder: Callable[[Any], Any] | None):
+        super().__init__()
+        self.signals = _DecodeSignals()
+        self._args = (body, encoding, failed, decoder)
+
+    def run(self):
+        self.signals.decoded.emit(decode_response(*self._args))
+
+
 class APIBase(QObject):
+    # Ответы с ETag, общие для всех клиентов: (метод, адрес, тело) -> (ETag, тело ответа)
+    _etag_cache: OrderedDict[tuple[str, str, bytes], tuple[bytes, bytes]] = OrderedDict()
+    ETAG_CACHE_SIZE = 32
 
     def __init__(self, base_url: str):
         super().__init__()
         self._base_url = base_url
 
         self._managers = []
+        # Сигналы задач разбора ответов, еще не вернувших результат
+        self._tasks: set[QObject] = set()
+        # Номер последнего запроса и номер последнего доставленного ответа по каналам
+        self._sequence = 0
+        self._delivered: dict[str, int] = {}
+
+    def stamp(self, channel: str) -> tuple[str, int]:
+        """
+        Номер запроса в канале
+
+        Ответы разбираются параллельно и могут прийти не в порядке запросов;
+        ответ на более ранний запрос канала, пришедший после более позднего,
+        отбрасывается (см. _on_decoded).
+
+        :param channel: канал, например метод и путь запроса
+        :return: канал и номер запроса
+        """
+        self._sequence += 1
+        return channel, self._sequence
 
     def get(
             self,
             url: str,
             success_callbacks: list[Callable[[Any], Any]] | None = None,
-            error_callbacks: list[Callable[[str], Any]] | None = None
+            error_callbacks: list[Callable[[str], Any]] | None = None,
+            decoder: Callable[[Any], Any] | None = None,
+            sequence: tuple[str, int] | None = None
     ):
-        self.make_request("get", url, None, success_callbacks, error_callbacks)
+        self.make_request("get", url, None, success_callbacks, error_callbacks, decoder=decoder, sequence=sequence)
 
     def post(
             self,
             url: str,
             data: dict[str, Any],
             success_callbacks: list[Callable[[Any], Any]] | None = None,
-            error_callbacks: list[Callable[[str], Any]] | None = None
+            error_callbacks: list[Callable[[str], Any]] | None = None,
+            decoder: Callable[[Any], Any] | None = None,
+            sequence: tuple[str, int] | None = None
     ):
-        self.make_request("post", url, data, success_callbacks, error_callbacks)
+        self.make_request("post", url, data, success_callbacks, error_callbacks, decoder=decoder, sequence=sequence)
 
-    def make_request(
+    def delete(
             self,
-            method: Literal["get", "post"],
             url: str,
-            data: dict[str, Any] | None = None,
             success_callbacks: list[Callable[[Any], Any]] | None = None,
             error_callbacks: list[Callable[[str], Any]] | None = None
     ):
+        self.make_request("delete", url, None, success_callbacks, error_callbacks)
+
+    def stream(
+            self,
+            url: str,
+            event_callbacks: list[Callable[[str, Any], Any]],
+            error_callbacks: list[Callable[[str], Any]] | None = None
+    ):
+        """
+        Чтение потока событий (Server-Sent Events)
+
+        :param url: адрес потока
+        :param event_callbacks: обработчики события (тип события, данные JSON)
+        :param error_callbacks: обработчики обрыва соединения
+        """
         request = QNetworkRequest(QUrl(url))
+        request.setRawHeader(b"Accept", b"text/event-stream")
 
         manager = QNetworkAccessManager(self)
-        manager.finished.connect(lambda reply: self._on_finished(reply, success_callbacks, error_callbacks))
         self._managers.append(manager)
+        reply = manager.get(request)
+        buffer = bytearray()
+
+        def on_ready_read():
+            buffer.extend(reply.readAll().data())
+            while (end := buffer.find(b"\n\n")) != -1:
+                frame = bytes(buffer[:end]).decode()
+                del buffer[:end + 2]
+
+                event, data = "message", []
+                for line in frame.splitlines():
+                    if line.startswith("event:"):
+                        event = line[6:].strip()
+                    elif line.startswith("data:"):
+                        data.append(line[5:].strip())
+
+                for callback in event_callbacks:
+                    callback(event, json.loads("\n".join(data)) if data else None)
+
+        def on_finished():
+            if reply.error() != QNetworkReply.NetworkError.NoError and error_callbacks is not None:
+                for callback in error_callbacks:
+                    callback("Соединение с сервером прервано")
+            self._managers.remove(manager)
+            reply.deleteLater()
+
+        reply.readyRead.connect(on_ready_read)
+        reply.finished.connect(on_finished)
+
+    def make_request(
+            self,
+            method: Literal["get", "post", "delete"],
+            url: str,
+            data: dict[str, Any] | None = None,
+            success_callbacks: list[Callable[[Any], Any]] | None = None,
+            error_callbacks: list[Callable[[str], Any]] | None = None,
+            decoder: Callable[[Any], Any] | None = None,
+            sequence: tuple[str, int] | None = None
+    ):
+        """
+        :param decoder: преобразование содержимого ответа; выполняется вместе с разбором
+            JSON в пуле потоков, обработчики success_callbacks получают его результат
+        :param sequence: номер запроса (stamp); по умолчанию канал - метод и путь запроса
+        """
+        request = QNetworkRequest(QUrl(url))
+        if sequence is None:
+            sequence = self.stamp(f"{method} {request.url().path()}")
 
         # Data
         if data:
             data = json.dumps(data).encode()
             request.setHeader(QNetworkRequest.KnownHeaders.ContentTypeHeader, "application/json")
 
+        # Большие ответы сервер сжимает; Qt не распаковывает их, если заголовок задан явно
+        request.setRawHeader(b"Accept-Encoding", ACCEPT_ENCODING)
+
+        # Результат, уже полученный для того же запроса, сервер не передает повторно (304)
+        cache_key = (method, url, data or b"")
+        if cache_key in self._etag_cache:
+            request.setRawHeader(b"If-None-Match", self._etag_cache[cache_key][0])
+
+        manager = QNetworkAccessManager(self)
+        manager.finished.connect(
+            lambda reply: self._on_finished(reply, success_callbacks, error_callbacks, cache_key, decoder, sequence)
+        )
+        self._managers.append(manager)
+
         if method == "get":
             manager.get(request)
         elif method == "post":
             manager.post(request, data)
+        elif method == "delete":
+            manager.deleteResource(request)
 
     def _on_finished(
             self,
             reply: QNetworkReply,
             success_callbacks: list[Callable[[Any], Any]] | None,
-            error_callbacks: list[Callable[[str], Any]] | None
+            error_callbacks: list[Callable[[str], Any]] | None,
+            cache_key: tuple[str, str, bytes] | None = None,
+            decoder: Callable[[Any], Any] | None = None,
+            sequence: tuple[str, int] | None = None
     ):
-        try:
-            response_json = json.loads(reply.readAll().data().decode())
-        except json.JSONDecodeError:
-            response_json = None
-
-        if reply.error() != QNetworkReply.NetworkError.NoError and error_callbacks is not None:
-            message = "Неизвестная ошибка"
-            if response_json and (error := response_json.get("error")):
-                error_type = error.get("type")
-                if error_type == 1:
-                    message = error.get("content")
-                elif error_type == 2:
-                    first_error_item = error.get("content")[0]
-                    message = f"Ошибка в поле: {first_error_item.get("field")}: {first_error_item.get("message")}"
-            for callback in error_callbacks:
-                callback(message)
-        elif (reply.error() == QNetworkReply.NetworkError.NoError) and response_json and success_callbacks is not None:
-            for callback in success_callbacks:
-                callback(response_json.get("content"))
+        body = reply.readAll().data()
+        encoding = reply.rawHeader(b"Content-Encoding").data().decode()
+        failed = reply.error() != QNetworkReply.NetworkError.NoError
+
+        status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+        etag = None
+        if status == 304 and cache_key in self._etag_cache:
+            self._etag_cache.move_to_end(cache_key)
+            body, encoding = self._etag_cache[cache_key][1], ""
+        elif status == 200 and cache_key is not None and reply.hasRawHeader(b"ETag"):
+            etag = reply.rawHeader(b"ETag").data()
+
         self._managers.remove(reply.manager())
+
+        # Распаковка и разбор больших ответов не блокируют поток GUI
+        task = DecodeTask(body, encoding, failed, decoder)
+        signals = task.signals
+        signals.decoded.connect(
+            lambda response: self._on_decoded(
+                response, signals, success_callbacks, error_callbacks, cache_key, etag, sequence
+            )
+        )
+        self._tasks.add(signals)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_decoded(
+            self,
+            response: DecodedResponse,
+            signals: QObject,
+            success_callbacks: list[Callable[[Any], Any]] | None,
+            error_callbacks: list[Callable[[str], Any]] | None,
+            cache_key: tuple[str, str, bytes] | None,
+            etag: bytes | None,
+            sequence: tuple[str, int] | None = None
+    ):
+        self._tasks.discard(signals)
+        if etag is not None and response.body:
+            self._etag_cache[cache_key] = (etag, response.body)
+            if len(self._etag_cache) > self.ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+
+        if sequence is not None:
+            channel, number = sequence
+            if number < self._delivered.get(channel, 0):
+                # Уже показан ответ на более поздний запрос
+                return
+            self._delivered[channel] = number
+
+        if response.failed:
+            if error_callbacks is not None:
+                for callback in error_callbacks:
+                    callback(response.error)
+        elif not response.empty and success_callbacks is not None:
+            for callback in success_callbacks:
+                callback(response.content)
@@ -1,23 +1,41 @@
 import urllib.parse as urllib
+from typing import TYPE_CHECKING
 
-from compmath.api.aif import AIFClient
-from compmath.api.ni import NIClient
-from compmath.api.slat import SLATClient
-from compmath.api.sne import SNEClient
+# Клиенты импортируются при создании: декодеры ответов тянут модели страниц
+# (и sympy), которые не нужны до открытия страницы
+if TYPE_CHECKING:
+    from compmath.api.aif import AIFClient
+    from compmath.api.jobs import JobsClient
+    from compmath.api.ni import NIClient
+    from compmath.api.nonlinear import NonLinearClient
+    from compmath.api.slat import SLATClient
+    from compmath.api.sne import SNEClient
 
 
 class APIFactory:
     def __init__(self, host: str, port: int, scheme: str = "http", path: str = "api"):
         self._base_url = urllib.urljoin(f"{scheme}://{host}:{port}", path)
 
-    def create_aif(self) -> AIFClient:
+    def create_aif(self) -> "AIFClient":
+        from compmath.api.aif import AIFClient
         return AIFClient(self._base_url)
 
-    def create_sne(self) -> SNEClient:
+    def create_sne(self) -> "SNEClient":
+        from compmath.api.sne import SNEClient
         return SNEClient(self._base_url)
 
-    def create_ni(self) -> NIClient:
+    def create_ni(self) -> "NIClient":
+        from compmath.api.ni import NIClient
         return NIClient(self._base_url)
 
-    def create_slat(self) -> SLATClient:
+    def create_slat(self) -> "SLATClient":
+        from compmath.api.slat import SLATClient
         return SLATClient(self._base_url)
+
+    def create_jobs(self) -> "JobsClient":
+        from compmath.api.jobs import JobsClient
+        return JobsClient(self._base_url)
+
+    def create_nonlinear(self) -> "NonLinearClient":
+        from compmath.api.nonlinear import NonLinearClient
+        return NonLinearClient(self._base_url)
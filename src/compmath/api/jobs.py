@@ -0,0 +1,96 @@
+from typing import Any, Callable
+
+from PyQt6.QtCore import pyqtSignal
+
+from compmath.api.base import APIBase, urljoin
+
+
+class JobsClient(APIBase):
+    """
+    Клиент фоновых задач сервера
+
+    Задача отправляется в /jobs, ход расчета читается из потока событий,
+    результат запрашивается по завершении
+    """
+    jobStarted = pyqtSignal(str)
+    jobProgress = pyqtSignal(str, object)
+    jobCancelled = pyqtSignal(str)
+
+    def run_job(
+            self,
+            method: str,
+            params: dict[str, Any],
+            success_callbacks: list[Callable[[Any], Any]],
+            error_callbacks: list[Callable[[str], Any]],
+            decoder: Callable[[Any], Any] | None = None
+    ) -> None:
+        """
+        Запуск задачи
+
+        :param method: метод сервера, например "slat/sim"
+        :param params: входные данные метода
+        :param success_callbacks: обработчики результата
+        :param error_callbacks: обработчики ошибки
+        :param decoder: преобразование результата (выполняется вне потока GUI)
+        """
+        # Результат задачи запрашивается по ее адресу, поэтому номер выдается при запуске
+        # и общий для отправки задачи и запроса результата
+        sequence = self.stamp(f"jobs {method}")
+        self.post(
+            urljoin(self._base_url, "/jobs"),
+            {
+                "method": method,
+                "params": params
+            },
+            [lambda content: self._job_submitted(
+                content["job_id"], success_callbacks, error_callbacks, decoder, sequence
+            )],
+            error_callbacks,
+            sequence=sequence
+        )
+
+    def cancel_job(self, job_id: str) -> None:
+        self.delete(urljoin(self._base_url, f"/jobs/{job_id}"))
+
+    def _job_submitted(
+            self,
+            job_id: str,
+            success_callbacks: list[Callable[[Any], Any]],
+            error_callbacks: list[Callable[[str], Any]],
+            decoder: Callable[[Any], Any] | None = None,
+            sequence: tuple[str, int] | None = None
+    ) -> None:
+        self.jobStarted.emit(job_id)
+        self.stream(
+            urljoin(self._base_url, f"/jobs/{job_id}/events"),
+            [lambda event, data: self._job_event(
+                job_id, event, data, success_callbacks, error_callbacks, decoder, sequence
+            )],
+            error_callbacks
+        )
+
+    def _job_event(
+            self,
+            job_id: str,
+            event: str,
+            data: dict[str, Any] | None,
+            success_callbacks: list[Callable[[Any], Any]],
+            error_callbacks: list[Callable[[str], Any]],
+            decoder: Callable[[Any], Any] | None = None,
+            sequence: tuple[str, int] | None = None
+    ) -> None:
+        if event == "progress":
+            self.jobProgress.emit(job_id, data)
+        elif event == "done":
+            self.get(
+                urljoin(self._base_url, f"/jobs/{job_id}"),
+                success_callbacks,
+                error_callbacks,
+                decoder=lambda content: decoder(content["result"]) if decoder else content["result"],
+                sequence=sequence
+            )
+        elif event == "error":
+            for callback in error_callbacks:
+                callback(data.get("error") or "Неизвестная ошибка")
+        elif event == "cancelled":
+            self.jobCancelled.emit(job_id)
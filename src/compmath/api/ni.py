@@ -1,10 +1,9 @@
 from typing import Any
 
-import numpy as np
 from PyQt6.QtCore import pyqtSignal
 
 from compmath.api.base import APIBase, urljoin
-from compmath.models.graphic import Graphic, PolygonModel, RectModel, GraphModel, PointModel, MeshModel
+from compmath.models.graphic import Graphic, decode_graphs
 from compmath.models.ni.base import TableRow
 from compmath.utils.data import dicts_to_dataclasses
 
@@ -56,8 +55,9 @@ class NIClient(APIBase):
                 "x_limits": x_limits,
                 "y_limits": y_limits
             },
-            [lambda content: self._calculated(self.lrmCalculated, content)],
-            [self.lrmError.emit]
+            [self.lrmCalculated.emit],
+            [self.lrmError.emit],
+            decoder=self._decode
         )
 
     def calc_mrm(
@@ -90,8 +90,9 @@ class NIClient(APIBase):
                 "x_limits": x_limits,
                 "y_limits": y_limits
             },
-            [lambda content: self._calculated(self.mrmCalculated, content)],
-            [self.mrmError.emit]
+            [self.mrmCalculated.emit],
+            [self.mrmError.emit],
+            decoder=self._decode
         )
 
     def calc_rrm(
@@ -124,8 +125,9 @@ class NIClient(APIBase):
                 "x_limits": x_limits,
                 "y_limits": y_limits
             },
-            [lambda content: self._calculated(self.rrmCalculated, content)],
-            [self.rrmError.emit]
+            [self.rrmCalculated.emit],
+            [self.rrmError.emit],
+            decoder=self._decode
         )
 
     def calc_sm1(
@@ -158,8 +160,9 @@ class NIClient(APIBase):
                 "x_limits": x_limits,
                 "y_limits": y_limits
             },
-            [lambda content: self._calculated(self.sm1Calculated, content)],
-            [self.sm1Error.emit]
+            [self.sm1Calculated.emit],
+            [self.sm1Error.emit],
+            decoder=self._decode
         )
 
     def calc_sm2(
@@ -192,8 +195,9 @@ class NIClient(APIBase):
                 "x_limits": x_limits,
                 "y_limits": y_limits
             },
-            [lambda content: self._calculated(self.sm2Calculated, content)],
-            [self.sm2Error.emit]
+            [self.sm2Calculated.emit],
+            [self.sm2Error.emit],
+            decoder=self._decode
         )
 
     def calc_tm(
@@ -226,8 +230,9 @@ class NIClient(APIBase):
                 "x_limits": x_limits,
                 "y_limits": y_limits
             },
-            [lambda content: self._calculated(self.tmCalculated, content)],
-            [self.tmError.emit]
+            [self.tmCalculated.emit],
+            [self.tmError.emit],
+            decoder=self._decode
         )
 
     def calc_intermediate(
@@ -251,17 +256,14 @@ class NIClient(APIBase):
                 "b": b,
                 "fx": fx
             },
-            [lambda content: self._calculated_interm(self.intermediateCalculated, content)],
-            [self.intermediateError.emit]
+            [self.intermediateCalculated.emit],
+            [self.intermediateError.emit],
+            decoder=self._decode_interm
         )
 
-    def _calculated_interm(self, signal: pyqtSignal, content: dict[str, Any]):
-        plot_items = dicts_to_dataclasses(
-            content['graphic_items'],
-            [
-                MeshModel
-            ]
-        )
+    @staticmethod
+    def _decode_interm(content: dict[str, Any]) -> tuple[Graphic, float, float, float, float]:
+        plot_items = decode_graphs(content['graphic_items'])
         reference_result = content['reference_result']
         surface_area = content['surface_area']
         volume = content['volume']
@@ -276,18 +278,11 @@ class NIClient(APIBase):
                 shader=item.shader
             )
 
-        signal.emit((graphic, reference_result, surface_area, volume, arc_length))
+        return graphic, reference_result, surface_area, volume, arc_length
 
-    def _calculated(self, signal: pyqtSignal, content: dict[str, Any]):
-        plot_items = dicts_to_dataclasses(
-            content['graphic_items'],
-            [
-                PolygonModel,
-                RectModel,
-                GraphModel,
-                PointModel
-            ]
-        )
+    @staticmethod
+    def _decode(content: dict[str, Any]) -> tuple[Graphic, list[TableRow], float, float, float]:
+        plot_items = decode_graphs(content['graphic_items'])
         table = dicts_to_dataclasses(
             content['table'],
             [
@@ -298,18 +293,7 @@ class NIClient(APIBase):
         abs_delta = content['abs_delta']
         relative_delta = content['relative_delta']
 
-        for item in plot_items:
-            if isinstance(item, GraphModel):
-                if None in item.x_data:
-                    for i, coord in enumerate(item.x_data):
-                        if coord is None:
-                            item.x_data[i] = np.nan
-                if None in item.y_data:
-                    for i, coord in enumerate(item.y_data):
-                        if coord is None:
-                            item.y_data[i] = np.nan
-
         graphic = Graphic()
         graphic.graphs.extend(plot_items)
 
-        signal.emit((graphic, table, result, abs_delta, relative_delta))
+        return graphic, table, result, abs_delta, relative_delta
@@ -0,0 +1,193 @@
+from typing import Any
+
+from PyQt6.QtCore import pyqtSignal, pyqtBoundSignal
+
+from compmath.api.base import APIBase, urljoin
+from compmath.models.graphic import decode_graphs
+from compmath.models.nonlinear.engine import IterationLog
+
+
+class NonLinearClient(APIBase):
+    hdmCalculated = pyqtSignal(object)
+    mcsCalculated = pyqtSignal(object)
+    mcsOneCalculated = pyqtSignal(object)
+    mcsTwoCalculated = pyqtSignal(object)
+    ntmCalculated = pyqtSignal(object)
+    simCalculated = pyqtSignal(object)
+    rootsCalculated = pyqtSignal(object)
+
+    hdmError = pyqtSignal(str)
+    mcsError = pyqtSignal(str)
+    mcsOneError = pyqtSignal(str)
+    mcsTwoError = pyqtSignal(str)
+    ntmError = pyqtSignal(str)
+    simError = pyqtSignal(str)
+    rootsError = pyqtSignal(str)
+
+    def calc_hdm(
+            self,
+            fx: str,
+            interval: tuple[float, float],
+            eps: float,
+            iters_limit: int,
+            x_limits: tuple[float, float],
+            y_limits: tuple[float, float]
+    ) -> None:
+        """
+        Метод половинного деления
+
+        :param fx: функция уравнения f(x) = 0
+        :param interval: отрезок [a, b]
+        :param eps: точность
+        :param iters_limit: ограничение числа итераций
+        :param x_limits: пределы по оси x
+        :param y_limits: пределы по оси y
+        :return: график функции, журнал итераций, корень и число итераций
+        """
+        self._calc("hdm", fx, interval, eps, iters_limit, x_limits, y_limits, self.hdmCalculated, self.hdmError)
+
+    def calc_mcs(
+            self,
+            fx: str,
+            interval: tuple[float, float],
+            eps: float,
+            iters_limit: int,
+            x_limits: tuple[float, float],
+            y_limits: tuple[float, float]
+    ) -> None:
+        """
+        Метод хорд (параметры как у calc_hdm)
+        """
+        self._calc("mcs", fx, interval, eps, iters_limit, x_limits, y_limits, self.mcsCalculated, self.mcsError)
+
+    def calc_mcs_one(
+            self,
+            fx: str,
+            interval: tuple[float, float],
+            eps: float,
+            iters_limit: int,
+            x_limits: tuple[float, float],
+            y_limits: tuple[float, float]
+    ) -> None:
+        """
+        Метод секущих, одношаговый (параметры как у calc_hdm)
+        """
+        self._calc(
+            "mcs_one", fx, interval, eps, iters_limit, x_limits, y_limits, self.mcsOneCalculated, self.mcsOneError
+        )
+
+    def calc_mcs_two(
+            self,
+            fx: str,
+            interval: tuple[float, float],
+            eps: float,
+            iters_limit: int,
+            x_limits: tuple[float, float],
+            y_limits: tuple[float, float]
+    ) -> None:
+        """
+        Метод секущих, двухшаговый (параметры как у calc_hdm)
+        """
+        self._calc(
+            "mcs_two", fx, interval, eps, iters_limit, x_limits, y_limits, self.mcsTwoCalculated, self.mcsTwoError
+        )
+
+    def calc_ntm(
+            self,
+            fx: str,
+            interval: tuple[float, float],
+            eps: float,
+            iters_limit: int,
+            x_limits: tuple[float, float],
+            y_limits: tuple[float, float]
+    ) -> None:
+        """
+        Метод Ньютона (параметры как у calc_hdm)
+        """
+        self._calc("ntm", fx, interval, eps, iters_limit, x_limits, y_limits, self.ntmCalculated, self.ntmError)
+
+    def calc_sim(
+            self,
+            fx: str,
+            interval: tuple[float, float],
+            eps: float,
+            iters_limit: int,
+            x_limits: tuple[float, float],
+            y_limits: tuple[float, float]
+    ) -> None:
+        """
+        Метод простых итераций (параметры как у calc_hdm)
+        """
+        self._calc("sim", fx, interval, eps, iters_limit, x_limits, y_limits, self.simCalculated, self.simError)
+
+    def calc_roots(
+            self,
+            fx: str,
+            interval: tuple[float, float],
+            eps: float,
+            iters_limit: int,
+            x_limits: tuple[float, float],
+            y_limits: tuple[float, float],
+            grid: int = 10000
+    ) -> None:
+        """
+        Поиск всех корней на отрезке: смена знака на сетке и одновременное
+        уточнение всех найденных отрезков
+
+        :param grid: число отрезков сетки поиска
+        :return: график функции с корнями, таблица корней, корни и число итераций уточнения
+        """
+        self.post(
+            urljoin(self._base_url, "/nonlinear/roots/calculate"),
+            {
+                "fx": fx,
+                "interval": interval,
+                "eps": eps,
+                "iters_limit": iters_limit,
+                "x_limits": x_limits,
+                "y_limits": y_limits,
+                "grid": grid
+            },
+            [self.rootsCalculated.emit],
+            [self.rootsError.emit],
+            decoder=lambda content: self._decode(content, "roots")
+        )
+
+    def _calc(
+            self,
+            method: str,
+            fx: str,
+            interval: tuple[float, float],
+            eps: float,
+            iters_limit: int,
+            x_limits: tuple[float, float],
+            y_limits: tuple[float, float],
+            calculated: pyqtBoundSignal,
+            error: pyqtBoundSignal
+    ) -> None:
+        self.post(
+            urljoin(self._base_url, f"/nonlinear/{method}/calculate"),
+            {
+                "fx": fx,
+                "interval": interval,
+                "eps": eps,
+                "iters_limit": iters_limit,
+                "x_limits": x_limits,
+                "y_limits": y_limits
+            },
+            [calculated.emit],
+            [error.emit],
+            decoder=lambda content: self._decode(content, "result")
+        )
+
+    @staticmethod
+    def _decode(
+            content: dict[str, Any],
+            result: str
+    ) -> tuple[list, IterationLog, Any, int]:
+        return (
+            decode_graphs(content['graphic_items']),
+            IterationLog(content['table']),
+            content[result],
+            content['iters']
+        )
@@ -3,13 +3,13 @@ from typing import Any
 import numpy as np
 from PyQt6.QtCore import pyqtSignal
 
-from compmath.api.base import APIBase, urljoin
+from compmath.api.jobs import JobsClient
 from compmath.models.graphic import Graphic, PolygonModel, RectModel, GraphModel, PointModel
 from compmath.models.sne.base import TableRow
 from compmath.utils.data import dicts_to_dataclasses
 
 
-class SLATClient(APIBase):
+class SLATClient(JobsClient):
     simCalculated = pyqtSignal(object)
     zmCalculated = pyqtSignal(object)
     gmCalculated = pyqtSignal(object)
@@ -37,8 +37,8 @@ class SLATClient(APIBase):
         :param a_matrix: матрица A
         :return: список графиков, логов, результатов и названий моделей
         """
-        self.post(
-            urljoin(self._base_url, "/slat/sim/calculate"),
+        self.run_job(
+            "slat/sim",
             {
                 "a_matrix": a_matrix,
                 "b_vector": b_vector,
@@ -46,8 +46,9 @@ class SLATClient(APIBase):
                 "iters_limit": iters_limit,
                 "x0": x0
             },
-            [lambda content: self._calculated(self.simCalculated, content)],
-            [self.simError.emit]
+            [self.simCalculated.emit],
+            [self.simError.emit],
+            decoder=self._decode
         )
 
     def calc_zm(
@@ -69,8 +70,8 @@ class SLATClient(APIBase):
         :param a_matrix: матрица A
         :return: список графиков, логов, результатов и названий моделей
         """
-        self.post(
-            urljoin(self._base_url, "/slat/zm/calculate"),
+        self.run_job(
+            "slat/zm",
             {
                 "a_matrix": a_matrix,
                 "b_vector": b_vector,
@@ -78,8 +79,9 @@ class SLATClient(APIBase):
                 "iters_limit": iters_limit,
                 "x0": x0
             },
-            [lambda content: self._calculated(self.zmCalculated, content)],
-            [self.zmError.emit]
+            [self.zmCalculated.emit],
+            [self.zmError.emit],
+            decoder=self._decode
         )
 
     def calc_gm(
@@ -101,8 +103,8 @@ class SLATClient(APIBase):
         :param a_matrix: матрица A
         :return: список графиков, логов, результатов и названий моделей
         """
-        self.post(
-            urljoin(self._base_url, "/slat/gm/calculate"),
+        self.run_job(
+            "slat/gm",
             {
                 "a_matrix": a_matrix,
                 "b_vector": b_vector,
@@ -110,11 +112,13 @@ class SLATClient(APIBase):
                 "iters_limit": iters_limit,
                 "x0": x0
             },
-            [lambda content: self._calculated(self.gmCalculated, content)],
-            [self.gmError.emit]
+            [self.gmCalculated.emit],
+            [self.gmError.emit],
+            decoder=self._decode
         )
 
-    def _calculated(self, signal: pyqtSignal, content: list[tuple[list[str], list[dict], str]]):
+    @staticmethod
+    def _decode(content: list[tuple[list[str], list[dict], str]]) -> list[tuple[list[str], list[TableRow], str]]:
         results = []
 
         for row in content:
@@ -126,4 +130,4 @@ class SLATClient(APIBase):
             )
             results.append((row[0], table, row[2]))
 
-        signal.emit(results)
+        return results
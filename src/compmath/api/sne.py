@@ -1,10 +1,9 @@
 from typing import Any
 
-import numpy as np
 from PyQt6.QtCore import pyqtSignal
 
 from compmath.api.base import APIBase, urljoin
-from compmath.models.graphic import Graphic, PolygonModel, RectModel, GraphModel, PointModel
+from compmath.models.graphic import Graphic, decode_graphs
 from compmath.models.sne.base import TableRow
 from compmath.utils.data import dicts_to_dataclasses
 
@@ -49,8 +48,9 @@ class SNEClient(APIBase):
                 "x_limits": x_limits,
                 "y_limits": y_limits
             },
-            [lambda content: self._calculated(self.simCalculated, content)],
-            [self.simError.emit]
+            [self.simCalculated.emit],
+            [self.simError.emit],
+            decoder=self._decode
         )
 
     def calc_ntm(
@@ -84,8 +84,9 @@ class SNEClient(APIBase):
                 "x_limits": x_limits,
                 "y_limits": y_limits
             },
-            [lambda content: self._calculated(self.ntmCalculated, content)],
-            [self.ntmError.emit]
+            [self.ntmCalculated.emit],
+            [self.ntmError.emit],
+            decoder=self._decode
         )
 
     def calc_zm(
@@ -119,11 +120,13 @@ class SNEClient(APIBase):
                 "x_limits": x_limits,
                 "y_limits": y_limits
             },
-            [lambda content: self._calculated(self.zmCalculated, content)],
-            [self.zmError.emit]
+            [self.zmCalculated.emit],
+            [self.zmError.emit],
+            decoder=self._decode
         )
 
-    def _calculated(self, signal: pyqtSignal, content: dict[str, Any]):
+    @staticmethod
+    def _decode(content: dict[str, Any]) -> tuple[list[Graphic], list[str], list[TableRow]]:
         graphics = []
 
         graphs = content['graphics']
@@ -136,29 +139,10 @@ class SNEClient(APIBase):
         )
 
         for i, graph in enumerate(graphs):
-            plot_items = dicts_to_dataclasses(
-                graph,
-                [
-                    PolygonModel,
-                    RectModel,
-                    GraphModel,
-                    PointModel
-                ]
-            )
-
-            for item in plot_items:
-                if isinstance(item, GraphModel):
-                    if None in item.x_data:
-                        for i, coord in enumerate(item.x_data):
-                            if coord is None:
-                                item.x_data[i] = np.nan
-                    if None in item.y_data:
-                        for i, coord in enumerate(item.y_data):
-                            if coord is None:
-                                item.y_data[i] = np.nan
+            plot_items = decode_graphs(graph)
 
             graphic = Graphic()
             graphic.graphs.extend(plot_items)
             graphics.append(graphic)
 
-        signal.emit((graphics, solve_log, table))
+        return graphics, solve_log, table
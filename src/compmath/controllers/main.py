@@ -1,23 +1,24 @@
+import importlib
+
+from PyQt6.QtCore import QTimer
+
 from compmath.api.factory import APIFactory
 from compmath.config import InIConfig
+from compmath.models.main import MenuItem, MainModel
+from compmath.utils.startup import startup
 from compmath.views.widgets import WidgetsFactory
 from compmath.views.main import MainView
 
-from compmath.controllers.research import ResearchController
-from compmath.models import ResearchModel, MenuItem, MainModel
-from compmath.controllers.nonlinear import NoNLinearController
-from compmath.models import NoNLinearModel
-from compmath.controllers.slat import SLATController
-from compmath.models import SLATModel
-from compmath.controllers.sne import SNEController
-from compmath.models import SNEModel
-from compmath.controllers.ni import NIController
-from compmath.models import NIModel
-from compmath.controllers.aif import AIFController
-from compmath.models import AIFModel
-
-from compmath.controllers.settings import SettingsController
-from compmath.models.settings import SettingsModel
+# Страница: (модуль контроллера, контроллер, модуль модели, модель).
+# Модули импортируются при первом переходе на страницу
+PAGES: dict[MenuItem, tuple[str, str, str, str]] = {
+    MenuItem.RESEARCH: ("compmath.controllers.research", "ResearchController", "compmath.models.research", "ResearchModel"),
+    MenuItem.NONLINEAR: ("compmath.controllers.nonlinear", "NoNLinearController", "compmath.models.nonlinear", "NoNLinearModel"),
+    MenuItem.SLAT: ("compmath.controllers.slat", "SLATController", "compmath.models.slat", "SLATModel"),
+    MenuItem.SNE: ("compmath.controllers.sne", "SNEController", "compmath.models.sne", "SNEModel"),
+    MenuItem.NI: ("compmath.controllers.ni", "NIController", "compmath.models.ni", "NIModel"),
+    MenuItem.AIF: ("compmath.controllers.aif", "AIFController", "compmath.models.aif", "AIFModel"),
+}
 
 
 class MainController:
@@ -33,41 +34,48 @@ class MainController:
         self.api_factory = api_factory
         self.config = config
         self.widgets_factory = widgets_factory
+        self.pages = {}
         self.view = MainView(self, model, widgets_factory)
 
         self.view.show()
+        startup.mark("main window")
+
+        # Первая страница строится после отрисовки окна
+        QTimer.singleShot(0, self._load)
+
+    def _load(self):
         self.view.model_loaded()
+        startup.mark("first page")
 
     def show_settings(self):
+        from compmath.controllers.settings import SettingsController
+        from compmath.models.settings import SettingsModel
+
         SettingsController(
             SettingsModel(self.config), self.widgets_factory, self.view
         )
 
     def show_page(self, page_id: MenuItem):
-        match page_id:
-            case MenuItem.RESEARCH:
-                ResearchController(
-                    ResearchModel(), self.widgets_factory, self.api_factory, self.view
-                )
-            case MenuItem.NONLINEAR:
-                NoNLinearController(
-                    NoNLinearModel(), self.widgets_factory, self.api_factory, self.view
-                )
-            case MenuItem.SLAT:
-                SLATController(
-                    SLATModel(), self.widgets_factory, self.api_factory, self.view
-                )
-            case MenuItem.SNE:
-                SNEController(
-                    SNEModel(), self.widgets_factory, self.api_factory, self.view
-                )
-            case MenuItem.NI:
-                NIController(
-                    NIModel(), self.widgets_factory, self.api_factory, self.view
-                )
-            case MenuItem.AIF:
-                AIFController(
-                    AIFModel(), self.widgets_factory, self.api_factory, self.view
-                )
-            case _:
-                raise ValueError(f'Unknown page_id: {page_id}')
+        """
+        Переход на страницу
+
+        Контроллер страницы создается при первом переходе и хранится;
+        повторно показывается уже построенное представление.
+
+        :param page_id: пункт меню
+        """
+        try:
+            controller_module, controller_name, model_module, model_name = PAGES[page_id]
+        except KeyError:
+            raise ValueError(f'Unknown page_id: {page_id}')
+
+        controller = self.pages.get(page_id)
+        if controller is not None:
+            self.view.ui.content_layout.setCurrentWidget(controller.view)
+            return
+
+        controller_class = getattr(importlib.import_module(controller_module), controller_name)
+        model_class = getattr(importlib.import_module(model_module), model_name)
+        self.pages[page_id] = controller_class(
+            model_class(), self.widgets_factory, self.api_factory, self.view
+        )
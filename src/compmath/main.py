@@ -1,3 +1,5 @@
+from compmath.utils.startup import startup
+
 import atexit
 import logging
 import os
@@ -18,21 +20,41 @@ from compmath.themes import BASE_THEME
 from compmath.utils.theme import get_themes
 from compmath.views.widgets import WidgetsFactory
 
-import psutil
+startup.mark("imports")
 
 
 def kill_procs(host: str, port: int):
+    """
+    Завершение процессов, слушающих адрес сервера расчетов
+
+    Слушатели порта берутся из таблицы соединений системы; перебор
+    соединений всех процессов - только если таблица недоступна (macOS без прав).
+    """
+    import psutil
+
     ip = socket.gethostbyname(host)
-    for proc in psutil.process_iter(['pid', 'name', 'connections']):
+    try:
+        pids = {
+            conn.pid
+            for conn in psutil.net_connections("inet4")
+            if conn.pid and conn.laddr and conn.laddr.port == port and conn.laddr.ip in (ip, "0.0.0.0")
+        }
+    except psutil.AccessDenied:
+        pids = set()
+        for proc in psutil.process_iter(['pid']):
+            try:
+                conns = proc.connections("inet4")
+            except psutil.Error:
+                continue
+            if any(conn.laddr.port == port and conn.laddr.ip in (ip, "0.0.0.0") for conn in conns):
+                pids.add(proc.pid)
+
+    for pid in pids - {os.getpid()}:
         try:
-            conns = proc.connections("inet4")
-        except psutil.AccessDenied:
+            psutil.Process(pid).kill()
+        except psutil.Error:
             continue
 
-        for conn in conns:
-            if conn.laddr.port == port and conn.laddr.ip == ip:
-                proc.kill()
-
 
 class CompMathApp(QApplication):
     def __init__(self, *args):
@@ -55,6 +77,9 @@ class CompMathApp(QApplication):
             raise FileNotFoundError("Файл конфигурации не найден")
 
         config = InIConfig(config_path)
+        self.config = config
+        if config.VAR.BASE.DEBUG:
+            logging.basicConfig(level=logging.INFO)
 
         # Application settings
         self.setApplicationName(config.VAR.BASE.APP_NAME)
@@ -71,8 +96,35 @@ class CompMathApp(QApplication):
         app_icon.addFile("icons:logo-128.png", QtCore.QSize(128, 128))
         app_icon.addFile("icons:logo-256.png", QtCore.QSize(256, 256))
         self.setWindowIcon(app_icon)
+        startup.mark("application")
+
+        # Theme
+        theme = get_themes()[0].get(config.VAR.BASE.THEME_UUID)
+        if not theme:
+            theme = BASE_THEME
+
+        widgets_factory = WidgetsFactory(theme[0])
+        api_factory = APIFactory(
+            host=config.VAR.CALC_SERVER.HOST,
+            port=config.VAR.CALC_SERVER.PORT,
+            scheme="http",
+            path="/api"
+        )
+        controller = ApplicationController(
+            widgets_factory=widgets_factory,
+            api_factory=api_factory,
+            config=config,
+        )
+        # Сервер расчетов запускается, когда окно уже показано,
+        # и загружается, пока строится первая страница
+        QtCore.QTimer.singleShot(0, self.start_calc_server)
+        controller.main()
+        QtCore.QTimer.singleShot(0, startup.log)
 
-        # CompMath Calc Server
+        self.exec()
+
+    def start_calc_server(self):
+        config = self.config
 
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
             is_port_in_use = s.connect_ex((config.VAR.CALC_SERVER.HOST, config.VAR.CALC_SERVER.PORT)) == 0
@@ -110,27 +162,7 @@ class CompMathApp(QApplication):
                 ]
             )
         atexit.register(subprocess.terminate)
-
-        # Theme
-        theme = get_themes()[0].get(config.VAR.BASE.THEME_UUID)
-        if not theme:
-            theme = BASE_THEME
-
-        widgets_factory = WidgetsFactory(theme[0])
-        api_factory = APIFactory(
-            host=config.VAR.CALC_SERVER.HOST,
-            port=config.VAR.CALC_SERVER.PORT,
-            scheme="http",
-            path="/api"
-        )
-        controller = ApplicationController(
-            widgets_factory=widgets_factory,
-            api_factory=api_factory,
-            config=config,
-        )
-        controller.main()
-
-        self.exec()
+        startup.mark("calc server")
 
 
 if __name__ == '__main__':
@@ -1,8 +1,21 @@
+import importlib
+
 from .main import MainModel, MenuItem
-from .sne import SNEModel
-from .slat import SLATModel
-from .nonlinear import NoNLinearModel
-from .ni import NIModel
-from .research import ResearchModel
-from .aif import AIFModel
-from .settings import SettingsModel
+
+# Модели страниц импортируются при первом обращении: они тянут sympy,
+# а главному окну нужны только MainModel и MenuItem
+_PAGE_MODELS = {
+    "SNEModel": ".sne",
+    "SLATModel": ".slat",
+    "NoNLinearModel": ".nonlinear",
+    "NIModel": ".ni",
+    "ResearchModel": ".research",
+    "AIFModel": ".aif",
+    "SettingsModel": ".settings",
+}
+
+
+def __getattr__(name: str):
+    if name in _PAGE_MODELS:
+        return getattr(importlib.import_module(_PAGE_MODELS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
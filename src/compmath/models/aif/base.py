@@ -64,8 +64,9 @@ class BaseAIFModel(BaseGraphicModel):
 
     def graphic(self) -> Graphic:
         graphic = Graphic(self.x_limits, self.y_limits)
-        for point in self.points:
-            graphic.add_point(point[0], point[1])
+        if self.points:
+            x_data, y_data = zip(*self.points)
+            graphic.add_scatter(x_data, y_data)
         return graphic
 
     @abstractmethod
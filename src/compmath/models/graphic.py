@@ -1,13 +1,17 @@
 from collections import deque
-from dataclasses import dataclass
-from typing import Callable, Sequence, cast
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Any, Callable, Sequence, cast
 
 import numpy as np
 import pyqtgraph as pg
 from PyQt6.QtCore import QRectF, QPointF
-from PyQt6.QtGui import QPicture, QPainter, QPolygonF
+from PyQt6.QtGui import QPicture, QPainter, QPolygonF, QPen, QBrush, QPainterPath
+from PyQt6.QtWidgets import QGraphicsPathItem
 from pyqtgraph import PlotDataItem
-from pyqtgraph.opengl import GLMeshItem, MeshData
+
+# pyqtgraph.opengl (и PyOpenGL) импортируется при первом трехмерном элементе
+if TYPE_CHECKING:
+    from pyqtgraph.opengl import GLMeshItem, MeshData
 
 
 @dataclass
@@ -17,6 +21,14 @@ class PointModel:
     color: str
 
 
+@dataclass
+class ScatterModel:
+    x_data: Sequence[float | int]
+    y_data: Sequence[float | int]
+    color: str
+    total: int
+
+
 @dataclass
 class GraphModel:
     x_data: Sequence[float | int]
@@ -37,6 +49,17 @@ class RectModel:
     fill: str | None
 
 
+@dataclass
+class StripModel:
+    x_edges: Sequence[float | int]
+    heights: Sequence[float | int]
+    base: float | int
+    shape: str
+    color: str
+    width: float | int
+    fill: str | None
+
+
 @dataclass
 class MeshModel:
     vertexes: list[list[float]]
@@ -71,19 +94,33 @@ class RectItem(pg.GraphicsObject):
     def rect(self):
         return self._rect
 
+    def setData(self, rect: QRectF, pen: pg.mkPen = None, brush: pg.mkBrush = None):
+        """
+        Замена прямоугольника без пересоздания элемента
+        """
+        self.prepareGeometryChange()
+        self._rect = rect
+        if pen:
+            self.pen = pen
+        self.brush = brush
+        self._generate_picture()
+        self.update()
+
     def _generate_picture(self):
+        self.picture = QPicture()
         painter = QPainter(self.picture)
         painter.setPen(self.pen)
         if self.brush:
             painter.setBrush(self.brush)
         painter.drawRect(self.rect)
         painter.end()
+        self._bounding_rect = QRectF(self.picture.boundingRect())
 
     def paint(self, painter, option, widget=None):
         painter.drawPicture(0, 0, self.picture)
 
     def boundingRect(self):
-        return QRectF(self.picture.boundingRect())
+        return self._bounding_rect
 
     def getData(self) -> tuple[Sequence[float | int], Sequence[float | int]]:
         return self.rect.x(), self.rect.y()
@@ -104,22 +141,346 @@ class PolygonItem(pg.GraphicsObject):
         self.brush = brush
         self._generate_picture()
 
+    def setData(self, points: QPolygonF, pen=None, brush=None):
+        """
+        Замена многоугольника без пересоздания элемента
+        """
+        self.prepareGeometryChange()
+        self.points = points
+        if pen:
+            self.pen = pen
+        self.brush = brush
+        self._generate_picture()
+        self.update()
+
     def _generate_picture(self):
+        self.picture = QPicture()
         painter = QPainter(self.picture)
         painter.setPen(self.pen)
         if self.brush:
             painter.setBrush(self.brush)
         painter.drawPolygon(self.points)
         painter.end()
+        self._bounding_rect = QRectF(self.picture.boundingRect())
 
     def paint(self, painter, option, widget=None):
         painter.drawPicture(0, 0, self.picture)
 
     def boundingRect(self):
-        return QRectF(self.picture.boundingRect())
+        return self._bounding_rect
 
     def getData(self) -> tuple[Sequence[float | int], Sequence[float | int]]:
-        return self.rect.x(), self.rect.y()
+        return [point.x() for point in self.points], [point.y() for point in self.points]
+
+
+def strip_path(x_edges: Sequence[float], heights: Sequence[float], base: float, shape: str) -> QPainterPath:
+    """
+    Контур ряда прямоугольников или трапеций одним путем
+
+    Каждая фигура - замкнутый подпуть из пяти вершин, вершины строятся массивами numpy.
+    """
+    x_edges = np.asarray(x_edges, dtype=float)
+    heights = np.asarray(heights, dtype=float)
+    left, right = x_edges[:-1], x_edges[1:]
+    if shape == "trapezoid":
+        top_left, top_right = heights[:-1], heights[1:]
+    else:
+        top_left = top_right = heights
+    bottom = np.full(left.shape, base, dtype=float)
+
+    x = np.column_stack((left, right, right, left, left)).ravel()
+    y = np.column_stack((bottom, bottom, top_right, top_left, bottom)).ravel()
+    # Соединены вершины внутри фигуры, последняя вершина фигуры не соединяется со следующей
+    connect = np.ones(x.shape, dtype=bool)
+    connect[4::5] = False
+    return pg.arrayToQPath(x, y, connect=connect)
+
+
+class StripItem(QGraphicsPathItem):
+    """
+    Ряд прямоугольников или трапеций одним элементом (один путь на все фигуры)
+    """
+
+    def __init__(self, path: QPainterPath, pen=None, brush=None):
+        super().__init__(path)
+        self.setData(path, pen, brush)
+
+    def setData(self, path: QPainterPath, pen=None, brush=None):
+        self.setPath(path)
+        self.setPen(pen or pg.mkPen(color='red', width=1))
+        self.setBrush(brush or QBrush())
+
+    def getData(self) -> tuple[Sequence[float | int], Sequence[float | int]]:
+        x, y = [], []
+        for i in range(self.path().elementCount()):
+            element = self.path().elementAt(i)
+            x.append(element.x)
+            y.append(element.y)
+        return x, y
+
+
+GraphLike = GraphModel | PointModel | ScatterModel | RectModel | PolygonModel | StripModel | MeshModel
+
+
+def same_graph(first: GraphLike, second: GraphLike) -> bool:
+    """
+    Совпадают ли элементы графика (тип, стиль и данные)
+    """
+    if first is second:
+        return True
+    if type(first) is not type(second):
+        return False
+    if isinstance(first, (PointModel, RectModel)):
+        return first == second
+    for field in fields(first):
+        a, b = getattr(first, field.name), getattr(second, field.name)
+        if isinstance(a, (str, int, float, type(None))) and isinstance(b, (str, int, float, type(None))):
+            if a != b:
+                return False
+        elif not _same_data(a, b):
+            return False
+    return True
+
+
+def _same_data(a: Any, b: Any) -> bool:
+    # Разрывы кривых хранятся как NaN: одинаковые NaN считаются равными
+    try:
+        return np.array_equal(np.asarray(a, dtype=float), np.asarray(b, dtype=float), equal_nan=True)
+    except (TypeError, ValueError):
+        return np.array_equal(np.asarray(a, dtype=object), np.asarray(b, dtype=object))
+
+
+def _pen(graph: GraphModel | RectModel | PolygonModel | StripModel) -> QPen:
+    return pg.mkPen(color=graph.color, width=graph.width)
+
+
+def _brush(graph: GraphModel | RectModel | PolygonModel | StripModel) -> QBrush | None:
+    return pg.mkBrush(graph.fill) if graph.fill else None
+
+
+def _rect(graph: RectModel) -> QRectF:
+    return QRectF(graph.x1, graph.y1, graph.x2 - graph.x1, graph.y2 - graph.y1)
+
+
+def _polygon(graph: PolygonModel) -> QPolygonF:
+    return QPolygonF([point if isinstance(point, QPointF) else QPointF(*point) for point in graph.points])
+
+
+def _strip_path(graph: StripModel) -> QPainterPath:
+    return strip_path(graph.x_edges, graph.heights, graph.base, graph.shape)
+
+
+def _mesh_data(graph: MeshModel) -> "MeshData":
+    from pyqtgraph.opengl import MeshData
+
+    return MeshData(vertexes=np.array(graph.vertexes), faces=np.array(graph.faces))
+
+
+def _curve_data(graph: GraphModel | PointModel | ScatterModel) -> tuple[Sequence, Sequence, dict]:
+    """
+    Данные и параметры PlotDataItem для кривой, точки или множества точек
+    """
+    if isinstance(graph, GraphModel):
+        return graph.x_data, graph.y_data, dict(
+            pen=_pen(graph),
+            symbol=None,
+            fillLevel=0 if graph.fill else None,
+            fillBrush=_brush(graph)
+        )
+    if isinstance(graph, PointModel):
+        x_data, y_data = [graph.x], [graph.y]
+    else:
+        x_data, y_data = graph.x_data, graph.y_data
+    return x_data, y_data, dict(
+        pen=None,
+        symbol='o',
+        symbolBrush=graph.color,
+        fillLevel=None,
+        fillBrush=None
+    )
+
+
+def plot_item_type(graph: GraphLike) -> type:
+    """
+    Класс элемента pyqtgraph, которым отображается элемент графика
+    """
+    if isinstance(graph, (GraphModel, PointModel, ScatterModel)):
+        return PlotDataItem
+    if isinstance(graph, RectModel):
+        return RectItem
+    if isinstance(graph, PolygonModel):
+        return PolygonItem
+    if isinstance(graph, StripModel):
+        return StripItem
+    if isinstance(graph, MeshModel):
+        from pyqtgraph.opengl import GLMeshItem
+        return GLMeshItem
+    raise ValueError(f"Неизвестный тип графика {type(graph)}")
+
+
+def make_plot_item(graph: GraphLike) -> "PlotDataItem | RectItem | PolygonItem | StripItem | GLMeshItem":
+    """
+    Новый элемент pyqtgraph для элемента графика
+    """
+    if isinstance(graph, (GraphModel, PointModel, ScatterModel)):
+        x_data, y_data, options = _curve_data(graph)
+        plot_item = PlotDataItem(x_data, y_data, **options)
+    elif isinstance(graph, RectModel):
+        plot_item = RectItem(_rect(graph), pen=_pen(graph), brush=_brush(graph))
+    elif isinstance(graph, PolygonModel):
+        plot_item = PolygonItem(_polygon(graph), pen=_pen(graph), brush=_brush(graph))
+    elif isinstance(graph, StripModel):
+        plot_item = StripItem(_strip_path(graph), pen=_pen(graph), brush=_brush(graph))
+    elif isinstance(graph, MeshModel):
+        from pyqtgraph.opengl import GLMeshItem
+
+        plot_item = GLMeshItem(meshdata=_mesh_data(graph), shader=graph.shader)
+    else:
+        raise ValueError(f"Неизвестный тип графика {type(graph)}")
+    plot_item.graph = graph
+    return plot_item
+
+
+def update_plot_item(
+        plot_item: "PlotDataItem | RectItem | PolygonItem | StripItem | GLMeshItem",
+        graph: GraphLike
+) -> bool:
+    """
+    Обновление существующего элемента pyqtgraph под элемент графика
+
+    Если элемент уже показывает такие же данные, он не перерисовывается.
+
+    :return: False, если тип элемента не подходит и нужен новый (make_plot_item)
+    """
+    current = getattr(plot_item, "graph", None)
+    if current is not None and same_graph(current, graph):
+        plot_item.graph = graph
+        return True
+
+    if isinstance(plot_item, PlotDataItem) and isinstance(graph, (GraphModel, PointModel, ScatterModel)):
+        x_data, y_data, options = _curve_data(graph)
+        plot_item.setData(x_data, y_data, **options)
+    elif isinstance(plot_item, RectItem) and isinstance(graph, RectModel):
+        plot_item.setData(_rect(graph), pen=_pen(graph), brush=_brush(graph))
+    elif isinstance(plot_item, PolygonItem) and isinstance(graph, PolygonModel):
+        plot_item.setData(_polygon(graph), pen=_pen(graph), brush=_brush(graph))
+    elif isinstance(plot_item, StripItem) and isinstance(graph, StripModel):
+        plot_item.setData(_strip_path(graph), pen=_pen(graph), brush=_brush(graph))
+    elif isinstance(graph, MeshModel) and isinstance(plot_item, plot_item_type(graph)):
+        plot_item.setMeshData(meshdata=_mesh_data(graph))
+        plot_item.setShader(graph.shader)
+    else:
+        return False
+    plot_item.graph = graph
+    return True
+
+
+def _floats(values: Sequence[float | None]) -> np.ndarray:
+    # null (None) становится NaN при создании массива, без обхода в Python
+    return np.array(values, dtype=float)
+
+
+def _decode_point(item: dict[str, Any]) -> PointModel:
+    return PointModel(x=item["x"], y=item["y"], color=item["color"])
+
+
+def _decode_scatter(item: dict[str, Any]) -> ScatterModel:
+    return ScatterModel(
+        x_data=_floats(item["x_data"]),
+        y_data=_floats(item["y_data"]),
+        color=item["color"],
+        total=item["total"]
+    )
+
+
+def _decode_graph(item: dict[str, Any]) -> GraphModel:
+    return GraphModel(
+        x_data=_floats(item["x_data"]),
+        y_data=_floats(item["y_data"]),
+        color=item["color"],
+        width=item["width"],
+        fill=item["fill"]
+    )
+
+
+def _decode_rect(item: dict[str, Any]) -> RectModel:
+    return RectModel(
+        x1=item["x1"],
+        y1=item["y1"],
+        x2=item["x2"],
+        y2=item["y2"],
+        color=item["color"],
+        width=item["width"],
+        fill=item["fill"]
+    )
+
+
+def _decode_polygon(item: dict[str, Any]) -> PolygonModel:
+    return PolygonModel(
+        points=[tuple(point) for point in item["points"]],
+        color=item["color"],
+        width=item["width"],
+        fill=item["fill"]
+    )
+
+
+def _decode_strip(item: dict[str, Any]) -> StripModel:
+    return StripModel(
+        x_edges=_floats(item["x_edges"]),
+        heights=_floats(item["heights"]),
+        base=item["base"],
+        shape=item["shape"],
+        color=item["color"],
+        width=item["width"],
+        fill=item["fill"]
+    )
+
+
+def _decode_mesh(item: dict[str, Any]) -> MeshModel:
+    return MeshModel(vertexes=item["vertexes"], faces=item["faces"], shader=item["shader"])
+
+
+DECODERS: dict[str, Callable[[dict[str, Any]], GraphLike]] = {
+    "point": _decode_point,
+    "scatter": _decode_scatter,
+    "graph": _decode_graph,
+    "rect": _decode_rect,
+    "polygon": _decode_polygon,
+    "strip": _decode_strip,
+    "mesh": _decode_mesh,
+}
+
+# Ответы без поля kind (старый сервер): тип определяется по набору полей
+_KINDS_BY_FIELDS = {
+    frozenset(field.name for field in fields(model)): kind
+    for kind, model in (
+        ("point", PointModel),
+        ("scatter", ScatterModel),
+        ("graph", GraphModel),
+        ("rect", RectModel),
+        ("polygon", PolygonModel),
+        ("strip", StripModel),
+        ("mesh", MeshModel),
+    )
+}
+
+
+def decode_graph(item: dict[str, Any]) -> GraphLike:
+    """
+    Элемент графика из ответа сервера
+
+    Модель выбирается по полю kind; данные кривых сразу становятся массивами
+    numpy, null - NaN.
+    """
+    kind = item.get("kind") or _KINDS_BY_FIELDS.get(frozenset(item))
+    decoder = DECODERS.get(kind)
+    if decoder is None:
+        raise ValueError(f"Неизвестный тип элемента графика {kind or sorted(item)}")
+    return decoder(item)
+
+
+def decode_graphs(items: list[dict[str, Any]]) -> list[GraphLike]:
+    return [decode_graph(item) for item in items]
 
 
 class Graphic:
@@ -196,65 +557,23 @@ class Graphic:
     ) -> None:
         self.graphs.append(PointModel(x=x, y=y, color=color))
 
+    def add_scatter(
+            self,
+            x_data: Sequence[float | int],
+            y_data: Sequence[float | int],
+            color: str = 'red'
+    ) -> None:
+        self.graphs.append(
+            ScatterModel(
+                x_data=np.asarray(x_data, dtype=float),
+                y_data=np.asarray(y_data, dtype=float),
+                color=color,
+                total=len(x_data)
+            )
+        )
+
     def plot_items(self) -> list[PlotDataItem]:
-        plot_items = []
-        for graph in self.graphs:
-            if isinstance(graph, GraphModel):
-                plot_item = PlotDataItem(
-                    graph.x_data,
-                    graph.y_data,
-                    pen=pg.mkPen(
-                        color=graph.color,
-                        width=graph.width
-                    ),
-                    fillLevel=0 if graph.fill else None,
-                    fillBrush=pg.mkBrush(graph.fill) if graph.fill else None
-                )
-            elif isinstance(graph, PointModel):
-                plot_item = PlotDataItem(
-                    [graph.x],
-                    [graph.y],
-                    pen=None,
-                    symbol='o',
-                    symbolBrush=graph.color
-                )
-            elif isinstance(graph, RectModel):
-                plot_item = RectItem(
-                    QRectF(
-                        graph.x1,
-                        graph.y1,
-                        graph.x2 - graph.x1,
-                        graph.y2 - graph.y1
-                    ),
-                    pen=pg.mkPen(
-                        color=graph.color,
-                        width=graph.width
-                    ),
-                    brush=pg.mkBrush(graph.fill) if graph.fill else None
-                )
-            elif isinstance(graph, PolygonModel):
-                plot_item = PolygonItem(
-                    QPolygonF([
-                        QPointF(*point) for point in graph.points
-                    ]),
-                    pen=pg.mkPen(
-                        color=graph.color,
-                        width=graph.width
-                    ),
-                    brush=pg.mkBrush(graph.fill) if graph.fill else None
-                )
-            elif isinstance(graph, MeshModel):
-                plot_item = GLMeshItem(
-                    meshdata=MeshData(
-                        vertexes=np.array(graph.vertexes),
-                        faces=np.array(graph.faces),
-                    ),
-                    shader=graph.shader
-                )
-            else:
-                raise ValueError(f"Неизвестный тип графика {type(graph)}")
-            plot_items.append(plot_item)
-        return plot_items
+        return [make_plot_item(graph) for graph in self.graphs]
 
     def show(self):
         """
@@ -307,6 +626,48 @@ class Graphic:
             )
         )
 
+    def add_rect_strip(
+            self,
+            x_edges: Sequence[float | int],
+            heights: Sequence[float | int],
+            base: int | float = 0,
+            color: str = 'blue',
+            width: int | float = 1,
+            fill: str | None = None
+    ) -> None:
+        self.graphs.append(
+            StripModel(
+                x_edges=np.asarray(x_edges, dtype=float),
+                heights=np.asarray(heights, dtype=float),
+                base=base,
+                shape="rect",
+                color=color,
+                width=width,
+                fill=fill
+            )
+        )
+
+    def add_trapezoid_strip(
+            self,
+            x_edges: Sequence[float | int],
+            heights: Sequence[float | int],
+            base: int | float = 0,
+            color: str = 'blue',
+            width: int | float = 1,
+            fill: str | None = None
+    ) -> None:
+        self.graphs.append(
+            StripModel(
+                x_edges=np.asarray(x_edges, dtype=float),
+                heights=np.asarray(heights, dtype=float),
+                base=base,
+                shape="trapezoid",
+                color=color,
+                width=width,
+                fill=fill
+            )
+        )
+
     def add_mesh(
             self,
             vertexes: list[list[float]],
@@ -1,8 +1,8 @@
 from enum import Enum
-
-import psutil
+from functools import cached_property
 
 from compmath.models.base import BaseModel
+from compmath.utils.monitor import ResourceMonitor, ResourceSample
 
 
 class MenuItem(str, Enum):
@@ -24,10 +24,15 @@ class MainModel(BaseModel):
         self.contact = scope["contact"]
         self.scope = scope
 
-    @staticmethod
-    def process_info() -> tuple[int, int, float, float]:
-        ram_mb = int(psutil.Process().memory_info().rss / (1024 * 1024))
-        ram_total_mb = int(psutil.virtual_memory().total / (1024 * 1024))
-        ram_percent = psutil.Process().memory_percent("rss")
-        cpu_percent = psutil.Process().cpu_percent(interval=1)
-        return ram_mb, ram_total_mb, ram_percent, cpu_percent
+    @cached_property
+    def monitor(self) -> ResourceMonitor:
+        """
+        Монитор ресурсов (создается при первом замере, в режиме отладки)
+        """
+        return ResourceMonitor()
+
+    def process_info(self) -> ResourceSample:
+        """
+        Замер ресурсов клиента и сервера расчетов (не блокирует)
+        """
+        return self.monitor.sample()
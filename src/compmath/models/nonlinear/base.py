@@ -1,27 +1,24 @@
 from abc import abstractmethod
-from dataclasses import dataclass
+from typing import Any, Callable, Sequence
 
+from compmath.api.nonlinear import NonLinearClient
 from compmath.models.base import BaseGraphicModel
-from compmath.models.graphic import Graphic
+from compmath.models.graphic import Graphic, GraphModel, PointModel
+from compmath.models.nonlinear.engine import IterationLog, LazyFrames, sample_graph, segment
 from compmath.utils.func import make_callable, FunctionValidateError
 
 
-@dataclass
-class TableRow:
-    iter_num: int
-    x: float
-    fx: float
-    a: float | None
-    fa: float | None
-    b: float | None
-    fb: float | None
-    distance: float | None
-
-
 class BaseNoNLinearModel(BaseGraphicModel):
+    """
+    Метод решения нелинейного уравнения
+
+    Итерации считаются на сервере; кадры графика строятся по журналу
+    итераций при переходе к ним слайдером.
+    """
 
-    def __init__(self):
+    def __init__(self, api_client: NonLinearClient):
         super().__init__()
+        self.api_client = api_client
         self._title = "None"
         self._description = "None"
         self._fx = "None"
@@ -30,7 +27,8 @@ class BaseNoNLinearModel(BaseGraphicModel):
         self._iters_limit = 100
         self.result = None
         self.iters = None
-        self.table: list[TableRow] = []
+        self.table = IterationLog()
+        self.graphics: Sequence[Graphic] = []
 
     @property
     def title(self) -> str:
@@ -60,24 +58,59 @@ class BaseNoNLinearModel(BaseGraphicModel):
             return
 
         self._fx = fx
-        self.graphics.clear()
-        graphic = Graphic(x_limits=self._x_limits, y_limits=self._y_limits)
-        graphic.add_graph(func)
-        self.graphics.append(graphic)
+        self.graphics = [self._frame(self._curve(func))]
         self.notify_observers()
 
     def reset_graphic(self):
-        self.graphics.clear()
-        graphic = Graphic(x_limits=self._x_limits, y_limits=self._y_limits)
-
         try:
             func = make_callable(self.fx)
         except FunctionValidateError:
             func = None
 
-        if func:
-            graphic.add_graph(func)
-            self.graphics.append(graphic)
+        self.graphics = [self._frame(self._curve(func))] if func else []
+        self.notify_observers()
+
+    def _curve(self, function: Callable[[float], float]) -> GraphModel:
+        """
+        График f(x) на пределах осей до расчета (после расчета график приходит с сервера)
+        """
+        return sample_graph(function, self.x_limits, self.y_limits)
+
+    def _frame(self, curve: GraphModel | Sequence, *graphs) -> Graphic:
+        """
+        Кадр итерации: график функции и элементы итерации
+        """
+        graphic = Graphic(x_limits=self.x_limits, y_limits=self.y_limits)
+        if isinstance(curve, GraphModel):
+            graphic.graphs.append(curve)
+        else:
+            graphic.graphs.extend(curve)
+        graphic.graphs.extend(graphs)
+        return graphic
+
+    def _calc_request(self, request: Callable[..., None]) -> None:
+        """
+        Отправка расчета методом клиента API
+        """
+        request(self.fx, self.interval, self.eps, self.iters_limit, self.x_limits, self.y_limits)
+
+    def _iteration_items(self, log: IterationLog, index: int) -> tuple:
+        """
+        Элементы кадра итерации: хорда [a, b], приближение x и концы отрезка
+        """
+        return (
+            segment(log.value("a", index), log.value("fa", index), log.value("b", index), log.value("fb", index)),
+            PointModel(x=log.value("x", index), y=log.value("fx", index), color="red"),
+            PointModel(x=log.value("a", index), y=log.value("fa", index), color="yellow"),
+            PointModel(x=log.value("b", index), y=log.value("fb", index), color="yellow")
+        )
+
+    def process_values(self, content: tuple[list, IterationLog, Any, int]) -> None:
+        curve, log, result, iters = content
+        self.table = log
+        self.result = result
+        self.iters = iters
+        self.graphics = LazyFrames(len(log), lambda i: self._frame(curve, *self._iteration_items(log, i)))
         self.notify_observers()
 
     @property
@@ -0,0 +1,138 @@
+from collections import OrderedDict
+from typing import Callable, Sequence
+
+import numpy as np
+
+from compmath.models.graphic import Graphic, GraphModel
+
+
+def sample(function: Callable[[float], float], x_data: np.ndarray) -> np.ndarray:
+    """
+    Значения функции на сетке одним векторным вызовом
+
+    Функции, которые не векторизуются (или константы), вычисляются поточечно.
+
+    :param function: функция f(x)
+    :param x_data: узлы сетки
+    """
+    try:
+        with np.errstate(all="ignore"):
+            y_data = np.asarray(function(x_data), dtype=float)
+    except (TypeError, ValueError):
+        y_data = None
+
+    if y_data is None or y_data.shape != x_data.shape:
+        with np.errstate(all="ignore"):
+            y_data = np.array([float(function(x)) for x in x_data])
+    return y_data
+
+
+def sample_graph(
+        function: Callable[[float], float],
+        x_limits: tuple[float | int, float | int],
+        y_limits: tuple[float | int, float | int],
+        step: float | int = 0.1,
+        color: str = 'blue'
+) -> GraphModel:
+    """
+    График функции на пределах осей (как Graphic.add_graph, но одним вызовом функции)
+
+    Значения вне пределов по Y заменяются на NaN.
+    """
+    x_limits = tuple(sorted(x_limits))
+    y_limits = tuple(sorted(y_limits))
+    x_data = np.arange(x_limits[0], x_limits[1], step)
+    if len(x_data) != 0 and x_data[-1] != x_limits[1]:
+        x_data = np.append(x_data, x_limits[1])
+    y_data = sample(function, x_data)
+    y_data[(y_data < y_limits[0]) | (y_data > y_limits[1])] = np.nan
+    return GraphModel(x_data=x_data, y_data=y_data, color=color, width=1, fill=False)
+
+
+def segment(x1: float, y1: float, x2: float, y2: float, color: str = 'blue') -> GraphModel:
+    """
+    Отрезок прямой (хорда, касательная) по двум точкам
+    """
+    return GraphModel(x_data=np.array([x1, x2]), y_data=np.array([y1, y2]), color=color, width=1, fill=False)
+
+
+class IterationLog:
+    """
+    Журнал итераций из таблицы ответа сервера
+
+    Поля хранятся столбцами numpy, которые таблица читает напрямую.
+    Отсутствующие значения (например, b в методе простых итераций) хранятся как NaN.
+    """
+
+    FIELDS = ("iter_num", "x", "fx", "a", "fa", "b", "fb", "distance")
+
+    def __init__(self, rows: list[dict[str, float | None]] | None = None):
+        """
+        :param rows: строки таблицы ответа (null - отсутствующее значение)
+        """
+        if rows:
+            self._data = np.array([[row.get(field) for field in self.FIELDS] for row in rows], dtype=float).T
+        else:
+            self._data = np.empty((len(self.FIELDS), 0))
+
+    def __len__(self) -> int:
+        return self._data.shape[1]
+
+    def value(self, field: str, index: int) -> float:
+        return float(self._data[self.FIELDS.index(field), index])
+
+    def column(self, field: str) -> np.ndarray:
+        """
+        Значения поля по итерациям (только чтение)
+
+        :param field: одно из FIELDS
+        """
+        values = self._data[self.FIELDS.index(field)]
+        if field == "iter_num":
+            return values.astype(int)
+        values = values.view()
+        values.flags.writeable = False
+        return values
+
+    def columns(self, *fields: str) -> list[np.ndarray]:
+        return [self.column(field) for field in fields]
+
+
+class LazyFrames(Sequence[Graphic]):
+    """
+    Кадры графика итераций, которые строятся при первом обращении
+
+    Слайдер показывает только посещенные позиции, поэтому кадр собирается
+    по журналу итераций лишь когда он нужен; несколько последних кадров
+    хранятся в кэше.
+    """
+
+    def __init__(self, size: int, builder: Callable[[int], Graphic], cache_size: int = 16):
+        """
+        :param size: число кадров
+        :param builder: построение кадра по номеру итерации (с 0)
+        :param cache_size: число хранимых построенных кадров
+        """
+        self._size = size
+        self._builder = builder
+        self._cache: OrderedDict[int, Graphic] = OrderedDict()
+        self._cache_size = cache_size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> Graphic:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(index)
+        try:
+            self._cache.move_to_end(index)
+            return self._cache[index]
+        except KeyError:
+            pass
+        frame = self._builder(index)
+        self._cache[index] = frame
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return frame
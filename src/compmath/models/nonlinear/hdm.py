@@ -1,6 +1,7 @@
-from compmath.models.nonlinear.base import BaseNoNLinearModel, TableRow
-from compmath.models.graphic import Graphic
-from compmath.utils.func import make_callable
+from compmath.api.nonlinear import NonLinearClient
+from compmath.models.graphic import PointModel
+from compmath.models.nonlinear.base import BaseNoNLinearModel
+from compmath.models.nonlinear.engine import IterationLog
 
 
 class HDModel(BaseNoNLinearModel):
@@ -9,8 +10,11 @@ class HDModel(BaseNoNLinearModel):
 
     """
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, api_client: NonLinearClient):
+        super().__init__(api_client)
+        self.api_client.hdmCalculated.connect(self.process_values)
+        self.api_client.hdmError.connect(self.validation_error)
+
         self._title = "Метод половинного деления"
         self._description = """
             <p>
@@ -26,49 +30,15 @@ class HDModel(BaseNoNLinearModel):
 
     def calc(self) -> None:
         """
-        Рассчитать
+        Метод половинного деления
 
         :return:
         """
-        self.graphics.clear()
-        self.table.clear()
-
-        function = make_callable(self.fx)
-        a, b = self.interval
-
-        if function(a) * function(b) > 0:
-            self.validation_error("Корни f(a) и f(b) одного знака")
-            return
-
-        n = 0
-        while abs(a - b) > self.eps and n < self.iters_limit:
-            n += 1
-            x = (a + b) / 2
-
-            graphic = Graphic(x_limits=self.x_limits, y_limits=self.y_limits)
-            graphic.add_graph(function)
-            graphic.add_point(a, function(a), color='yellow')
-            graphic.add_point(b, function(b), color='yellow')
-            graphic.add_point(x, function(x), color='red')
-
-            table_row = TableRow(
-                iter_num=n,
-                a=a,
-                b=b,
-                x=x,
-                fx=function(x),
-                fa=function(a),
-                fb=function(b),
-                distance=abs(a - b)
-            )
-            self.graphics.append(graphic)
-            self.table.append(table_row)
-
-            if function(a) * function(x) < 0:
-                b = x
-            else:
-                a = x
-
-        self.result = (a + b) / 2
-        self.iters = n
-        self.notify_observers()
+        self._calc_request(self.api_client.calc_hdm)
+
+    def _iteration_items(self, log: IterationLog, index: int) -> tuple:
+        return (
+            PointModel(x=log.value("a", index), y=log.value("fa", index), color='yellow'),
+            PointModel(x=log.value("b", index), y=log.value("fb", index), color='yellow'),
+            PointModel(x=log.value("x", index), y=log.value("fx", index), color='red')
+        )
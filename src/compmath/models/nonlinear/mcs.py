@@ -1,12 +1,14 @@
-from compmath.models.nonlinear.base import BaseNoNLinearModel, TableRow
-from compmath.models.graphic import Graphic
-from compmath.utils.func import make_callable, line_between_points
+from compmath.api.nonlinear import NonLinearClient
+from compmath.models.nonlinear.base import BaseNoNLinearModel
 
 
 class MCSModel(BaseNoNLinearModel):
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, api_client: NonLinearClient):
+        super().__init__(api_client)
+        self.api_client.mcsCalculated.connect(self.process_values)
+        self.api_client.mcsError.connect(self.validation_error)
+
         self._title = "Метод хорд"
         self._description = """
             <p>
@@ -22,58 +24,9 @@ class MCSModel(BaseNoNLinearModel):
 
     def calc(self) -> None:
         """
-        Метод хорд и секущих
+        Метод хорд
 
         :return:
         """
-        self.graphics.clear()
-        self.table.clear()
-
-        function = make_callable(self.fx)
-        a, b = self.interval
-
-        if function(a) * function(b) > 0:
-            self.validation_error("На данном интервале нет корней")
-            return
-
-        n = 0
-        x = None
-        while abs(a - b) > self.eps and n < self.iters_limit:
-            n += 1
-            x = a - (function(a) * (b - a)) / (function(b) - function(a))
-
-            graphic = Graphic(x_limits=self.x_limits, y_limits=self.y_limits)
-            graphic.add_graph(function)
-            graphic.add_graph(line_between_points(a, function(a), b, function(b)), x_limits=(a, b))
-            graphic.add_point(x, function(x), color="red")
-            graphic.add_point(a, function(a), color="yellow")
-            graphic.add_point(b, function(b), color="yellow")
-            self.graphics.append(graphic)
-
-            self.table.append(
-                TableRow(
-                    iter_num=n,
-                    x=x,
-                    fx=function(x),
-                    a=a,
-                    fa=function(a),
-                    b=b,
-                    fb=function(b),
-                    distance=abs(a - b)
-                )
-            )
-
-            if function(x) == 0:
-                break
-
-            if function(a) * function(x) < 0:
-                b = x
-            else:
-                a = x
-
-            if abs(function(x)) < self.eps:
-                break
+        self._calc_request(self.api_client.calc_mcs)
 
-        self.result = x
-        self.iters = n
-        self.notify_observers()
@@ -1,11 +1,16 @@
-from compmath.models.nonlinear.base import BaseNoNLinearModel, TableRow
-from compmath.models.graphic import Graphic
-from compmath.utils.func import make_callable, derivative, tangent
+from compmath.api.nonlinear import NonLinearClient
+from compmath.models.graphic import GraphModel, PointModel
+from compmath.models.nonlinear.base import BaseNoNLinearModel
+from compmath.models.nonlinear.engine import IterationLog, segment
+from compmath.utils.func import Derivatives, differentiate
 
 
 class NTModel(BaseNoNLinearModel):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, api_client: NonLinearClient):
+        super().__init__(api_client)
+        self.api_client.ntmCalculated.connect(self.process_values)
+        self.api_client.ntmError.connect(self.validation_error)
+
         self._title = "Метод Ньютона (касательных)"
         self._description = """
             <p>
@@ -18,6 +23,7 @@ class NTModel(BaseNoNLinearModel):
         self._fx = "0.5**x + 1 - (x-2)**2"
         self._interval = (0, 1)
         self._eps = 0.0001
+        self._derivatives: Derivatives | None = None
 
     def calc(self) -> None:
         """
@@ -25,51 +31,23 @@ class NTModel(BaseNoNLinearModel):
 
         :return:
         """
-        self.graphics.clear()
-        self.table.clear()
-
-        function = make_callable(self.fx)
-        a, b = self.interval
-
-        if function(a) * function(b) > 0:
-            self.validation_error("На данном интервале нет корней")
-            return
-
-        if function(a) * derivative(derivative(function))(a) > 0:
-            x = a
-        else:
-            x = b
-
-        n = 0
-        while True:
-            h = - function(x) / derivative(function)(x)
-            x += h
-            n += 1
-
-            graphic = Graphic(x_limits=self.x_limits, y_limits=self.y_limits)
-            graphic.add_graph(function)
-            graphic.add_graph(tangent(function, x))
-            graphic.add_point(x, function(x))
-            graphic.add_point(a, function(a), color="yellow")
-            graphic.add_point(b, function(b), color="yellow")
-            self.graphics.append(graphic)
-
-            self.table.append(
-                TableRow(
-                    iter_num=n,
-                    x=x,
-                    fx=function(x),
-                    a=a,
-                    fa=function(a),
-                    b=b,
-                    fb=function(b),
-                    distance=abs(a - b)
-                )
-            )
-
-            if abs(h) <= self.eps or n >= self.iters_limit:
-                break
-
-        self.result = x
-        self.iters = n
-        self.notify_observers()
+        # Касательные кадров строятся на клиенте по производной той же функции,
+        # значения f(x) берутся из таблицы итераций сервера
+        self._derivatives = differentiate(self.fx)
+        self._calc_request(self.api_client.calc_ntm)
+
+    def _iteration_items(self, log: IterationLog, index: int) -> tuple:
+        return (
+            self._tangent(log.value("x", index), log.value("fx", index)),
+            PointModel(x=log.value("x", index), y=log.value("fx", index), color="red"),
+            PointModel(x=log.value("a", index), y=log.value("fa", index), color="yellow"),
+            PointModel(x=log.value("b", index), y=log.value("fb", index), color="yellow")
+        )
+
+    def _tangent(self, x0: float, y0: float) -> GraphModel:
+        """
+        Касательная в точке (x0, f(x0)) на пределах оси X (прямая - достаточно двух точек)
+        """
+        slope = float(self._derivatives.df(x0))
+        x1, x2 = self.x_limits
+        return segment(x1, y0 + slope * (x1 - x0), x2, y0 + slope * (x2 - x0))
@@ -0,0 +1,47 @@
+from typing import Any
+
+from compmath.api.nonlinear import NonLinearClient
+from compmath.models.nonlinear.base import BaseNoNLinearModel
+from compmath.models.nonlinear.engine import IterationLog
+
+
+class RootsModel(BaseNoNLinearModel):
+    """
+    Поиск всех корней на отрезке
+
+    """
+
+    def __init__(self, api_client: NonLinearClient):
+        super().__init__(api_client)
+        self.api_client.rootsCalculated.connect(self.process_values)
+        self.api_client.rootsError.connect(self.validation_error)
+
+        self._title = "Поиск всех корней"
+        self._description = """
+            <p>
+            Функция вычисляется на мелкой равномерной сетке отрезка <i>[a, b]</i>. Каждый отрезок сетки, 
+            на концах которого <i>f(x)</i> меняет знак, содержит корень; все такие отрезки уточняются 
+            методом половинного деления одновременно. Корни, в которых функция касается оси, не меняя знака, 
+            находятся только в узлах сетки.
+            </p>
+        """
+        self._fx = "sin(x) * x - 1"
+        self._interval = (-10, 10)
+        self._eps = 0.0001
+
+    def calc(self) -> None:
+        """
+        Поиск всех корней
+
+        :return:
+        """
+        self._calc_request(self.api_client.calc_roots)
+
+    def process_values(self, content: tuple[list, IterationLog, Any, int]) -> None:
+        # Один кадр: график функции и все найденные корни; таблица - по корню в строке
+        graphs, log, roots, iters = content
+        self.table = log
+        self.result = [round(root, 10) for root in roots]
+        self.iters = iters
+        self.graphics = [self._frame(graphs)]
+        self.notify_observers()
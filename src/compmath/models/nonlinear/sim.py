@@ -1,13 +1,15 @@
-from sympy import symbols
-
-from compmath.models.graphic import Graphic
-from compmath.models.nonlinear.base import BaseNoNLinearModel, TableRow
-from compmath.utils.func import make_callable
+from compmath.api.nonlinear import NonLinearClient
+from compmath.models.graphic import PointModel
+from compmath.models.nonlinear.base import BaseNoNLinearModel
+from compmath.models.nonlinear.engine import IterationLog
 
 
 class SIModel(BaseNoNLinearModel):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, api_client: NonLinearClient):
+        super().__init__(api_client)
+        self.api_client.simCalculated.connect(self.process_values)
+        self.api_client.simError.connect(self.validation_error)
+
         self._title = "Метод простых итераций"
         self._description = """
             <p>
@@ -27,55 +29,7 @@ class SIModel(BaseNoNLinearModel):
 
         :return:
         """
-        self.graphics.clear()
-        self.table.clear()
-
-        function = make_callable(self.fx)
-
-        x = symbols('x')
-
-        # Определение функции f(x)
-        # f_x = 0.5 ** x + 1 - (x - 2) ** 2
-        #
-        # phi_x = solve(f_x, x)
-        # phi = lambdify(x, phi_x[0])
-        phi = function
-
-        a, b = self.interval
-
-        # Проверка сходимости
-        if function(a) * function(b) > 0:
-            self.validation_error("Метод не сходится")
-            return
-
-        n = 0
-        x = a
-        while True:
-            x0 = x
-            x = phi(x0)
-            n += 1
-
-            graphic = Graphic(x_limits=self.x_limits, y_limits=self.y_limits)
-            graphic.add_graph(function)
-            graphic.add_point(x0, x, color="red")
-            self.graphics.append(graphic)
-
-            self.table.append(
-                TableRow(
-                    iter_num=n,
-                    x=x0,
-                    fx=x,
-                    distance=abs(x - x0),
-                    a=x0,
-                    b=None,
-                    fa=function(a),
-                    fb=None,
-                )
-            )
-
-            if abs(x - x0) <= self.eps or n >= self.iters_limit:
-                break
+        self._calc_request(self.api_client.calc_sim)
 
-        self.result = x
-        self.iters = n
-        self.notify_observers()
+    def _iteration_items(self, log: IterationLog, index: int) -> tuple:
+        return PointModel(x=log.value("x", index), y=log.value("fx", index), color="red"),
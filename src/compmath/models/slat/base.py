@@ -1,5 +1,6 @@
 from abc import abstractmethod
 from dataclasses import dataclass
+from typing import Any
 
 from compmath.models.base import BaseModel
 
@@ -27,6 +28,11 @@ class BaseSLATModel(BaseModel):
         self._iters_limit = 100
         self.results: list[tuple[list[str], list[TableRow], str]] = []
 
+        # Фоновая задача расчета на сервере
+        self.running = False
+        self.job_id: str | None = None
+        self.progress: dict[str, Any] | None = None
+
     @property
     def title(self) -> str:
         return self._title
@@ -111,6 +117,56 @@ class BaseSLATModel(BaseModel):
     def calc(self) -> None:
         ...
 
+    def _bind_jobs(self, api_client) -> None:
+        """
+        Подписка на события фоновой задачи клиента API
+        """
+        api_client.jobStarted.connect(self.job_started)
+        api_client.jobProgress.connect(self.job_progress)
+        api_client.jobCancelled.connect(self.job_cancelled)
+
+    def start_calc(self) -> None:
+        self.running = True
+        self.job_id = None
+        self.progress = None
+        self.notify_observers()
+        self.calc()
+
+    def cancel(self) -> None:
+        if self.job_id is not None:
+            self._api_client.cancel_job(self.job_id)
+
+    def job_started(self, job_id: str) -> None:
+        self.job_id = job_id
+        self.notify_observers()
+
+    def job_progress(self, job_id: str, event: dict[str, Any]) -> None:
+        if job_id != self.job_id:
+            return
+        self.progress = event
+        self.notify_observers()
+
+    def _job_finished(self) -> None:
+        self.running = False
+        self.job_id = None
+        self.progress = None
+
+    def job_cancelled(self, job_id: str) -> None:
+        if job_id != self.job_id:
+            return
+        self._job_finished()
+        self.notify_observers()
+
+    def job_failed(self, error: str) -> None:
+        self._job_finished()
+        self.notify_observers()
+        self.validation_error(error)
+
+    def process_values(self, content: list[tuple[list[str], list[TableRow], str]]):
+        self._job_finished()
+        self.results = content
+        self.notify_observers()
+
     def validation_error(self, error):
         for observer in self._mObservers:
             observer.validation_error(error)
@@ -1,5 +1,5 @@
 from compmath.api.slat import SLATClient
-from compmath.models.slat.base import BaseSLATModel, TableRow
+from compmath.models.slat.base import BaseSLATModel
 
 
 class GModel(BaseSLATModel):
@@ -9,7 +9,8 @@ class GModel(BaseSLATModel):
 
         self._api_client = api_client
         self._api_client.gmCalculated.connect(self.process_values)
-        self._api_client.gmError.connect(self.validation_error)
+        self._api_client.gmError.connect(self.job_failed)
+        self._bind_jobs(self._api_client)
 
         self._title = "Метод Гаусса"
         self._description = "Метод Гаусса - метод решения системы линейных уравнений..."
@@ -21,7 +22,3 @@ class GModel(BaseSLATModel):
             self.eps,
             self.iters_limit
         )
-
-    def process_values(self, content: list[tuple[list[str], list[TableRow], str]]):
-        self.results = content
-        self.notify_observers()
@@ -1,5 +1,5 @@
 from compmath.api.slat import SLATClient
-from compmath.models.slat.base import BaseSLATModel, TableRow
+from compmath.models.slat.base import BaseSLATModel
 
 
 class SIModel(BaseSLATModel):
@@ -8,7 +8,8 @@ class SIModel(BaseSLATModel):
         super().__init__()
         self._api_client = api_client
         self._api_client.simCalculated.connect(self.process_values)
-        self._api_client.simError.connect(self.validation_error)
+        self._api_client.simError.connect(self.job_failed)
+        self._bind_jobs(self._api_client)
 
         self._title = "Метод простых итераций"
         self._description = ""
@@ -27,7 +28,3 @@ class SIModel(BaseSLATModel):
             self.iters_limit,
             self.x0
         )
-
-    def process_values(self, content: list[tuple[list[str], list[TableRow], str]]):
-        self.results = content
-        self.notify_observers()
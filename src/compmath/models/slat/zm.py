@@ -1,5 +1,5 @@
 from compmath.api.slat import SLATClient
-from compmath.models.slat.base import BaseSLATModel, TableRow
+from compmath.models.slat.base import BaseSLATModel
 
 
 class ZModel(BaseSLATModel):
@@ -9,7 +9,8 @@ class ZModel(BaseSLATModel):
 
         self._api_client = api_client
         self._api_client.zmCalculated.connect(self.process_values)
-        self._api_client.zmError.connect(self.validation_error)
+        self._api_client.zmError.connect(self.job_failed)
+        self._bind_jobs(self._api_client)
 
         self._title = "Метод Зейделя"
         self._description = "Метод Зейделя - модификация метода простых итераций"
@@ -28,7 +29,3 @@ class ZModel(BaseSLATModel):
             self.iters_limit,
             self.x0
         )
-
-    def process_values(self, content: list[tuple[list[str], list[TableRow], str]]):
-        self.results = content
-        self.notify_observers()
@@ -1,6 +1,8 @@
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Callable, Protocol
 
-from sympy import sympify, lambdify, SympifyError, Basic, solve
+from sympy import sympify, lambdify, SympifyError, Basic, solve, diff, Derivative, DiracDelta, S
 from sympy.core import Symbol
 
 
@@ -113,19 +115,94 @@ def derivative(fx: Callable[[float | int], float], h: float = 0.0001) -> Callabl
     return lambda x: (fx(x + h) - fx(x)) / h
 
 
-def tangent(fx: Callable[[float | int], float], x0: float | int) -> Callable[[float | int], float]:
+def central_derivative(
+        fx: Callable[[float | int], float],
+        order: int = 1,
+        h: float = 0.001
+) -> Callable[[float | int], float]:
+    """
+    Производная по пятиточечной центральной разности (погрешность O(h^4))
+
+    :param fx: функция
+    :param order: порядок производной (1 или 2)
+    :param h: шаг
+    :return: производная функции fx
+    """
+    if order == 1:
+        return lambda x: (-fx(x + 2 * h) + 8 * fx(x + h) - 8 * fx(x - h) + fx(x - 2 * h)) / (12 * h)
+    if order == 2:
+        return lambda x: (
+            -fx(x + 2 * h) + 16 * fx(x + h) - 30 * fx(x) + 16 * fx(x - h) - fx(x - 2 * h)
+        ) / (12 * h * h)
+    raise ValueError(f"Неподдерживаемый порядок производной: {order}")
+
+
+@dataclass(frozen=True)
+class Derivatives:
+    """
+    Функция f(x) и ее первая и вторая производные
+
+    symbolic - производные получены sympy; иначе - центральные разности
+    """
+    f: FuncReturn
+    df: Callable[[float | int], float]
+    d2f: Callable[[float | int], float]
+    symbolic: bool
+
+
+@lru_cache(maxsize=64)
+def differentiate(func: str) -> Derivatives:
+    """
+    Функция и ее производные по x, построенные один раз на выражение
+
+    Производные берутся символьно по вещественному x и компилируются вместе
+    с функцией; если символьной производной нет, используются центральные
+    разности (так же, как на сервере расчетов).
+
+    :param func: строка с функцией
+    :return: функция и производные
+    """
+    try:
+        expr = sympify(func)
+    except (SympifyError, TypeError):
+        raise FunctionValidateError(f"Invalid literal: {func}")
+
+    f = make_callable(expr)
+    x, real_x = Symbol("x"), Symbol("x", real=True)
+    try:
+        df_expr = diff(expr.subs(x, real_x), real_x)
+        d2f_expr = diff(df_expr, real_x)
+        if df_expr.has(Derivative) or d2f_expr.has(Derivative):
+            raise ValueError(f"Нет символьной производной: {func}")
+        df_expr, d2f_expr = (
+            derived.replace(DiracDelta, lambda *args: S.Zero).subs(real_x, x)
+            for derived in (df_expr, d2f_expr)
+        )
+        return Derivatives(f, make_callable(df_expr), make_callable(d2f_expr), True)
+    except (ValueError, TypeError, AttributeError, NameError, FunctionValidateError):
+        return Derivatives(f, central_derivative(f), central_derivative(f, order=2), False)
+
+
+def tangent(
+        fx: Callable[[float | int], float],
+        x0: float | int,
+        dfx: Callable[[float | int], float] | None = None
+) -> Callable[[float | int], float]:
     """
     Уравнение касательной
 
     y = f(x0) + f'(x0)(x-x0)
 
+    f(x0) и f'(x0) вычисляются один раз, а не в каждой точке графика.
 
     :param fx: функция графика
     :param x0: точка касания
+    :param dfx: производная (по умолчанию - центральная разность)
     :return: уравнение касательной
     """
-
-    return lambda x: fx(x0) + derivative(fx)(x0) * (x - x0)
+    y0 = fx(x0)
+    slope = (dfx or central_derivative(fx))(x0)
+    return lambda x: y0 + slope * (x - x0)
 
 
 def line_between_points(
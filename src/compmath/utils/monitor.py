@@ -0,0 +1,163 @@
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+# psutil нужен только монитору, который создается в режиме отладки
+if TYPE_CHECKING:
+    import psutil
+
+MB = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ResourceSample:
+    """
+    Замер ресурсов: клиент (GUI) и сервер расчетов (все его процессы)
+
+    cpu - проценты одного ядра (у нескольких процессов сумма может быть больше 100),
+    rss - мегабайты
+    """
+    time: float
+    client_cpu: float
+    client_rss: float
+    server_cpu: float
+    server_rss: float
+    server_processes: int
+
+    @property
+    def cpu(self) -> float:
+        return self.client_cpu + self.server_cpu
+
+    @property
+    def rss(self) -> float:
+        return self.client_rss + self.server_rss
+
+
+class RingBuffer:
+    """
+    Кольцевой буфер замеров фиксированной длины
+
+    Столбцы хранятся в массивах numpy, новый замер затирает самый старый.
+    """
+
+    FIELDS = ("time", "client_cpu", "client_rss", "server_cpu", "server_rss", "server_processes")
+
+    def __init__(self, capacity: int):
+        """
+        :param capacity: число хранимых замеров
+        """
+        self.capacity = capacity
+        self._data = np.zeros((len(self.FIELDS), capacity))
+        self._start = 0
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, sample: ResourceSample) -> None:
+        with self._lock:
+            index = (self._start + self._size) % self.capacity
+            self._data[:, index] = [getattr(sample, field) for field in self.FIELDS]
+            if self._size < self.capacity:
+                self._size += 1
+            else:
+                self._start = (self._start + 1) % self.capacity
+
+    def column(self, field: str) -> np.ndarray:
+        """
+        Значения поля от старых замеров к новым (копия)
+
+        :param field: одно из FIELDS
+        """
+        row = self.FIELDS.index(field)
+        with self._lock:
+            indices = (self._start + np.arange(self._size)) % self.capacity
+            return self._data[row, indices]
+
+
+class ResourceMonitor:
+    """
+    Мониторинг ресурсов клиента и процессов сервера расчетов
+
+    Загрузка CPU считается между соседними вызовами sample()
+    (psutil cpu_percent(interval=None)), поэтому замер не ждет и может
+    выполняться в любом потоке. Сервер расчетов - дочерние процессы клиента
+    (gunicorn/uvicorn, его воркеры и пулы расчетов); список обновляется при
+    каждом замере.
+    """
+
+    def __init__(self, capacity: int = 150, pid: int | None = None):
+        """
+        :param capacity: длина истории замеров
+        :param pid: процесс клиента (по умолчанию текущий)
+        """
+        import psutil
+
+        self.history = RingBuffer(capacity)
+        self._client = psutil.Process(pid or os.getpid())
+        self._server: dict[int, "psutil.Process"] = {}
+        self._client.cpu_percent(None)
+
+    def _server_processes(self) -> list["psutil.Process"]:
+        import psutil
+
+        try:
+            children = self._client.children(recursive=True)
+        except psutil.Error:
+            children = []
+
+        processes = {}
+        for child in children:
+            # Объект процесса сохраняется между замерами: cpu_percent считает от прошлого вызова
+            process = self._server.get(child.pid, child)
+            if process is child:
+                try:
+                    child.cpu_percent(None)
+                except psutil.Error:
+                    continue
+            processes[child.pid] = process
+        self._server = processes
+        return list(processes.values())
+
+    def sample(self) -> ResourceSample:
+        """
+        Новый замер (добавляется в history)
+        """
+        import psutil
+
+        with self._client.oneshot():
+            client_cpu = self._client.cpu_percent(None)
+            client_rss = self._client.memory_info().rss / MB
+
+        server_cpu = server_rss = 0.0
+        server_processes = 0
+        for process in self._server_processes():
+            try:
+                with process.oneshot():
+                    server_cpu += process.cpu_percent(None)
+                    server_rss += process.memory_info().rss / MB
+                server_processes += 1
+            except psutil.Error:
+                continue
+
+        sample = ResourceSample(
+            time=time.monotonic(),
+            client_cpu=client_cpu,
+            client_rss=client_rss,
+            server_cpu=server_cpu,
+            server_rss=server_rss,
+            server_processes=server_processes
+        )
+        self.history.append(sample)
+        return sample
+
+    @staticmethod
+    def total_memory() -> float:
+        import psutil
+
+        return psutil.virtual_memory().total / MB
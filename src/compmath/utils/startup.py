@@ -0,0 +1,48 @@
+import logging
+import time
+
+
+class StartupTimer:
+    """
+    Замер этапов запуска приложения
+
+    Каждый этап длится от предыдущей отметки до своей; первая отметка
+    отсчитывается от создания таймера (импорт compmath.main).
+    """
+
+    def __init__(self):
+        self._started = time.perf_counter()
+        self._last = self._started
+        self.stages: list[tuple[str, float]] = []
+
+    def mark(self, stage: str) -> float:
+        """
+        Завершение этапа
+
+        :param stage: название этапа
+        :return: длительность этапа в секундах
+        """
+        now = time.perf_counter()
+        duration = now - self._last
+        self._last = now
+        self.stages.append((stage, duration))
+        return duration
+
+    @property
+    def total(self) -> float:
+        return self._last - self._started
+
+    def report(self) -> str:
+        """
+        Таблица этапов запуска (мс)
+        """
+        width = max((len(stage) for stage, _ in self.stages), default=0)
+        lines = [f"{stage:<{width}}  {duration * 1000:8.1f} ms" for stage, duration in self.stages]
+        lines.append(f"{'total':<{width}}  {self.total * 1000:8.1f} ms")
+        return "\n".join(lines)
+
+    def log(self) -> None:
+        logging.info("Startup time breakdown:\n%s", self.report())
+
+
+startup = StartupTimer()
@@ -145,9 +145,7 @@ class AItemView(QWidget):
             self.result_button.setDisabled(False)
 
         if self.model.graphics:
-            self.graphic.clear_plots()
-            for plot in self.model.graphics:
-                self.graphic.add_plot(plot.plot_items())
+            self.graphic.set_plots(self.model.graphics)
 
         self.input_table.setRowCount(len(self.model.points))
         self.input_table.blockSignals(True)
@@ -166,7 +164,7 @@ class AItemView(QWidget):
 
         if self.model.points:
             self.graphic.clear_plots()
-            self.graphic.add_plot(self.model.graphic().plot_items())
+            self.graphic.add_plot(self.model.graphic())
 
     def model_loaded(self):
         self.header.blockSignals(True)
@@ -327,7 +325,7 @@ class AItemView(QWidget):
 
             graphic_widget = self.widgets_factory.graphic()
             graphic_widget.setFixedSize(QSize(300, 300))
-            graphic_widget.add_plot(graphic.plot_items())
+            graphic_widget.add_plot(graphic)
             graphic_widget.graphic_slider.setEnabled(False)
             content_layout.addWidget(graphic_widget)
 
@@ -112,7 +112,7 @@ class InterItemView(AItemView):
 
             graphic_widget = self.widgets_factory.graphic()
             graphic_widget.setFixedSize(QSize(300, 300))
-            graphic_widget.add_plot(graphic.plot_items())
+            graphic_widget.add_plot(graphic)
             graphic_widget.graphic_slider.setEnabled(False)
             content_layout.addWidget(graphic_widget)
 
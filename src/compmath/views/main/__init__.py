@@ -1,9 +1,9 @@
 from PyQt6 import QtWidgets, QtCore, sip
-from PyQt6.QtCore import QModelIndex
+from PyQt6.QtCore import QModelIndex, pyqtSignal
 from PyQt6.QtWidgets import QWidget
-from apscheduler.schedulers.qt import QtScheduler
 
 from compmath.models.main import MainModel
+from compmath.utils.monitor import ResourceSample
 from compmath.utils.observer import DObserver
 from compmath.utils.ts_meta import TSMeta
 from compmath.views.main.static_ui import UiMainWindow
@@ -11,6 +11,9 @@ from compmath.views.widgets import WidgetsFactory
 
 
 class MainView(QWidget, DObserver, metaclass=TSMeta):
+    # Замер ресурсов делается в потоке планировщика, отрисовка - в потоке GUI
+    processStatsSampled = pyqtSignal(ResourceSample)
+    PROCESS_STATS_INTERVAL = 2
 
     def __init__(
             self,
@@ -32,7 +35,8 @@ class MainView(QWidget, DObserver, metaclass=TSMeta):
             app_name=self.model.app_title
         )
 
-        self.scheduler = QtScheduler()
+        # Планировщик замеров нужен только в режиме отладки (см. model_loaded)
+        self.scheduler = None
 
         # Регистрация представлений
         self.model.add_observer(self)
@@ -42,23 +46,29 @@ class MainView(QWidget, DObserver, metaclass=TSMeta):
         self.ui.menu_settings_button.clicked.connect(self.menu_settings_button_clicked)
         self.ui.settings_item.triggered.connect(self.controller.show_settings)
         self.ui.about_item.triggered.connect(self.about_dialog)
+        self.processStatsSampled.connect(self.show_process_stats)
 
     def model_changed(self):
         pass
 
     def process_stats_tick(self):
-        info = self.model.process_info()
-        ram_mb = info[0]
-        ram_total_mb = info[1]
-        ram_percent = info[2]
-        cpu_percent = info[3]
-
+        sample = self.model.process_info()
         if self and not sip.isdeleted(self):
-            self.ui.memory_usage_label.setText(f"ОЗУ: {ram_mb} МБ")
-            self.ui.memory_usage_label.setToolTip(
-                f"RAM {ram_percent:.2f}% [{ram_mb}/{ram_total_mb}] МБ\n"
-                f"CPU {cpu_percent:.2f}%"
-            )
+            self.processStatsSampled.emit(sample)
+
+    def show_process_stats(self, sample: ResourceSample):
+        ram_total_mb = self.model.monitor.total_memory()
+        ram_percent = sample.rss / ram_total_mb * 100
+        self.ui.memory_usage_label.setText(f"ОЗУ: {sample.rss:.0f} МБ")
+        self.ui.memory_usage_label.setToolTip(
+            f"RAM {ram_percent:.2f}% [{sample.rss:.0f}/{ram_total_mb:.0f}] МБ\n"
+            f"Клиент: CPU {sample.client_cpu:.1f}%, {sample.client_rss:.0f} МБ\n"
+            f"Сервер ({sample.server_processes} проц.): CPU {sample.server_cpu:.1f}%, {sample.server_rss:.0f} МБ"
+        )
+        self.ui.resource_chart.set_history(
+            self.model.monitor.history,
+            self.model.monitor.history.capacity * self.PROCESS_STATS_INTERVAL
+        )
 
     def model_loaded(self):
         for i in range(self.ui.menu_list_widget.model().rowCount()):
@@ -66,7 +76,11 @@ class MainView(QWidget, DObserver, metaclass=TSMeta):
             item.set_icon_color(self.widgets_factory.theme.text_tertiary)
         self.ui.menu_list_widget.setCurrentIndex(self.ui.menu_list_widget.model().index(0, 0))
         if self.model.is_debug:
-            self.scheduler.add_job(self.process_stats_tick, 'interval', seconds=2)
+            from apscheduler.schedulers.qt import QtScheduler
+
+            self.ui.resource_chart.setVisible(True)
+            self.scheduler = QtScheduler()
+            self.scheduler.add_job(self.process_stats_tick, 'interval', seconds=self.PROCESS_STATS_INTERVAL)
             self.scheduler.start()
 
     def menu_select_changed(self, current: QModelIndex, prev: QModelIndex):
@@ -150,7 +164,8 @@ class MainView(QWidget, DObserver, metaclass=TSMeta):
         self.ui.context_menu.exec(self.ui.menu_settings_button.mapToGlobal(point))
 
     def closeEvent(self, event):
-        self.scheduler.pause()
+        if self.scheduler is not None:
+            self.scheduler.pause()
         event.accept()
 
     def error_handler(self, error):
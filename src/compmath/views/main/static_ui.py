@@ -183,6 +183,12 @@ class UiMainWindow:
         """)
         self.memory_usage_label = memory_usage_label
 
+        # График ресурсов (виден в режиме отладки)
+        resource_chart = widgets_factory.resource_chart()
+        resource_chart.setObjectName("resource_chart")
+        resource_chart.setVisible(False)
+        self.resource_chart = resource_chart
+
         # Context menu
         context_menu = QMenu(main_window)
         context_menu.setObjectName("context_menu")
@@ -246,6 +252,10 @@ class UiMainWindow:
         menu_tool_layout.addItem(
             QSpacerItem(0, 0, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         )
+        menu_tool_layout.addWidget(resource_chart)
+        menu_tool_layout.addItem(
+            QSpacerItem(5, 0, QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        )
         menu_tool_layout.addWidget(memory_usage_label)
         menu_tool_layout.addItem(
             QSpacerItem(10, 0, QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
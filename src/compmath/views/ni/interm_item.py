@@ -166,8 +166,7 @@ class NItermView(QWidget):
             self.arc_length_input.setCursorPosition(0)
 
         if self.model.graphics:
-            items = self.model.graphics[-1].plot_items()
-            self.graphic.set_element(items)
+            self.graphic.set_graphs(self.model.graphics[-1].graphs)
 
     def model_loaded(self):
         self.header.blockSignals(True)
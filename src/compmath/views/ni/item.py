@@ -5,12 +5,12 @@ from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QFormLayout,
-    QHBoxLayout,
-    QTableWidgetItem
+    QHBoxLayout
 )
 
 from compmath.models.ni.base import BaseNIModel
 from compmath.views.widgets import WidgetsFactory
+from compmath.views.widgets.table import row_columns
 
 
 class NItemView(QWidget):
@@ -201,9 +201,7 @@ class NItemView(QWidget):
             self.table_button.setDisabled(False)
 
         if self.model.graphics:
-            self.graphic.clear_plots()
-            for plot in self.model.graphics:
-                self.graphic.add_plot(plot.plot_items())
+            self.graphic.set_plots(self.model.graphics)
 
     def model_loaded(self):
         self.header.blockSignals(True)
@@ -300,16 +298,9 @@ class NItemView(QWidget):
         modal.setFixedWidth(800)
         modal.setFixedHeight(450)
         modal.layout().setContentsMargins(5, 0, 5, 5)
-        table = self.widgets_factory.table()
+        table = self.widgets_factory.data_table()
         table.setFixedHeight(400)
-        table.setRowCount(len(self.model.table))
-        table.setColumnCount(4)
-        table.add_style(""" QTableWidget { border: none; } """)
-        table.setHorizontalHeaderLabels(["№", "x", "y", "Интеграл"])
-        for i, row in enumerate(self.model.table):
-            table.setItem(i, 0, QTableWidgetItem(str(row.num)))
-            table.setItem(i, 1, QTableWidgetItem(str(row.x)))
-            table.setItem(i, 2, QTableWidgetItem(str(row.y)))
-            table.setItem(i, 3, QTableWidgetItem(str(row.value)))
+        table.add_style(""" QTableView { border: none; } """)
+        table.set_columns(["№", "x", "y", "Интеграл"], row_columns(self.model.table, "num", "x", "y", "value"))
         modal.layout().addWidget(table)
         modal.exec()
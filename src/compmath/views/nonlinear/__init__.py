@@ -2,12 +2,14 @@ from typing import TypeVar
 
 from PyQt6.QtWidgets import QWidget
 
+from compmath.api.factory import APIFactory
 from compmath.models import MenuItem
 from compmath.models.nonlinear.hdm import HDModel
 from compmath.models.nonlinear.mcs import MCSModel
 from compmath.models.nonlinear.mcs_one import MCSOneModel
 from compmath.models.nonlinear.mcs_two import MCSTwoModel
 from compmath.models.nonlinear.ntm import NTModel
+from compmath.models.nonlinear.roots import RootsModel
 from compmath.models.nonlinear.sim import SIModel
 from compmath.utils.observer import DObserver
 from compmath.utils.ts_meta import TSMeta
@@ -20,12 +22,13 @@ ViewWidget = TypeVar('ViewWidget', bound=QWidget)
 class NoNLinearView(QWidget, DObserver, metaclass=TSMeta):
     id: MenuItem
 
-    def __init__(self, controller, model, widgets_factory, parent: ViewWidget):
+    def __init__(self, controller, model, widgets_factory, api_factory: APIFactory, parent: ViewWidget):
         super().__init__(parent)
         self.id = model.id
         self.controller = controller
         self.model = model
         self.widgets_factory = widgets_factory
+        self.api_factory = api_factory
 
         parent.ui.content_layout.addWidget(self)
         parent.ui.content_layout.setCurrentWidget(self)
@@ -42,29 +45,33 @@ class NoNLinearView(QWidget, DObserver, metaclass=TSMeta):
         ...
 
     def model_loaded(self):
-        hdm = NoNLinearItemView(HDModel(), self.widgets_factory, self)
+        hdm = NoNLinearItemView(HDModel(self.api_factory.create_nonlinear()), self.widgets_factory, self)
         self.ui.central_layout.addWidget(hdm)
 
-        mcs = NoNLinearItemView(MCSModel(), self.widgets_factory, self)
+        mcs = NoNLinearItemView(MCSModel(self.api_factory.create_nonlinear()), self.widgets_factory, self)
         self.ui.central_layout.addWidget(mcs)
 
-        mcs_one = NoNLinearItemView(MCSOneModel(), self.widgets_factory, self)
+        mcs_one = NoNLinearItemView(MCSOneModel(self.api_factory.create_nonlinear()), self.widgets_factory, self)
         self.ui.central_layout.addWidget(mcs_one)
 
-        mcs_two = NoNLinearItemView(MCSTwoModel(), self.widgets_factory, self)
+        mcs_two = NoNLinearItemView(MCSTwoModel(self.api_factory.create_nonlinear()), self.widgets_factory, self)
         self.ui.central_layout.addWidget(mcs_two)
 
-        ntm = NoNLinearItemView(NTModel(), self.widgets_factory, self)
+        ntm = NoNLinearItemView(NTModel(self.api_factory.create_nonlinear()), self.widgets_factory, self)
         self.ui.central_layout.addWidget(ntm)
 
-        sim = NoNLinearItemView(SIModel(), self.widgets_factory, self)
+        sim = NoNLinearItemView(SIModel(self.api_factory.create_nonlinear()), self.widgets_factory, self)
         self.ui.central_layout.addWidget(sim)
 
+        roots = NoNLinearItemView(RootsModel(self.api_factory.create_nonlinear()), self.widgets_factory, self)
+        self.ui.central_layout.addWidget(roots)
+
         hdm.model_loaded()
         mcs.model_loaded()
         mcs_one.model_loaded()
         mcs_two.model_loaded()
         ntm.model_loaded()
         sim.model_loaded()
+        roots.model_loaded()
 
         self.model_changed()
@@ -1,3 +1,5 @@
+import math
+
 from PyQt6.QtCore import Qt, QLocale
 from PyQt6.QtGui import QDoubleValidator, QIntValidator
 from PyQt6.QtWidgets import (
@@ -5,13 +7,20 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
     QFormLayout,
     QHBoxLayout,
-    QTableWidgetItem, QHeaderView
+    QHeaderView
 )
 
 from compmath.models.nonlinear.base import BaseNoNLinearModel
 from compmath.views.widgets import WidgetsFactory
 
 
+def optional(value: float) -> str:
+    """
+    Значение ячейки таблицы итераций; отсутствующее (NaN) отображается как None
+    """
+    return "None" if math.isnan(value) else str(value)
+
+
 class NoNLinearItemView(QWidget):
     def __init__(
             self,
@@ -181,9 +190,7 @@ class NoNLinearItemView(QWidget):
             self.table_button.setDisabled(False)
 
         if self.model.graphics:
-            self.graphic.clear_plots()
-            for plot in self.model.graphics:
-                self.graphic.add_plot(plot.plot_items())
+            self.graphic.set_plots(self.model.graphics)
 
     def model_loaded(self):
         self.header.blockSignals(True)
@@ -273,35 +280,28 @@ class NoNLinearItemView(QWidget):
         modal.setFixedWidth(800)
         modal.setFixedHeight(450)
         modal.layout().setContentsMargins(5, 0, 5, 5)
-        table = self.widgets_factory.table()
+        table = self.widgets_factory.data_table()
         table.setFixedHeight(400)
-        table.setRowCount(len(self.model.table))
-        table.setColumnCount(8)
         table.add_style("""
-            QTableWidget {
+            QTableView {
                 border: none;
             }
             """)
-        table.setHorizontalHeaderLabels([
-            "№",
-            "a",
-            "b",
-            "x",
-            "f(x)",
-            "f(a)",
-            "f(b)",
-            "|a - b|"
-        ])
+        table.set_columns(
+            [
+                "№",
+                "a",
+                "b",
+                "x",
+                "f(x)",
+                "f(a)",
+                "f(b)",
+                "|a - b|"
+            ],
+            self.model.table.columns("iter_num", "a", "b", "x", "fx", "fa", "fb", "distance"),
+            [None] + [optional] * 7,
+            [Qt.AlignmentFlag.AlignCenter] + [None] * 7
+        )
         table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        for i, row in enumerate(self.model.table):
-            table.setItem(i, 0, QTableWidgetItem(str(row.iter_num)))
-            table.setItem(i, 1, QTableWidgetItem(str(row.a)))
-            table.setItem(i, 2, QTableWidgetItem(str(row.b)))
-            table.setItem(i, 3, QTableWidgetItem(str(row.x)))
-            table.setItem(i, 4, QTableWidgetItem(str(row.fx)))
-            table.setItem(i, 5, QTableWidgetItem(str(row.fa)))
-            table.setItem(i, 6, QTableWidgetItem(str(row.fb)))
-            table.setItem(i, 7, QTableWidgetItem(str(row.distance)))
-            table.item(i, 0).setTextAlignment(Qt.AlignmentFlag.AlignCenter)
         modal.layout().addWidget(table)
         modal.exec()
@@ -4,12 +4,22 @@ from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
-    QTableWidgetItem,
     QHeaderView, QScrollArea
 )
 
 from compmath.models.slat.base import BaseSLATModel
 from compmath.views.widgets import WidgetsFactory
+from compmath.views.widgets.table import row_columns
+
+
+def fixed(value: float) -> str:
+    """
+    Число в записи с фиксированной точкой без лишних нулей
+    """
+    text = format(value, ".17f")
+    if '.' in text:
+        text = text.rstrip('0').rstrip('.')
+    return text
 
 
 class SLATItemView(QWidget):
@@ -139,11 +149,17 @@ class SLATItemView(QWidget):
         right.addWidget(result_button)
         self.result_button = result_button
 
+        progress_label = widgets_factory.label()
+        progress_label.setWordWrap(True)
+        progress_label.setMaximumWidth(200)
+        right.addWidget(progress_label)
+        self.progress_label = progress_label
+
         # События
         size_input.valueChanged.connect(self.size_changed)
         eps_input.textChanged.connect(self.eps_changed)
         result_button.clicked.connect(self.show_result)
-        calc_button.clicked.connect(self.model.calc)
+        calc_button.clicked.connect(self.calc_clicked)
         matrix.itemChanged.connect(self.item_changed)
         x0.itemChanged.connect(self.item_x0_changed)
         iters_limit_input.textChanged.connect(self.iters_limit_changed)
@@ -163,6 +179,20 @@ class SLATItemView(QWidget):
         if self.model.results:
             self.result_button.setDisabled(False)
 
+        running = self.model.running
+        self.calc_button.setText("Отменить" if running else "Рассчитать")
+        self.calc_button.setDisabled(running and self.model.job_id is None)
+        for widget in (self.matrix, self.x0, self.size_input, self.eps_input, self.iters_limit_input):
+            widget.setDisabled(running)
+
+        progress = self.model.progress
+        if not running:
+            self.progress_label.setText("")
+        elif progress and progress.get("delta") is not None:
+            self.progress_label.setText(f"Итерация {progress['iteration']}, Δ = {progress['delta']:.3e}")
+        else:
+            self.progress_label.setText("Выполняется расчет...")
+
     def model_loaded(self):
         self.header.blockSignals(True)
         self.description.blockSignals(True)
@@ -196,6 +226,12 @@ class SLATItemView(QWidget):
         if model_size:
             self.size_input.setValue(model_size)
 
+    def calc_clicked(self):
+        if self.model.running:
+            self.model.cancel()
+        else:
+            self.model.start_calc()
+
     def validation_error(self, message: str):
         self.error_label.setText(message)
 
@@ -305,24 +341,16 @@ class SLATItemView(QWidget):
                 content_layout.addWidget(log_area)
 
             if table:
-                table_widget = self.widgets_factory.table()
+                table_widget = self.widgets_factory.data_table()
                 table_widget.setFixedHeight(400)
-                table_widget.setRowCount(len(table))
-                table_widget.add_style(""" QTableWidget { border: none; } """)
-                table_widget.setColumnCount(len(self.model.x0) + 2)
-                table_widget.setHorizontalHeaderLabels(["№", "delta", *[f"x{i}" for i in range(len(self.model.x0))]])
+                table_widget.add_style(""" QTableView { border: none; } """)
+                columns = row_columns(table, "iter_num", "delta", "vector")
+                table_widget.set_columns(
+                    ["№", "delta", *[f"x{i}" for i in range(len(columns) - 2)]],
+                    columns,
+                    [None] + [fixed] * (len(columns) - 1)
+                )
                 table_widget.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-                for i, row in enumerate(table):
-                    table_widget.setItem(i, 0, QTableWidgetItem(str(row.iter_num)))
-                    delta = format(row.delta, ".17f")
-                    if '.' in delta:
-                        delta = delta.rstrip('0').rstrip('.')
-                    table_widget.setItem(i, 1, QTableWidgetItem(delta))
-                    for j, x in enumerate(row.vector):
-                        val = format(x, ".17f")
-                        if '.' in val:
-                            val = val.rstrip('0').rstrip('.')
-                        table_widget.setItem(i, j + 2, QTableWidgetItem(val))
                 content_layout.addWidget(table_widget)
 
         modal.exec()
@@ -6,12 +6,12 @@ from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
-    QTableWidgetItem,
     QHeaderView, QListWidget, QListWidgetItem, QScrollArea
 )
 
 from compmath.models.sne.base import BaseSNEModel
 from compmath.views.widgets import WidgetsFactory
+from compmath.views.widgets.table import row_columns
 
 
 class EquationItem(QListWidgetItem):
@@ -217,9 +217,7 @@ class SNEItemView(QWidget):
 
         if self.model.equations:
             self.graphic.clear_plots()
-            self.graphic.add_plot(
-                self.model.graphic().plot_items()
-            )
+            self.graphic.add_plot(self.model.graphic())
 
         if self.equation_list.count() > len(self.model.equations):
             for i in range(len(self.model.equations), self.equation_list.count()):
@@ -355,37 +353,27 @@ class SNEItemView(QWidget):
             graphic_widget = self.widgets_factory.graphic()
             graphic_widget.graphic_slider.setEnabled(True)
             graphic_widget.setFixedSize(QSize(300, 300))
-            for graphic in self.model.graphics:
-                graphic_widget.add_plot(graphic.plot_items())
+            graphic_widget.set_plots(self.model.graphics)
             content_layout.addWidget(graphic_widget)
 
         if self.model.table:
-            table = self.widgets_factory.table()
+            table = self.widgets_factory.data_table()
             table.setFixedHeight(400)
-            table.setRowCount(len(self.model.table))
             table.add_style("""
-                QTableWidget {
+                QTableView {
                     border: none;
                 }
                 """)
-            table.setColumnCount(len(self.model.equations) + 2)
-            table.setHorizontalHeaderLabels([
-                "№",
-                "delta",
-                *[f"a{i}" for i in range(len(self.model.equations))]
-            ])
+            table.set_columns(
+                [
+                    "№",
+                    "delta",
+                    *[f"a{i}" for i in range(len(self.model.equations))]
+                ],
+                row_columns(self.model.table, "iter_num", "delta", "vector"),
+                alignment=Qt.AlignmentFlag.AlignCenter
+            )
             table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-            # align center
-            for i in range(len(self.model.equations) + 2):
-                table.horizontalHeaderItem(i).setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            for i, row in enumerate(self.model.table):
-                table.setItem(i, 0, QTableWidgetItem(str(row.iter_num)))
-                table.setItem(i, 1, QTableWidgetItem(str(row.delta)))
-                table.item(i, 0).setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                table.item(i, 1).setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                for j, x in enumerate(row.vector):
-                    table.setItem(i, j + 2, QTableWidgetItem(str(x)))
-                    table.item(i, j + 2).setTextAlignment(Qt.AlignmentFlag.AlignCenter)
             central_layout.addWidget(table)
         modal.exec()
 
@@ -1,4 +1,4 @@
-from typing import TypeVar, Literal
+from typing import TYPE_CHECKING, TypeVar, Literal
 
 from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import QWidget
@@ -10,7 +10,6 @@ from compmath.views.widgets.combo_box import ComboBox
 from compmath.views.widgets.dialog import Dialog
 from compmath.views.widgets.double_spin_box import DoubleSpinBox
 from compmath.views.widgets.graphic import Graphic
-from compmath.views.widgets.gl import GLWidget
 from compmath.views.widgets.heading import Heading1
 from compmath.views.widgets.heading import Heading2
 from compmath.views.widgets.heading import Heading3
@@ -24,10 +23,15 @@ from compmath.views.widgets.line_edit import LineEdit
 from compmath.views.widgets.list import List
 from compmath.views.widgets.matrix import Matrix
 from compmath.views.widgets.message_box import MessageBox
+from compmath.views.widgets.monitor import ResourceChart
 from compmath.views.widgets.spin_box import SpinBox
-from compmath.views.widgets.table import Table
+from compmath.views.widgets.table import Table, DataTable
 from compmath.views.widgets.textarea import TextArea
 
+# Трехмерный график (pyqtgraph.opengl) импортируется при создании, см. gl_widget
+if TYPE_CHECKING:
+    from compmath.views.widgets.gl import GLWidget
+
 QWidgetLike = TypeVar("QWidgetLike", bound=QWidget)
 
 
@@ -228,6 +232,15 @@ class WidgetsFactory:
             parent=parent
         )
 
+    def data_table(self, parent: QWidgetLike = None) -> DataTable:
+        return DataTable(
+            selection_color=self.theme.primary,
+            text_color=self.theme.text_tertiary,
+            hover_color=self.theme.hover,
+            background_color=self.theme.second_background,
+            parent=parent
+        )
+
     def input_label(self, *, parent: QWidgetLike = None) -> InputLabel:
         return InputLabel(
             self.theme.text_tertiary,
@@ -244,7 +257,9 @@ class WidgetsFactory:
             parent
         )
 
-    def gl_widget(self, *, parent: QWidgetLike = None) -> GLWidget:
+    def gl_widget(self, *, parent: QWidgetLike = None) -> "GLWidget":
+        from compmath.views.widgets.gl import GLWidget
+
         return GLWidget(
             self.theme.text_tertiary,
             self.theme.hover,
@@ -262,3 +277,11 @@ class WidgetsFactory:
             background_color=self.theme.second_background,
             parent=parent
         )
+
+    def resource_chart(self, *, parent: QWidgetLike = None) -> ResourceChart:
+        return ResourceChart(
+            client_color=self.theme.primary,
+            server_color=self.theme.text_secondary,
+            background_color=self.theme.first_background,
+            parent=parent
+        )
@@ -1,4 +1,5 @@
 import logging
+from typing import Sequence
 
 from PyQt6 import sip
 from PyQt6.QtCore import Qt
@@ -10,6 +11,7 @@ from PyQt6.QtWidgets import (
 )
 from pyqtgraph.opengl import GLViewWidget, GLGraphicsItem, GLAxisItem
 from OpenGL import error as opengl_error
+from compmath.models.graphic import GraphLike, make_plot_item, update_plot_item
 from compmath.utils.icon import svg_ico
 from compmath.views.widgets import Dialog
 
@@ -67,6 +69,7 @@ class GLWidget(QWidget):
 
         self._current_plot = None
         self._slider_enabled = True
+        self._items: list[GLGraphicsItem] = []
 
         self._text_color = text_color
         self._text_header_color = text_header_color
@@ -140,9 +143,31 @@ class GLWidget(QWidget):
 
     def set_element(self, element_items: list[GLGraphicsItem]):
         self._gl_widget.clearItems()
+        self._items = []
         for item in element_items:
             self._gl_widget.addItem(item)
 
+    def set_graphs(self, graphs: Sequence[GraphLike]):
+        """
+        Показ элементов графика: уже показанные элементы получают новые данные
+
+        Поверхность с теми же данными не пересоздается (см. update_plot_item).
+        """
+        items = []
+        for index, graph in enumerate(graphs):
+            if index < len(self._items) and update_plot_item(self._items[index], graph):
+                items.append(self._items[index])
+                continue
+            item = make_plot_item(graph)
+            if index < len(self._items):
+                self._gl_widget.removeItem(self._items[index])
+            self._gl_widget.addItem(item)
+            items.append(item)
+
+        for item in self._items[len(items):]:
+            self._gl_widget.removeItem(item)
+        self._items = items
+
     def show_full_screen(self):
         dialog = Dialog(
             background_window=self._dialog_background_color,
@@ -1,4 +1,5 @@
 import logging
+from typing import Sequence
 
 from PyQt6 import sip
 from PyQt6.QtCore import Qt, pyqtSignal
@@ -13,6 +14,13 @@ from PyQt6.QtWidgets import (
 from pyqtgraph import PlotDataItem, AxisItem
 from pyqtgraph import PlotWidget, InfiniteLine
 
+from compmath.models.graphic import (
+    Graphic as GraphicModel,
+    GraphLike,
+    make_plot_item,
+    plot_item_type,
+    update_plot_item
+)
 from compmath.utils.icon import svg_ico
 from compmath.views.widgets import Dialog
 from compmath.views.widgets.input_label import InputLabel
@@ -28,6 +36,9 @@ class GraphicCanvas(PlotWidget):
             axisItems={'bottom': self.axis_x, 'left': self.axis_y}
         )
         self._temp_items = []
+        # Постоянные элементы кадров по классам: обновляются через setData, лишние скрываются
+        self._frame_items: dict[type, list] = {}
+        self._frame_used: dict[type, int] = {}
 
         # Создание линий, которые будут служить осями
         x_axis_line = InfiniteLine(pos=0, angle=0, movable=False, pen=axis_color)
@@ -55,7 +66,50 @@ class GraphicCanvas(PlotWidget):
             logging.warning("GraphicWidget is deleted")
 
     def temp_items(self) -> list[PlotDataItem]:
-        return self._temp_items
+        frame_items = [item for kind, items in self._frame_items.items() for item in items[:self._frame_used.get(kind, 0)]]
+        frame_items.sort(key=lambda item: item.zValue())
+        return self._temp_items + frame_items
+
+    def set_frame(self, graphs: list[GraphLike]):
+        """
+        Показ кадра: элементы предыдущего кадра переиспользуются
+
+        Элементы одного класса (кривые, прямоугольники, многоугольники)
+        сопоставляются по порядку в кадре и получают новые данные через setData;
+        неизменившиеся кривые не перерисовываются, новый элемент создается
+        только если кадр содержит больше элементов класса, чем было раньше.
+        """
+        if not self or sip.isdeleted(self):
+            logging.warning("GraphicWidget is deleted")
+            return
+
+        used = dict.fromkeys(self._frame_items, 0)
+        for z, graph in enumerate(graphs):
+            kind = plot_item_type(graph)
+            items = self._frame_items.setdefault(kind, [])
+            index = used.get(kind, 0)
+            if index < len(items) and update_plot_item(items[index], graph):
+                item = items[index]
+                item.setVisible(True)
+            else:
+                item = make_plot_item(graph)
+                self.addItem(item)
+                if index < len(items):
+                    self.removeItem(items[index])
+                    items[index] = item
+                else:
+                    items.append(item)
+            # Порядок отрисовки - порядок элементов в кадре
+            item.setZValue(z)
+            used[kind] = index + 1
+
+        for kind, items in self._frame_items.items():
+            for item in items[used[kind]:self._frame_used.get(kind, 0)]:
+                item.setVisible(False)
+        self._frame_used = used
+
+    def clear_frame(self):
+        self.set_frame([])
 
 
 def copy_plot_data_item(item: PlotDataItem) -> PlotDataItem:
@@ -86,7 +140,8 @@ class Graphic(QWidget):
     ):
         super().__init__(parent)
 
-        self._plots: list[list[PlotDataItem]] = []
+        # Кадр - модель графика (элементы переиспользуются) или готовый список элементов
+        self._plots: Sequence[GraphicModel | list[PlotDataItem]] = []
         self._current_plot = None
         self._slider_enabled = True
 
@@ -248,27 +303,55 @@ class Graphic(QWidget):
         self._y_max.setText(str(y_limits[1]))
         self._y_min.setText(str(y_limits[0]))
 
-    def add_plot(self, plot_items: list[PlotDataItem]):
-        self._plots.append(plot_items)
+    def add_plot(self, plot: GraphicModel | list[PlotDataItem]):
+        if not isinstance(self._plots, list):
+            self._plots = list(self._plots)
+        self._plots.append(plot)
+        self._update_slider()
+        self.set_plot(len(self._plots) - 1)
+
+    def set_plots(self, plots: Sequence[GraphicModel]):
+        """
+        Замена всех кадров с показом последнего
+
+        Список копируется; другие последовательности (кадры, которые строятся
+        при обращении) сохраняются как есть, и кадр собирается только при
+        переходе к нему слайдером.
+        """
+        self._plots = list(plots) if isinstance(plots, list) else plots
+        if not self._plots:
+            self.clear_plots()
+            return
+        self._update_slider()
+        self.set_plot(len(self._plots) - 1)
+
+    def _update_slider(self):
         if self._slider_enabled:
             if self.graphic_slider and not sip.isdeleted(self):
+                self.graphic_slider.blockSignals(True)
                 self.graphic_slider.setEnabled(True)
                 self.graphic_slider.setMaximum(len(self._plots) - 1)
                 self.graphic_slider.setValue(len(self._plots) - 1)
+                self.graphic_slider.blockSignals(False)
             else:
                 logging.error("[GraphicWidget] GraphicSlider is deleted")
-        self.set_plot(len(self._plots) - 1)
 
     def set_plot(self, index: int):
         self._current_plot = index
+        plot = self._plots[index]
         self._graphic.clear_temp_items()
-        for item in self._plots[index]:
-            self._graphic.add_temp_item(item)
+        if isinstance(plot, GraphicModel):
+            self._graphic.set_frame(list(plot.graphs))
+        else:
+            self._graphic.clear_frame()
+            for item in plot:
+                self._graphic.add_temp_item(item)
 
     def clear_plots(self):
-        self._plots.clear()
+        self._plots = []
         self._current_plot = None
         self._graphic.clear_temp_items()
+        self._graphic.clear_frame()
         self.graphic_slider.setDisabled(True)
 
     def show_full_screen(self):
@@ -283,8 +366,13 @@ class Graphic(QWidget):
         dialog.setFixedSize(800, 450)
 
         graphic = GraphicCanvas(self._dialog_background_color, self._text_color)
-        for item in self._graphic.temp_items():
-            graphic.addItem(copy_plot_data_item(item))
+        plot = self._plots[self._current_plot] if self._current_plot is not None else None
+        if isinstance(plot, GraphicModel):
+            for item in plot.plot_items():
+                graphic.addItem(item)
+        else:
+            for item in self._graphic.temp_items():
+                graphic.addItem(copy_plot_data_item(item))
         dialog.layout().addWidget(graphic)
 
         dialog.show()
@@ -0,0 +1,46 @@
+from pyqtgraph import PlotWidget, mkPen
+
+from compmath.utils.monitor import RingBuffer
+
+
+class ResourceChart(PlotWidget):
+    """
+    Мини-график загрузки CPU клиента и сервера расчетов по истории замеров
+    """
+
+    def __init__(
+            self,
+            client_color: str,
+            server_color: str,
+            background_color: str,
+            parent=None
+    ):
+        super().__init__(parent, background=background_color)
+        self.setFixedSize(120, 28)
+        self.hideAxis("left")
+        self.hideAxis("bottom")
+        self.setMouseEnabled(x=False, y=False)
+        self.hideButtons()
+        self.setMenuEnabled(False)
+        self.getPlotItem().setContentsMargins(0, 0, 0, 0)
+        self.getPlotItem().layout.setContentsMargins(0, 0, 0, 0)
+
+        # Кривые создаются один раз и обновляются через setData
+        self._server_curve = self.plot(pen=mkPen(server_color, width=1))
+        self._client_curve = self.plot(pen=mkPen(client_color, width=1))
+
+    def set_history(self, history: RingBuffer, span: float) -> None:
+        """
+        :param history: история замеров ResourceMonitor
+        :param span: ширина окна графика, с
+        """
+        if not len(history):
+            return
+        t = history.column("time")
+        t = t - t[-1]
+        client = history.column("client_cpu")
+        server = history.column("server_cpu")
+        self._client_curve.setData(t, client)
+        self._server_curve.setData(t, server)
+        self.setXRange(-span, 0, padding=0)
+        self.setYRange(0, max(100.0, float(client.max()), float(server.max())), padding=0.05)
@@ -1,5 +1,73 @@
+from typing import Any, Callable, Sequence
+
+import numpy as np
 from PyQt6 import QtWidgets
-from PyQt6.QtWidgets import QTableWidget
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtWidgets import QTableView, QTableWidget
+
+STYLE = """
+    $WIDGET {
+        border: 2px solid $HOVER;
+        border-radius: 5px;
+        background: $BG1;
+        color: $TEXT_COLOR;
+    }
+    $WIDGET::item {
+        padding: 5px;
+    }
+    $WIDGET::item:selected {
+        background: $SELECTION;
+        color: $TEXT_COLOR;
+    }
+    $WIDGET::item:hover {
+        background: $HOVER;
+        color: $TEXT_COLOR;
+    }
+
+    QHeaderView::section {
+        background: $BG1;
+        color: $TEXT_COLOR;
+        padding: 5px;
+        border-bottom: 2px solid $HOVER;
+    }
+    QHeaderView::section:hover {
+        background: $HOVER;
+    }
+
+    QScrollBar:vertical {
+        border: none;
+        background: $BG1;
+        width: 10px;
+        margin: 0px 0px 0px 0px;
+    }
+    QScrollBar::handle:vertical {
+        background: $HOVER;
+        border-radius: 2px;
+        min-height: 0px;
+    }
+    QScrollBar::add-line:vertical {
+        border: none;
+        background: none;
+    }
+    QScrollBar::sub-line:vertical {
+        border: none;
+        background: none;
+    }
+"""
+
+
+def table_style(widget: str, selection_color, text_color, hover_color, background_color) -> str:
+    return STYLE.replace(
+        "$WIDGET", widget
+    ).replace(
+        "$SELECTION", selection_color
+    ).replace(
+        "$TEXT_COLOR", text_color
+    ).replace(
+        "$HOVER", hover_color
+    ).replace(
+        "$BG1", background_color
+    )
 
 
 class Table(QTableWidget):
@@ -15,64 +83,133 @@ class Table(QTableWidget):
         self.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Stretch)
         self.verticalHeader().setVisible(False)
         self.setAlternatingRowColors(True)
-        self.setStyleSheet("""
-            QTableWidget {
-                border: 2px solid $HOVER;
-                border-radius: 5px;
-                background: $BG1;
-                color: $TEXT_COLOR;
-            }
-            QTableWidget::item {
-                padding: 5px;
-            }
-            QTableWidget::item:selected {
-                background: $SELECTION;
-                color: $TEXT_COLOR;
-            }
-            QTableWidget::item:hover {
-                background: $HOVER;
-                color: $TEXT_COLOR;
-            }
-            
-            QHeaderView::section {
-                background: $BG1;
-                color: $TEXT_COLOR;
-                padding: 5px;
-                border-bottom: 2px solid $HOVER;
-            }
-            QHeaderView::section:hover {
-                background: $HOVER;
-            }
-            
-            QScrollBar:vertical {
-                border: none;
-                background: $BG1;
-                width: 10px;
-                margin: 0px 0px 0px 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: $HOVER;
-                border-radius: 2px;
-                min-height: 0px;
-            }
-            QScrollBar::add-line:vertical {
-                border: none;
-                background: none;
-            }
-            QScrollBar::sub-line:vertical {
-                border: none;
-                background: none;
-            }
-            
-        """.replace(
-            "$SELECTION", selection_color
-        ).replace(
-            "$TEXT_COLOR", text_color
-        ).replace(
-            "$HOVER", hover_color
-        ).replace(
-            "$BG1", background_color
-        ))
+        self.setStyleSheet(table_style("QTableWidget", selection_color, text_color, hover_color, background_color))
+
+    def add_style(self, style: str):
+        self.setStyleSheet(self.styleSheet() + style)
+
+
+def row_columns(rows: Sequence[Any], *fields: str) -> list[list[Any]]:
+    """
+    Столбцы таблицы из списка строк (датаклассов)
+
+    Поле-вектор (список значений в каждой строке) дает по столбцу на элемент.
+    Значения не приводятся к общему типу, поэтому номера итераций и целые
+    числа отображаются так же, как в строках.
+
+    :param rows: строки таблицы
+    :param fields: имена полей в порядке столбцов
+    """
+    columns = []
+    for field in fields:
+        values = [getattr(row, field) for row in rows]
+        if values and isinstance(values[0], (list, tuple, np.ndarray)):
+            columns.extend(list(column) for column in zip(*values))
+        else:
+            columns.append(values)
+    return columns
+
+
+class ColumnsModel(QAbstractTableModel):
+    """
+    Модель таблицы по столбцам
+
+    Столбцы - массивы numpy или списки одинаковой длины. Текст ячейки
+    формируется только при отрисовке, то есть для видимых строк, поэтому
+    открытие таблицы не зависит от числа строк.
+    """
+
+    def __init__(
+            self,
+            headers: list[str],
+            columns: list[Sequence[Any]],
+            formatters: list[Callable[[Any], str] | None] | None = None,
+            alignment: Qt.AlignmentFlag | list[Qt.AlignmentFlag | None] | None = None,
+            parent=None
+    ):
+        """
+        :param headers: заголовки столбцов
+        :param columns: значения столбцов
+        :param formatters: преобразование значения в текст по столбцам (None - str)
+        :param alignment: выравнивание текста ячеек и заголовков (None - по умолчанию);
+            список задает выравнивание только ячеек по столбцам
+        """
+        super().__init__(parent)
+        self._headers = headers
+        self._columns = columns
+        self._formatters = formatters or [None] * len(columns)
+        self._alignment = alignment
+        self._rows = len(columns[0]) if columns else 0
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._rows
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            value = self._columns[index.column()][index.row()]
+            formatter = self._formatters[index.column()]
+            return formatter(value) if formatter else str(value)
+        if role == Qt.ItemDataRole.TextAlignmentRole and self._alignment is not None:
+            if isinstance(self._alignment, list):
+                return self._alignment[index.column()]
+            return self._alignment
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation != Qt.Orientation.Horizontal:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        if role == Qt.ItemDataRole.TextAlignmentRole and isinstance(self._alignment, Qt.AlignmentFlag):
+            return self._alignment
+        return None
+
+
+class DataTable(QTableView):
+    """
+    Таблица результатов только для чтения (итерации, квадратуры)
+
+    В отличие от Table не создает элемент на каждую ячейку: данные берутся
+    из ColumnsModel, высота строк фиксирована, поэтому Qt отрисовывает
+    только видимые строки.
+    """
+
+    def __init__(
+            self,
+            selection_color,
+            text_color,
+            hover_color,
+            background_color,
+            parent=None
+    ):
+        super().__init__(parent)
+        self.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Stretch)
+        # Ширина по содержимому оценивается по первым строкам, а не по всей таблице
+        self.horizontalHeader().setResizeContentsPrecision(100)
+        self.verticalHeader().setVisible(False)
+        self.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+        self.setAlternatingRowColors(True)
+        self.setStyleSheet(table_style("QTableView", selection_color, text_color, hover_color, background_color))
+
+    def set_columns(
+            self,
+            headers: list[str],
+            columns: list[Sequence[Any]],
+            formatters: list[Callable[[Any], str] | None] | None = None,
+            alignment: Qt.AlignmentFlag | list[Qt.AlignmentFlag | None] | None = None
+    ) -> None:
+        """
+        :param headers: заголовки столбцов
+        :param columns: значения столбцов (массивы numpy или списки)
+        :param formatters: преобразование значения в текст по столбцам (None - str)
+        :param alignment: выравнивание текста ячеек и заголовков или только ячеек по столбцам
+        """
+        self.setModel(ColumnsModel(headers, columns, formatters, alignment, parent=self))
 
     def add_style(self, style: str):
         self.setStyleSheet(self.styleSheet() + style)
@@ -0,0 +1,62 @@
+"""
+Замеры вычислительных ядер и обработчиков сервера
+
+    python -m compmath_calc_server.bench --save baseline.json
+    python -m compmath_calc_server.bench --compare baseline.json
+
+Кэши ответов и символьных вычислений на диске отключаются, расчеты выполняются
+в текущем процессе, поэтому замеры не зависят от состояния сервера.
+"""
+import argparse
+import os
+import sys
+
+os.environ.setdefault("DEBUG", "0")
+os.environ.setdefault("CALC_PROCESSES", "0")
+os.environ.setdefault("RESPONSE_CACHE_BYTES", "0")
+os.environ.setdefault("RESPONSE_CACHE_PATH", "")
+os.environ.setdefault("ARTIFACTS_PATH", "")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m compmath_calc_server.bench")
+    parser.add_argument("--size", choices=("small", "full"), default="small", help="набор размеров задач")
+    parser.add_argument("--repeat", type=int, default=5, help="число замеров времени")
+    parser.add_argument("--filter", default="", help="только замеры, имя которых содержит строку")
+    parser.add_argument("--endpoints", action="store_true", help="также замерить обработчики HTTP")
+    parser.add_argument("--save", metavar="FILE", help="сохранить результаты как эталон")
+    parser.add_argument("--compare", metavar="FILE", help="сравнить с эталоном")
+    parser.add_argument("--threshold", type=float, default=0.2, help="допустимое ухудшение (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    from compmath_calc_server.bench import cases, runner
+
+    selected = cases.kernel_cases(args.size)
+    if args.endpoints:
+        from fastapi.testclient import TestClient
+        from compmath_calc_server.main import create_app
+
+        selected += cases.endpoint_cases(args.size, TestClient(create_app()))
+
+    selected = [case for case in selected if args.filter in case.name]
+
+    results = []
+    for case in selected:
+        print(f"\r{case.name:<60}", end="", file=sys.stderr, flush=True)
+        results.append(runner.measure(case, args.repeat))
+    print("\r" + " " * 60 + "\r", end="", file=sys.stderr)
+
+    baseline = runner.load(args.compare) if args.compare else None
+    regressions = runner.report(results, baseline, args.threshold)
+
+    if args.save:
+        runner.save(results, args.save)
+
+    if regressions:
+        print(f"\nУхудшение больше {args.threshold:.0%}: {len(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
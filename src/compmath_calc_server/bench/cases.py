@@ -0,0 +1,190 @@
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import numpy as np
+
+# Представительный набор выражений: многочлены, экспоненты, тригонометрия, логарифмы
+EXPRESSIONS = (
+    "0.5**x + 1 - (x-2)**2",
+    "x**3 - 2*x + 1",
+    "sin(x) + x**2",
+    "exp(-x**2)",
+    "x*cos(x) + log(x + 5)",
+)
+
+# Системы двух уравнений, сходящиеся для методов итераций из начального приближения
+SNE_SYSTEMS = (
+    (("x + cos(y) - 3", "cos(x - 1) - y - 1.2"), (0, 1)),
+    (("x - sin(y)/3 - 1", "y - cos(x)/4"), (1, 0)),
+)
+
+# Размеры задач: матрица n, число интервалов, точки аппроксимации, узлы интерполяции, ограничение итераций
+SIZES = {
+    "small": {
+        "matrix": (10, 30),
+        "intervals": (1_000, 10_000),
+        "points": (100, 500),
+        "nodes": (10, 30),
+        "iterations": (10, 50),
+    },
+    "full": {
+        "matrix": (10, 50, 100),
+        "intervals": (1_000, 10_000, 100_000),
+        "points": (100, 1_000, 2_000),
+        "nodes": (10, 50, 100),
+        "iterations": (10, 100, 1_000),
+    },
+}
+
+LIMITS = {"x_limits": (-10, 10), "y_limits": (-10, 10)}
+
+
+@dataclass
+class Case:
+    """
+    Замеряемый вызов
+
+    :param name: имя вида "группа/ядро[параметры]", по нему сравнивается с эталоном
+    :param func: вызов без аргументов (входные данные подготовлены заранее)
+    """
+    name: str
+    func: Callable[[], Any]
+
+
+def diagonal_system(n: int, seed: int = 0) -> tuple[list[list[float]], list[float]]:
+    """
+    Система с диагональным преобладанием (сходится для методов итераций)
+    """
+    rng = np.random.default_rng(seed)
+    a_matrix = rng.uniform(-1, 1, (n, n))
+    a_matrix[np.diag_indices(n)] = np.abs(a_matrix).sum(axis=1) + 1
+    b_vector = rng.uniform(-10, 10, n)
+    return a_matrix.tolist(), b_vector.tolist()
+
+
+def sample_points(n: int, seed: int = 0) -> list[tuple[float, float]]:
+    rng = np.random.default_rng(seed)
+    x = np.linspace(0.5, 8, n)
+    y = 2 * np.exp(-0.3 * x) + rng.normal(0, 0.05, n)
+    return list(zip(x.tolist(), y.tolist()))
+
+
+def kernel_cases(size: str) -> list[Case]:
+    """
+    Вычислительные ядра сервера, вызываемые напрямую
+    """
+    from compmath_calc_server.models import GraphicBuilder
+    from compmath_calc_server.models.aif import alsm, interspline
+    from compmath_calc_server.models.aif.dto import InputAIFModel, InputInterpModel
+    from compmath_calc_server.models.ni import lrm, mrm, rrm, sm1, sm2, tm
+    from compmath_calc_server.models.ni.dto import InputNIModel
+    from compmath_calc_server.models.nonlinear import hdm, ntm, roots
+    from compmath_calc_server.models.nonlinear.dto import InputNonLinearModel, InputRootsModel
+    from compmath_calc_server.models.slat import sim as slat_sim, zm as slat_zm
+    from compmath_calc_server.models.sne import sim as sne_sim, zm as sne_zm, ntm as sne_ntm
+    from compmath_calc_server.models.sne.dto import InputSNEModel
+    from compmath_calc_server.utils.func import gauss_calc, make_callable, definite_integral
+
+    sizes = SIZES[size]
+    cases = []
+
+    for n in sizes["matrix"]:
+        a_matrix, b_vector = diagonal_system(n)
+        x0 = [0.0] * n
+        cases += [
+            Case(f"slat/gauss_calc[n={n}]", lambda a=a_matrix, b=b_vector, n=n: gauss_calc(a, b, n)),
+            Case(f"slat/calc_sim[n={n}]", lambda a=a_matrix, b=b_vector, x=x0: slat_sim.calc_sim(a, b, x, 1e-6, 100)),
+            Case(f"slat/calc_zm[n={n}]", lambda a=a_matrix, b=b_vector, x=x0: slat_zm.calc_zm(a, b, x, 1e-6, 100)),
+        ]
+
+    for module in (lrm, mrm, rrm, sm1, sm2, tm):
+        method = module.__name__.rsplit(".", 1)[-1]
+        for n in sizes["intervals"]:
+            for i, fx in enumerate(EXPRESSIONS):
+                data = InputNIModel(fx=fx, a=0, b=3, intervals=n, **LIMITS)
+                cases.append(Case(f"ni/{method}[n={n},fx={i}]", lambda m=module, d=data: m.calc(d)))
+
+    for i, fx in enumerate(EXPRESSIONS):
+        # Символьный интеграл без кэша: в обработчиках он запоминается после первого вызова
+        cases.append(Case(f"ni/reference[fx={i}]", lambda f=fx: definite_integral.__wrapped__(f, 0, 3)))
+
+        function = make_callable(fx)
+        for step in (0.1, 0.01):
+            def add_graph(f=function, s=step):
+                graphic = GraphicBuilder(x_limits=(-10, 10), y_limits=(-10, 10))
+                graphic.add_graph(f, step=s)
+                return graphic.build()
+            cases.append(Case(f"graphic/add_graph[step={step},fx={i}]", add_graph))
+
+    for n in sizes["points"]:
+        data = InputAIFModel(points=sample_points(n), **LIMITS)
+        cases.append(Case(f"aif/alsm[points={n}]", lambda d=data: alsm.calc(d)))
+
+    for n in sizes["nodes"]:
+        data = InputInterpModel(points=sample_points(n), x=4.0, **LIMITS)
+        cases.append(Case(f"aif/interp[nodes={n}]", lambda d=data: interspline.calc(d)))
+
+    for iterations in sizes["iterations"]:
+        for i, (equations, guess) in enumerate(SNE_SYSTEMS):
+            data = InputSNEModel(
+                equations=list(equations),
+                eps=1e-12,
+                iters_limit=iterations,
+                initial_guess=guess,
+                **LIMITS
+            )
+            for method, module in (("sim", sne_sim), ("zm", sne_zm), ("ntm", sne_ntm)):
+                cases.append(Case(f"sne/{method}[iters={iterations},system={i}]", lambda m=module, d=data: m.calc(d)))
+
+    for iterations in sizes["iterations"]:
+        data = InputNonLinearModel(fx=EXPRESSIONS[0], interval=(2.5, 4), eps=1e-15, iters_limit=iterations, **LIMITS)
+        for method, module in (("hdm", hdm), ("ntm", ntm)):
+            cases.append(Case(f"nonlinear/{method}[iters={iterations}]", lambda m=module, d=data: m.calc(d)))
+
+    for n in sizes["intervals"]:
+        data = InputRootsModel(fx="sin(x)", interval=(-10, 10), eps=1e-12, iters_limit=100, grid=n, **LIMITS)
+        cases.append(Case(f"nonlinear/roots[grid={n}]", lambda d=data: roots.calc(d)))
+
+    return cases
+
+
+def endpoint_cases(size: str, client) -> list[Case]:
+    """
+    Обработчики сервера целиком: проверка входных данных, расчет, сериализация
+
+    :param client: TestClient приложения
+    """
+    sizes = SIZES[size]
+    requests = []
+
+    for n in sizes["matrix"]:
+        a_matrix, b_vector = diagonal_system(n)
+        body = {"a_matrix": a_matrix, "b_vector": b_vector, "eps": 1e-6, "iters_limit": 100}
+        for method in ("sim", "zm", "gm"):
+            requests.append((f"slat/{method}[n={n}]", f"/api/slat/{method}/calculate", body))
+
+    for n in sizes["intervals"]:
+        body = {"fx": EXPRESSIONS[0], "a": 0, "b": 3, "intervals": n, **LIMITS}
+        for method in ("lrm", "mrm", "rrm", "sm1", "sm2", "tm"):
+            requests.append((f"ni/{method}[n={n}]", f"/api/ni/{method}/calculate", body))
+
+    for n in sizes["points"]:
+        requests.append((f"aif/alsm[points={n}]", "/api/aif/alsm/calculate", {"points": sample_points(n), **LIMITS}))
+
+    equations, guess = SNE_SYSTEMS[0]
+    for iterations in sizes["iterations"]:
+        body = {"equations": list(equations), "eps": 1e-12, "iters_limit": iterations, "initial_guess": guess, **LIMITS}
+        for method in ("sim", "zm", "ntm"):
+            requests.append((f"sne/{method}[iters={iterations}]", f"/api/sne/{method}/calculate", body))
+
+    for n in sizes["intervals"]:
+        body = {"fx": "sin(x)", "interval": (-10, 10), "eps": 1e-12, "iters_limit": 100, "grid": n, **LIMITS}
+        requests.append((f"nonlinear/roots[grid={n}]", "/api/nonlinear/roots/calculate", body))
+
+    def post(url: str, body: dict) -> bytes:
+        response = client.post(url, json=body)
+        if response.status_code != 200:
+            raise RuntimeError(f"{url}: {response.status_code} {response.text[:200]}")
+        return response.content
+
+    return [Case(f"endpoint/{name}", lambda u=url, b=body: post(u, b)) for name, url, body in requests]
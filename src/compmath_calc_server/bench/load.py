@@ -0,0 +1,476 @@
+"""
+Нагрузочное тестирование API сервера
+
+    python -m compmath_calc_server.bench.load --duration 30 --clients 8
+    python -m compmath_calc_server.bench.load --config workers=1,processes=0 --config workers=3,processes=2
+    python -m compmath_calc_server.bench.load --url http://127.0.0.1:8000 --duration 60
+
+Клиенты в потоках отправляют смешанный поток запросов к /api/aif, /api/sne,
+/api/ni и /api/slat. Сервер запускается отдельным процессом (gunicorn или
+uvicorn с заданным числом воркеров), в текущем процессе (--inprocess, одна конфигурация)
+или уже запущен (--url). Для каждой конфигурации выводятся RPS, задержки
+p50/p95/p99, доля ошибок и загрузка процессора процессами сервера.
+"""
+import argparse
+import http.client
+import importlib.util
+import json
+import os
+import platform
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Callable
+from urllib.parse import urlsplit
+
+import psutil
+
+from compmath_calc_server.bench.cases import EXPRESSIONS, LIMITS, SNE_SYSTEMS, diagonal_system, sample_points
+
+
+def _alsm(rng: random.Random) -> dict:
+    return {"points": sample_points(rng.randint(20, 200), rng.randint(0, 100)), **LIMITS}
+
+
+def _interp(rng: random.Random) -> dict:
+    return {"points": sample_points(rng.randint(5, 30), rng.randint(0, 100)), "x": rng.uniform(1, 7), **LIMITS}
+
+
+def _sne(rng: random.Random) -> dict:
+    equations, guess = rng.choice(SNE_SYSTEMS)
+    return {
+        "equations": list(equations),
+        "eps": 10 ** -rng.randint(4, 10),
+        "iters_limit": rng.choice((50, 100, 500)),
+        "initial_guess": list(guess),
+        **LIMITS
+    }
+
+
+def _ni(rng: random.Random) -> dict:
+    return {
+        "fx": rng.choice(EXPRESSIONS),
+        "a": 0,
+        "b": rng.choice((1, 2, 3)),
+        "intervals": rng.choice((10, 100, 1_000, 10_000, 20_000)),
+        **LIMITS
+    }
+
+
+def _slat(rng: random.Random) -> dict:
+    a_matrix, b_vector = diagonal_system(rng.randint(3, 20), rng.randint(0, 100))
+    return {"a_matrix": a_matrix, "b_vector": b_vector, "eps": 10 ** -rng.randint(3, 8), "iters_limit": 100}
+
+
+# Обработчик: вес в смеси запросов и генератор тела
+MIX: dict[str, tuple[int, Callable[[random.Random], dict]]] = {
+    "/api/aif/alsm/calculate": (10, _alsm),
+    "/api/aif/interp/calculate": (5, _interp),
+    "/api/sne/sim/calculate": (4, _sne),
+    "/api/sne/zm/calculate": (4, _sne),
+    "/api/sne/ntm/calculate": (4, _sne),
+    **{f"/api/ni/{method}/calculate": (4, _ni) for method in ("lrm", "mrm", "rrm", "sm1", "sm2", "tm")},
+    "/api/slat/sim/calculate": (4, _slat),
+    "/api/slat/zm/calculate": (4, _slat),
+    "/api/slat/gm/calculate": (4, _slat),
+}
+
+
+@dataclass
+class Sample:
+    path: str
+    status: int
+    latency: float
+
+
+@dataclass
+class Report:
+    name: str
+    duration: float
+    samples: list[Sample]
+    cpu: list[tuple[str, int, float]] = field(default_factory=list)
+
+    @property
+    def rps(self) -> float:
+        return len(self.samples) / self.duration if self.duration else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        if not self.samples:
+            return 0.0
+        return sum(sample.status != 200 for sample in self.samples) / len(self.samples)
+
+
+def percentiles(latencies: list[float]) -> tuple[float, float, float]:
+    """
+    :return: p50, p95, p99 (секунды)
+    """
+    if not latencies:
+        return 0.0, 0.0, 0.0
+    if len(latencies) == 1:
+        return latencies[0], latencies[0], latencies[0]
+    q = statistics.quantiles(latencies, n=100, method="inclusive")
+    return q[49], q[94], q[98]
+
+
+class LoadGenerator:
+    """
+    Генератор нагрузки: clients потоков с постоянным соединением
+
+    Доля repeat запросов повторяет одно из ранее отправленных тел того же
+    обработчика, как при повторном расчете в клиенте (попадания в кэш ответов).
+    """
+
+    def __init__(self, url: str, clients: int, repeat: float, seed: int = 0):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.clients = clients
+        self.repeat = repeat
+        self.seed = seed
+
+        self._paths = list(MIX)
+        self._weights = [MIX[path][0] for path in self._paths]
+
+    def run(self, duration: float) -> tuple[list[Sample], float]:
+        deadline = time.monotonic() + duration
+        results: list[list[Sample]] = [[] for _ in range(self.clients)]
+        threads = [
+            threading.Thread(target=self._client, args=(i, deadline, results[i]), daemon=True)
+            for i in range(self.clients)
+        ]
+
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - start
+
+        return [sample for samples in results for sample in samples], elapsed
+
+    def _client(self, number: int, deadline: float, samples: list[Sample]) -> None:
+        rng = random.Random(self.seed * 1000 + number)
+        sent: dict[str, list[bytes]] = defaultdict(list)
+        connection = http.client.HTTPConnection(self.host, self.port, timeout=300)
+
+        while time.monotonic() < deadline:
+            path = rng.choices(self._paths, self._weights)[0]
+            if sent[path] and rng.random() < self.repeat:
+                body = rng.choice(sent[path])
+            else:
+                body = json.dumps(MIX[path][1](rng)).encode()
+                sent[path].append(body)
+
+            start = time.perf_counter()
+            try:
+                connection.request("POST", path, body, {"Content-Type": "application/json"})
+                response = connection.getresponse()
+                response.read()
+                status = response.status
+            except (OSError, http.client.HTTPException):
+                status = 0
+                connection.close()
+                connection = http.client.HTTPConnection(self.host, self.port, timeout=300)
+            samples.append(Sample(path, status, time.perf_counter() - start))
+
+        connection.close()
+
+
+class CpuMonitor:
+    """
+    Процессорное время процессов сервера за время замера
+
+    Роль процесса определяется глубиной в дереве: корень (master),
+    воркеры и процессы пула расчетов.
+    """
+
+    ROLES = ("master", "worker", "pool")
+
+    def __init__(self, pid: int):
+        self.root = psutil.Process(pid)
+        self._start: dict[int, float] = {}
+        self._started = 0.0
+
+    def _tree(self) -> dict[int, tuple[str, psutil.Process]]:
+        processes = {self.root.pid: ("master", self.root)}
+        level = [self.root]
+        for role in self.ROLES[1:]:
+            next_level = []
+            for parent in level:
+                for child in parent.children():
+                    try:
+                        # Служебный процесс multiprocessing не относится к серверу
+                        if any("resource_tracker" in part for part in child.cmdline()):
+                            continue
+                    except psutil.Error:
+                        continue
+                    processes[child.pid] = (role, child)
+                    next_level.append(child)
+            level = next_level
+        return processes
+
+    @staticmethod
+    def _cpu(process: psutil.Process) -> float:
+        times = process.cpu_times()
+        return times.user + times.system
+
+    def start(self) -> None:
+        self._started = time.monotonic()
+        self._start = {}
+        for pid, (_, process) in self._tree().items():
+            try:
+                self._start[pid] = self._cpu(process)
+            except psutil.Error:
+                continue
+
+    def stop(self) -> list[tuple[str, int, float]]:
+        """
+        :return: роль, pid и загрузка процессора (% одного ядра)
+        """
+        elapsed = time.monotonic() - self._started
+        usage = []
+        for pid, (role, process) in self._tree().items():
+            try:
+                cpu = self._cpu(process) - self._start.get(pid, 0.0)
+            except psutil.Error:
+                continue
+            usage.append((role, pid, cpu / elapsed * 100 if elapsed else 0.0))
+        return usage
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_ready(url: str, timeout: float = 120) -> None:
+    """
+    Ожидание готовности сервера: воркер и пул расчетов прогреты (/ready)
+    """
+    parts = urlsplit(url)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=5)
+            connection.request("GET", "/ready")
+            response = connection.getresponse()
+            response.read()
+            if response.status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.5)
+    raise TimeoutError(f"Сервер {url} не запустился за {timeout} с")
+
+
+def server_env(options: dict[str, str]) -> dict[str, str]:
+    env = dict(os.environ)
+    env["DEBUG"] = "0"
+    env["METRICS_PATH"] = tempfile.mkdtemp(prefix="compmath_load_metrics_")
+    for key, name in (("processes", "CALC_PROCESSES"), ("concurrency", "CALC_CONCURRENCY"), ("limits", "CALC_LIMITS")):
+        if key in options:
+            env[name] = options[key]
+    if options.get("cache") == "0":
+        env["RESPONSE_CACHE_BYTES"] = "0"
+        env["RESPONSE_CACHE_PATH"] = ""
+    return env
+
+
+def start_server(port: int, options: dict[str, str]) -> subprocess.Popen:
+    workers = options.get("workers", "3")
+    application = "compmath_calc_server.main:application"
+    if platform.system() != "Windows" and importlib.util.find_spec("gunicorn") is not None:
+        command = [
+            sys.executable, "-m", "gunicorn",
+            "--bind", f"127.0.0.1:{port}",
+            "--workers", workers,
+            "--worker-class", "uvicorn.workers.UvicornWorker",
+            "--log-level", "warning",
+            application
+        ]
+    else:
+        command = [
+            sys.executable, "-m", "uvicorn", application,
+            "--host", "127.0.0.1",
+            "--port", str(port),
+            "--workers", workers,
+            "--log-level", "warning"
+        ]
+    return subprocess.Popen(command, env=server_env(options))
+
+
+def start_inprocess(port: int, options: dict[str, str]) -> Callable[[], None]:
+    """
+    Запуск сервера в потоке текущего процесса
+
+    Клиенты и сервер делят один интерпретатор, поэтому загрузка процессора
+    включает генератор нагрузки. Настройки сервера (конфигурация, исполнитель,
+    кэши) читаются при импорте, поэтому в одном процессе можно запустить
+    только одну конфигурацию.
+    """
+    os.environ.update(server_env(options))
+    import uvicorn
+    from compmath_calc_server.main import create_app
+
+    server = uvicorn.Server(uvicorn.Config(create_app(), host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+
+    def stop() -> None:
+        server.should_exit = True
+        thread.join()
+
+    return stop
+
+
+def parse_config(value: str) -> dict[str, str]:
+    """
+    "workers=3,processes=2" -> {"workers": "3", "processes": "2"}
+    """
+    options = {}
+    for item in value.split(","):
+        if item.strip():
+            key, _, option = item.partition("=")
+            options[key.strip()] = option.strip()
+    return options
+
+
+def run_config(name: str, options: dict[str, str], args: argparse.Namespace) -> Report:
+    stop: Callable[[], None] | None = None
+    monitor: CpuMonitor | None = None
+
+    if args.url:
+        url = args.url
+    else:
+        port = free_port()
+        url = f"http://127.0.0.1:{port}"
+        if args.inprocess:
+            stop = start_inprocess(port, options)
+            monitor = CpuMonitor(os.getpid())
+        else:
+            process = start_server(port, options)
+            monitor = CpuMonitor(process.pid)
+
+            def stop() -> None:
+                # Процессы пула, оставшиеся после остановки воркеров, завершаются принудительно
+                children = psutil.Process(process.pid).children(recursive=True)
+                process.terminate()
+                process.wait(timeout=30)
+                _, alive = psutil.wait_procs(children, timeout=10)
+                for child in alive:
+                    child.kill()
+
+    try:
+        wait_ready(url)
+        generator = LoadGenerator(url, args.clients, args.repeat, args.seed)
+        if args.warmup > 0:
+            generator.run(args.warmup)
+
+        if monitor is not None:
+            monitor.start()
+        samples, elapsed = generator.run(args.duration)
+        cpu = monitor.stop() if monitor is not None else []
+    finally:
+        if stop is not None:
+            stop()
+
+    return Report(name=name, duration=elapsed, samples=samples, cpu=cpu)
+
+
+def print_report(report: Report) -> None:
+    p50, p95, p99 = percentiles([sample.latency for sample in report.samples])
+    print(f"\n== {report.name}")
+    print(
+        f"Запросов: {len(report.samples)} за {report.duration:.1f} с, RPS {report.rps:.1f}, "
+        f"ошибки {report.error_rate:.1%}"
+    )
+    print(f"Задержка: p50 {p50 * 1000:.1f} мс, p95 {p95 * 1000:.1f} мс, p99 {p99 * 1000:.1f} мс")
+
+    by_path: dict[str, list[Sample]] = defaultdict(list)
+    for sample in report.samples:
+        by_path[sample.path].append(sample)
+
+    print(f"\n{'endpoint':<32} {'count':>7} {'p50':>9} {'p95':>9} {'p99':>9} {'errors':>7}")
+    for path, samples in sorted(by_path.items()):
+        p50, p95, p99 = percentiles([sample.latency for sample in samples])
+        errors = sum(sample.status != 200 for sample in samples) / len(samples)
+        print(
+            f"{path.removeprefix('/api/').removesuffix('/calculate'):<32} {len(samples):>7} "
+            f"{p50 * 1000:>7.1f}ms {p95 * 1000:>7.1f}ms {p99 * 1000:>7.1f}ms {errors:>7.1%}"
+        )
+
+    statuses = defaultdict(int)
+    for sample in report.samples:
+        if sample.status != 200:
+            statuses[sample.status] += 1
+    if statuses:
+        print("Коды ошибок: " + ", ".join(f"{status or 'нет ответа'}: {count}" for status, count in statuses.items()))
+
+    if report.cpu:
+        print("\nПроцессор (% ядра): " + ", ".join(f"{role} {pid}: {cpu:.0f}%" for role, pid, cpu in report.cpu))
+
+
+def print_comparison(reports: list[Report]) -> None:
+    print(f"\n{'config':<40} {'RPS':>8} {'p50':>9} {'p95':>9} {'p99':>9} {'errors':>7} {'CPU':>7}")
+    for report in reports:
+        p50, p95, p99 = percentiles([sample.latency for sample in report.samples])
+        cpu = sum(usage for _, _, usage in report.cpu)
+        print(
+            f"{report.name:<40} {report.rps:>8.1f} {p50 * 1000:>7.1f}ms {p95 * 1000:>7.1f}ms "
+            f"{p99 * 1000:>7.1f}ms {report.error_rate:>7.1%} {cpu:>6.0f}%"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m compmath_calc_server.bench.load")
+    parser.add_argument("--url", help="адрес уже запущенного сервера")
+    parser.add_argument("--inprocess", action="store_true", help="запустить сервер в текущем процессе")
+    parser.add_argument(
+        "--config",
+        action="append",
+        metavar="OPTIONS",
+        help="конфигурация сервера: workers=3,processes=2,concurrency=4,limits=ni:2,cache=0 "
+             "(можно указать несколько для сравнения; в limits ':' вместо '=')"
+    )
+    parser.add_argument("--clients", type=int, default=8, help="число одновременных клиентов")
+    parser.add_argument("--duration", type=float, default=30, help="длительность замера (секунды)")
+    parser.add_argument("--warmup", type=float, default=5, help="прогрев перед замером (секунды)")
+    parser.add_argument("--repeat", type=float, default=0.2, help="доля повторных запросов с тем же телом")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    configs = []
+    for value in args.config or [""]:
+        options = parse_config(value)
+        if "limits" in options:
+            options["limits"] = options["limits"].replace(":", "=").replace(";", ",")
+        configs.append((value or "default", options))
+
+    if args.inprocess:
+        if len(configs) > 1:
+            parser.error("с --inprocess допускается одна конфигурация: настройки сервера читаются при импорте")
+        if "workers" in configs[0][1]:
+            parser.error("с --inprocess сервер работает в одном процессе, параметр workers не поддерживается")
+
+    reports = []
+    for name, options in configs:
+        report = run_config(name, options, args)
+        print_report(report)
+        reports.append(report)
+
+    if len(reports) > 1:
+        print_comparison(reports)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
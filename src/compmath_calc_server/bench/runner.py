@@ -0,0 +1,141 @@
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from typing import Any
+
+from pydantic_core import PydanticSerializationError, to_json
+
+from compmath_calc_server.bench.cases import Case
+from compmath_calc_server.version import __version__
+
+
+@dataclass
+class Result:
+    """
+    :param time: медиана времени вызова (секунды)
+    :param time_min: минимальное время вызова (секунды)
+    :param peak: пик выделенной памяти Python за вызов (байты)
+    :param payload: размер результата в JSON (байты)
+    """
+    name: str
+    time: float
+    time_min: float
+    peak: int
+    payload: int | None
+
+
+def payload_size(value: Any) -> int | None:
+    if isinstance(value, bytes):
+        return len(value)
+    try:
+        return len(to_json(value))
+    except PydanticSerializationError:
+        return None
+
+
+def measure(case: Case, repeat: int) -> Result:
+    """
+    Замер вызова
+
+    Первый вызов прогревочный (разбор выражений, импорты), затем repeat замеров
+    времени и отдельный вызов под tracemalloc для пика памяти.
+    """
+    value = case.func()
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        case.func()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        case.func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Result(
+        name=case.name,
+        time=statistics.median(times),
+        time_min=min(times),
+        peak=peak,
+        payload=payload_size(value)
+    )
+
+
+def save(results: list[Result], filename: str) -> None:
+    data = {
+        "meta": {
+            "version": __version__,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "results": {result.name: asdict(result) for result in results},
+    }
+    with open(filename, "w", encoding="utf-8") as file:
+        json.dump(data, file, indent=2, ensure_ascii=False)
+
+
+def load(filename: str) -> dict[str, dict[str, Any]]:
+    with open(filename, encoding="utf-8") as file:
+        return json.load(file)["results"]
+
+
+def _format_size(value: int | None) -> str:
+    if value is None:
+        return "-"
+    if value < 1024:
+        return f"{value} B"
+    if value < 1024 ** 2:
+        return f"{value / 1024:.1f} KiB"
+    return f"{value / 1024 ** 2:.1f} MiB"
+
+
+def _change(value: float, base: float | None) -> str:
+    if not base:
+        return ""
+    return f"{(value / base - 1) * 100:+.0f}%"
+
+
+def report(
+        results: list[Result],
+        baseline: dict[str, dict[str, Any]] | None = None,
+        threshold: float = 0.2
+) -> list[str]:
+    """
+    Таблица результатов и, при наличии эталона, изменения относительно него
+
+    :param threshold: допустимый рост времени или памяти (0.2 - на 20%)
+    :return: имена замеров с ухудшением больше допустимого
+    """
+    baseline = baseline or {}
+    regressions = []
+
+    header = f"{'kernel':<48} {'time':>10} {'Δ':>6} {'peak':>10} {'Δ':>6} {'payload':>10}  "
+    print(header)
+    print("-" * len(header))
+
+    for result in results:
+        base = baseline.get(result.name, {})
+        time_change = _change(result.time, base.get("time"))
+        peak_change = _change(result.peak, base.get("peak"))
+
+        regressed = bool(base) and (
+            result.time > base["time"] * (1 + threshold)
+            or result.peak > base["peak"] * (1 + threshold)
+        )
+        if regressed:
+            regressions.append(result.name)
+
+        print(
+            f"{result.name:<48} {result.time * 1000:>8.2f}ms {time_change:>6} "
+            f"{_format_size(result.peak):>10} {peak_change:>6} {_format_size(result.payload):>10}  "
+            f"{'REGRESSION' if regressed else ''}"
+        )
+
+    return regressions
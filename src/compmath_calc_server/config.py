@@ -1,4 +1,5 @@
 import os
+import tempfile
 from dataclasses import dataclass
 
 from compmath_calc_server.version import __version__
@@ -8,14 +9,84 @@ from compmath_calc_server.version import __version__
 class Config:
     DEBUG: bool
     VERSION: str
+    SESSIONS_PATH: str
+    SESSION_TTL: int
+    JOBS_PATH: str
+    JOB_TTL: int
+    SCATTER_MAX_POINTS: int
+    CALC_PROCESSES: int
+    CALC_CONCURRENCY: int
+    CALC_LIMITS: dict[str, int]
+    RESPONSE_CACHE_BYTES: int
+    RESPONSE_CACHE_TTL: int
+    RESPONSE_CACHE_PATH: str
+    ARTIFACTS_PATH: str
+    ARTIFACTS_MAX_ITEMS: int
+    METRICS_PATH: str
+    FAST_SERIALIZATION: bool
+    COMPRESSION: bool
+    COMPRESSION_MIN_SIZE: int
+    WARMUP: bool
+
+
+def user_id() -> str:
+    """
+    Идентификатор пользователя для личных каталогов во временной папке
+    """
+    if hasattr(os, "getuid"):
+        return str(os.getuid())
+    return os.environ.get("USERNAME", "user")
 
 
 def str_to_bool(value: str) -> bool:
     return str(value).lower() in ("yes", "true", "t", "1")
 
 
+def str_to_limits(value: str) -> dict[str, int]:
+    """
+    Разбор ограничений вида "ni=2,sne/ntm=1"
+    """
+    limits = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        key, _, limit = item.partition("=")
+        limits[key.strip()] = int(limit)
+    return limits
+
+
 def load_config() -> Config:
     return Config(
         DEBUG=str_to_bool(os.environ.get("DEBUG", 1)),
         VERSION=__version__,
+        SESSIONS_PATH=os.environ.get(
+            "SESSIONS_PATH",
+            os.path.join(tempfile.gettempdir(), "compmath_sessions")
+        ),
+        SESSION_TTL=int(os.environ.get("SESSION_TTL", 3600)),
+        JOBS_PATH=os.environ.get(
+            "JOBS_PATH",
+            os.path.join(tempfile.gettempdir(), "compmath_jobs")
+        ),
+        JOB_TTL=int(os.environ.get("JOB_TTL", 3600)),
+        SCATTER_MAX_POINTS=int(os.environ.get("SCATTER_MAX_POINTS", 5000)),
+        CALC_PROCESSES=int(os.environ.get("CALC_PROCESSES", 2)),
+        CALC_CONCURRENCY=int(os.environ.get("CALC_CONCURRENCY", 4)),
+        CALC_LIMITS=str_to_limits(os.environ.get("CALC_LIMITS", "")),
+        RESPONSE_CACHE_BYTES=int(os.environ.get("RESPONSE_CACHE_BYTES", 64 * 1024 * 1024)),
+        RESPONSE_CACHE_TTL=int(os.environ.get("RESPONSE_CACHE_TTL", 600)),
+        RESPONSE_CACHE_PATH=os.environ.get("RESPONSE_CACHE_PATH", ""),
+        ARTIFACTS_PATH=os.environ.get(
+            "ARTIFACTS_PATH",
+            os.path.join(tempfile.gettempdir(), f"compmath-{user_id()}", "artifacts.sqlite3")
+        ),
+        ARTIFACTS_MAX_ITEMS=int(os.environ.get("ARTIFACTS_MAX_ITEMS", 10000)),
+        METRICS_PATH=os.environ.get(
+            "METRICS_PATH",
+            os.path.join(tempfile.gettempdir(), "compmath_metrics")
+        ),
+        FAST_SERIALIZATION=str_to_bool(os.environ.get("FAST_SERIALIZATION", 0)),
+        COMPRESSION=str_to_bool(os.environ.get("COMPRESSION", 1)),
+        COMPRESSION_MIN_SIZE=int(os.environ.get("COMPRESSION_MIN_SIZE", 1024)),
+        WARMUP=str_to_bool(os.environ.get("WARMUP", 1)),
     )
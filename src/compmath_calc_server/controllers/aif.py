@@ -1,17 +1,122 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 
-from compmath_calc_server.models.aif.dto import InputAIFModel, InputInterpModel
-from compmath_calc_server.models.aif import alsm, interspline
-from compmath_calc_server.views import AIFResponse, InterpResponse
+from compmath_calc_server.config import load_config
+from compmath_calc_server.exceptions import BadRequest
+from compmath_calc_server.models.aif.dto import (
+    InputAIFModel,
+    InputInterpModel,
+    InputAIFSessionModel,
+    InputAIFDeltaModel
+)
+from compmath_calc_server.models.aif import session
+from compmath_calc_server.models.aif.session import SessionStore
+from compmath_calc_server.models.aif.stats import PowerSums
+from compmath_calc_server.utils.executor import executor
+from compmath_calc_server.utils.lazy import lazy_import
+from compmath_calc_server.utils.stream import read_points, StreamFormatError
+from compmath_calc_server.views import AIFResponse, InterpResponse, AIFSessionResponse
+from compmath_calc_server.utils.metrics import MeasuredRoute
+from compmath_calc_server.utils.serialization import respond
 
-router = APIRouter()
+router = APIRouter(route_class=MeasuredRoute)
+
+alsm = lazy_import("compmath_calc_server.models.aif.alsm")
+interspline = lazy_import("compmath_calc_server.models.aif.interspline")
+
+config = load_config()
+sessions = SessionStore(config.SESSIONS_PATH, config.SESSION_TTL)
+
+# Описание тела потоковых запросов для OpenAPI
+STREAM_BODY = {
+    "requestBody": {
+        "required": True,
+        "description": "Строки CSV \"x,y\" либо пары float64 (x, y) little-endian",
+        "content": {
+            "text/csv": {"schema": {"type": "string"}},
+            "application/octet-stream": {"schema": {"type": "string", "format": "binary"}}
+        }
+    }
+}
 
 
 @router.post("/alsm/calculate", response_model=AIFResponse, status_code=200)
-def calculate_alsm(data: InputAIFModel):
-    return AIFResponse(content=alsm.calc(data))
+async def calculate_alsm(data: InputAIFModel):
+    return respond(AIFResponse, await executor.run("aif/alsm", alsm.calc, data, config.SCATTER_MAX_POINTS))
+
+
+@router.post("/alsm/upload", response_model=AIFResponse, status_code=200, openapi_extra=STREAM_BODY)
+async def upload_alsm(
+        request: Request,
+        x_min: float = -10,
+        x_max: float = 10,
+        y_min: float = -10,
+        y_max: float = 10,
+        delimiter: str = ","
+):
+    stats = PowerSums()
+    try:
+        x_vector, y_vector = await read_points(
+            request.stream(),
+            request.headers.get("content-type", ""),
+            stats.add,
+            delimiter
+        )
+    except StreamFormatError as error:
+        raise BadRequest(str(error))
+
+    content = await executor.run(
+        "aif/alsm",
+        alsm.calc_points, x_vector, y_vector, stats, (x_min, x_max), (y_min, y_max), config.SCATTER_MAX_POINTS
+    )
+    return respond(AIFResponse, content)
+
+
+@router.post("/sessions", response_model=AIFSessionResponse, status_code=201)
+def create_session(data: InputAIFSessionModel):
+    return respond(AIFSessionResponse, session.create(sessions, data), status_code=201)
+
+
+@router.get("/sessions/{session_id}", response_model=AIFSessionResponse, status_code=200)
+def get_session(session_id: str):
+    return respond(AIFSessionResponse, session.calc(session_id, sessions.get(session_id)))
+
+
+@router.patch("/sessions/{session_id}", response_model=AIFSessionResponse, status_code=200)
+def update_session(session_id: str, data: InputAIFDeltaModel):
+    return respond(AIFSessionResponse, session.update(sessions, session_id, data))
+
+
+@router.delete("/sessions/{session_id}", status_code=204)
+def delete_session(session_id: str):
+    sessions.delete(session_id)
 
 
 @router.post("/interp/calculate", response_model=InterpResponse, status_code=200)
-def calculate_interp(data: InputInterpModel):
-    return InterpResponse(content=interspline.calc(data))
+async def calculate_interp(data: InputInterpModel):
+    return respond(InterpResponse, await executor.run("aif/interp", interspline.calc, data, config.SCATTER_MAX_POINTS))
+
+
+@router.post("/interp/upload", response_model=InterpResponse, status_code=200, openapi_extra=STREAM_BODY)
+async def upload_interp(
+        request: Request,
+        x: float,
+        x_min: float = -10,
+        x_max: float = 10,
+        y_min: float = -10,
+        y_max: float = 10,
+        delimiter: str = ","
+):
+    try:
+        x_vector, y_vector = await read_points(
+            request.stream(),
+            request.headers.get("content-type", ""),
+            delimiter=delimiter
+        )
+    except StreamFormatError as error:
+        raise BadRequest(str(error))
+
+    content = await executor.run(
+        "aif/interp",
+        interspline.calc_points, x_vector, y_vector, x, (x_min, x_max), (y_min, y_max), config.SCATTER_MAX_POINTS
+    )
+    return respond(InterpResponse, content)
@@ -0,0 +1,94 @@
+import asyncio
+import json
+import logging
+
+from fastapi import APIRouter, Header, Request
+from fastapi.responses import StreamingResponse
+
+from compmath_calc_server.config import load_config
+from compmath_calc_server.models.jobs import job
+from compmath_calc_server.models.jobs.dto import InputJobModel, JobStatus
+from compmath_calc_server.models.jobs.job import JobStore, FINAL_STATUSES
+from compmath_calc_server.utils.executor import executor
+from compmath_calc_server.views import JobResponse
+from compmath_calc_server.utils.metrics import MeasuredRoute
+
+router = APIRouter(route_class=MeasuredRoute)
+
+config = load_config()
+jobs = JobStore(config.JOBS_PATH, config.JOB_TTL)
+
+# Интервал опроса файла событий для потока SSE (секунды)
+POLL_INTERVAL = 0.1
+
+# Ссылки на фоновые задачи, чтобы их не удалил сборщик мусора
+_tasks: set[asyncio.Task] = set()
+
+
+async def execute(job_id: str, method: str, params) -> None:
+    try:
+        await executor.run(f"jobs/{method}", job.run, jobs.path, jobs.ttl, job_id, method, params)
+    except Exception as error:
+        logging.exception(error)
+        jobs.set_status(job_id, JobStatus.ERROR, error="Расчет аварийно завершен")
+
+
+@router.post("", response_model=JobResponse, status_code=202)
+async def submit_job(data: InputJobModel):
+    content, params = job.submit(jobs, data)
+
+    task = asyncio.create_task(execute(content.job_id, content.method, params))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+
+    return JobResponse(content=content)
+
+
+@router.get("/{job_id}", response_model=JobResponse, status_code=200)
+def get_job(job_id: str):
+    return JobResponse(content=jobs.get(job_id))
+
+
+@router.delete("/{job_id}", response_model=JobResponse, status_code=202)
+def cancel_job(job_id: str):
+    return JobResponse(content=jobs.cancel(job_id))
+
+
+@router.get(
+    "/{job_id}/events",
+    status_code=200,
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}}
+)
+async def job_events(job_id: str, request: Request, last_event_id: int | None = Header(default=None)):
+    """
+    Поток событий задачи (Server-Sent Events)
+
+    События: running, progress (iteration, delta, rows, ...), done, error, cancelled.
+    Номер события передается в поле id; при переподключении с заголовком
+    Last-Event-ID поток продолжается со следующего события.
+    """
+    jobs.get(job_id)
+
+    async def stream():
+        position = 0
+        number = 0
+        while True:
+            events, position = jobs.read_events(job_id, position)
+            for event in events:
+                if last_event_id is None or number > last_event_id:
+                    yield f"id: {number}\nevent: {event['type']}\ndata: {json.dumps(event)}\n\n"
+                number += 1
+
+                if event["type"] in FINAL_STATUSES:
+                    return
+
+            if await request.is_disconnected():
+                return
+            await asyncio.sleep(POLL_INTERVAL)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,24 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from compmath_calc_server.utils.artifacts import store
+from compmath_calc_server.utils.metrics import merge, registry, render, snapshots
+
+router = APIRouter()
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def get_metrics():
+    """
+    Метрики всех воркеров в текстовом формате Prometheus
+    """
+    total = merge([registry.snapshot(), *snapshots.load()])
+
+    # Счетчики общего кэша уже общие для всех процессов
+    for name, value in store.stats().items():
+        if name == "items":
+            total.gauges["compmath_artifact_cache_items", ()] = value
+        else:
+            total.counters[f"compmath_artifact_cache_{name}_total", ()] = value
+
+    return PlainTextResponse(render(total), media_type="text/plain; version=0.0.4")
@@ -1,50 +1,53 @@
 from fastapi import APIRouter
 
 from compmath_calc_server.models.ni.dto import InputNIModel, InputNInterModel
-from compmath_calc_server.models.ni import (
-    lrm,
-    mrm,
-    rrm,
-    sm2,
-    sm1,
-    tm,
-    intermediate
-)
 from compmath_calc_server.views import NIResponse, NInterResponse
+from compmath_calc_server.utils.executor import executor
+from compmath_calc_server.utils.lazy import lazy_import
+from compmath_calc_server.utils.metrics import MeasuredRoute
+from compmath_calc_server.utils.serialization import respond
 
-router = APIRouter()
+router = APIRouter(route_class=MeasuredRoute)
+
+lrm = lazy_import("compmath_calc_server.models.ni.lrm")
+mrm = lazy_import("compmath_calc_server.models.ni.mrm")
+rrm = lazy_import("compmath_calc_server.models.ni.rrm")
+sm2 = lazy_import("compmath_calc_server.models.ni.sm2")
+sm1 = lazy_import("compmath_calc_server.models.ni.sm1")
+tm = lazy_import("compmath_calc_server.models.ni.tm")
+intermediate = lazy_import("compmath_calc_server.models.ni.intermediate")
 
 
 @router.post("/lrm/calculate", response_model=NIResponse, status_code=200)
-def calculate_lrm(data: InputNIModel):
-    return NIResponse(content=lrm.calc(data))
+async def calculate_lrm(data: InputNIModel):
+    return respond(NIResponse, await executor.run("ni/lrm", lrm.calc, data))
 
 
 @router.post("/mrm/calculate", response_model=NIResponse, status_code=200)
-def calculate_mrm(data: InputNIModel):
-    return NIResponse(content=mrm.calc(data))
+async def calculate_mrm(data: InputNIModel):
+    return respond(NIResponse, await executor.run("ni/mrm", mrm.calc, data))
 
 
 @router.post("/rrm/calculate", response_model=NIResponse, status_code=200)
-def calculate_rrm(data: InputNIModel):
-    return NIResponse(content=rrm.calc(data))
+async def calculate_rrm(data: InputNIModel):
+    return respond(NIResponse, await executor.run("ni/rrm", rrm.calc, data))
 
 
 @router.post("/sm2/calculate", response_model=NIResponse, status_code=200)
-def calculate_sm2(data: InputNIModel):
-    return NIResponse(content=sm2.calc(data))
+async def calculate_sm2(data: InputNIModel):
+    return respond(NIResponse, await executor.run("ni/sm2", sm2.calc, data))
 
 
 @router.post("/sm1/calculate", response_model=NIResponse, status_code=200)
-def calculate_sm1(data: InputNIModel):
-    return NIResponse(content=sm1.calc(data))
+async def calculate_sm1(data: InputNIModel):
+    return respond(NIResponse, await executor.run("ni/sm1", sm1.calc, data))
 
 
 @router.post("/tm/calculate", response_model=NIResponse, status_code=200)
-def calculate_tm(data: InputNIModel):
-    return NIResponse(content=tm.calc(data))
+async def calculate_tm(data: InputNIModel):
+    return respond(NIResponse, await executor.run("ni/tm", tm.calc, data))
 
 
 @router.post("/intermediate/calculate", response_model=NInterResponse, status_code=200)
-def calculate_intermediate(data: InputNInterModel):
-    return NInterResponse(content=intermediate.calc(data))
+async def calculate_intermediate(data: InputNInterModel):
+    return respond(NInterResponse, await executor.run("ni/intermediate", intermediate.calc, data))
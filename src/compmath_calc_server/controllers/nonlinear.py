@@ -0,0 +1,53 @@
+from fastapi import APIRouter
+
+from compmath_calc_server.models.nonlinear.dto import InputNonLinearModel, InputRootsModel
+from compmath_calc_server.views import NonLinearResponse, RootsResponse
+from compmath_calc_server.utils.executor import executor
+from compmath_calc_server.utils.lazy import lazy_import
+from compmath_calc_server.utils.metrics import MeasuredRoute
+from compmath_calc_server.utils.serialization import respond
+
+router = APIRouter(route_class=MeasuredRoute)
+
+hdm = lazy_import("compmath_calc_server.models.nonlinear.hdm")
+mcs = lazy_import("compmath_calc_server.models.nonlinear.mcs")
+mcs_one = lazy_import("compmath_calc_server.models.nonlinear.mcs_one")
+mcs_two = lazy_import("compmath_calc_server.models.nonlinear.mcs_two")
+ntm = lazy_import("compmath_calc_server.models.nonlinear.ntm")
+sim = lazy_import("compmath_calc_server.models.nonlinear.sim")
+roots = lazy_import("compmath_calc_server.models.nonlinear.roots")
+
+
+@router.post("/hdm/calculate", response_model=NonLinearResponse, status_code=200)
+async def calculate_hdm(data: InputNonLinearModel):
+    return respond(NonLinearResponse, await executor.run("nonlinear/hdm", hdm.calc, data))
+
+
+@router.post("/mcs/calculate", response_model=NonLinearResponse, status_code=200)
+async def calculate_mcs(data: InputNonLinearModel):
+    return respond(NonLinearResponse, await executor.run("nonlinear/mcs", mcs.calc, data))
+
+
+@router.post("/mcs_one/calculate", response_model=NonLinearResponse, status_code=200)
+async def calculate_mcs_one(data: InputNonLinearModel):
+    return respond(NonLinearResponse, await executor.run("nonlinear/mcs_one", mcs_one.calc, data))
+
+
+@router.post("/mcs_two/calculate", response_model=NonLinearResponse, status_code=200)
+async def calculate_mcs_two(data: InputNonLinearModel):
+    return respond(NonLinearResponse, await executor.run("nonlinear/mcs_two", mcs_two.calc, data))
+
+
+@router.post("/ntm/calculate", response_model=NonLinearResponse, status_code=200)
+async def calculate_ntm(data: InputNonLinearModel):
+    return respond(NonLinearResponse, await executor.run("nonlinear/ntm", ntm.calc, data))
+
+
+@router.post("/sim/calculate", response_model=NonLinearResponse, status_code=200)
+async def calculate_sim(data: InputNonLinearModel):
+    return respond(NonLinearResponse, await executor.run("nonlinear/sim", sim.calc, data))
+
+
+@router.post("/roots/calculate", response_model=RootsResponse, status_code=200)
+async def calculate_roots(data: InputRootsModel):
+    return respond(RootsResponse, await executor.run("nonlinear/roots", roots.calc, data))
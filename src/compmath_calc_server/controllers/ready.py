@@ -0,0 +1,16 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from compmath_calc_server.utils.warmup import warmup
+from compmath_calc_server.views import BaseView
+
+router = APIRouter()
+
+
+@router.get("/ready", include_in_schema=False)
+def get_ready():
+    """
+    Готовность воркера: 200 после прогрева модулей и пула расчетов, до этого 503
+    """
+    state = warmup.state()
+    return JSONResponse(BaseView(content=state).model_dump(), status_code=200 if state["ready"] else 503)
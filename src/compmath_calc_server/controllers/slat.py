@@ -1,26 +1,29 @@
 from fastapi import APIRouter
 
 from compmath_calc_server.models.slat.dto import InputSLATModel
-from compmath_calc_server.models.slat import (
-    sim,
-    zm,
-    gm
-)
 from compmath_calc_server.views import SLATResponse
+from compmath_calc_server.utils.executor import executor
+from compmath_calc_server.utils.lazy import lazy_import
+from compmath_calc_server.utils.metrics import MeasuredRoute
+from compmath_calc_server.utils.serialization import respond
 
-router = APIRouter()
+router = APIRouter(route_class=MeasuredRoute)
+
+sim = lazy_import("compmath_calc_server.models.slat.sim")
+zm = lazy_import("compmath_calc_server.models.slat.zm")
+gm = lazy_import("compmath_calc_server.models.slat.gm")
 
 
 @router.post("/sim/calculate", response_model=SLATResponse, status_code=200)
-def calculate_sim(data: InputSLATModel):
-    return SLATResponse(content=sim.calc(data))
+async def calculate_sim(data: InputSLATModel):
+    return respond(SLATResponse, await executor.run("slat/sim", sim.calc, data))
 
 
 @router.post("/zm/calculate", response_model=SLATResponse, status_code=200)
-def calculate_zm(data: InputSLATModel):
-    return SLATResponse(content=zm.calc(data))
+async def calculate_zm(data: InputSLATModel):
+    return respond(SLATResponse, await executor.run("slat/zm", zm.calc, data))
 
 
 @router.post("/gm/calculate", response_model=SLATResponse, status_code=200)
-def calculate_gm(data: InputSLATModel):
-    return SLATResponse(content=gm.calc(data))
+async def calculate_gm(data: InputSLATModel):
+    return respond(SLATResponse, await executor.run("slat/gm", gm.calc, data))
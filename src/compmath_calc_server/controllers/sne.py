@@ -1,22 +1,29 @@
 from fastapi import APIRouter
 
 from compmath_calc_server.models.sne.dto import InputSNEModel
-from compmath_calc_server.models.sne import sim, ntm, zm
 from compmath_calc_server.views import SNEResponse
+from compmath_calc_server.utils.executor import executor
+from compmath_calc_server.utils.lazy import lazy_import
+from compmath_calc_server.utils.metrics import MeasuredRoute
+from compmath_calc_server.utils.serialization import respond
 
-router = APIRouter()
+router = APIRouter(route_class=MeasuredRoute)
+
+sim = lazy_import("compmath_calc_server.models.sne.sim")
+ntm = lazy_import("compmath_calc_server.models.sne.ntm")
+zm = lazy_import("compmath_calc_server.models.sne.zm")
 
 
 @router.post("/sim/calculate", response_model=SNEResponse, status_code=200)
-def calculate_sim(data: InputSNEModel):
-    return SNEResponse(content=sim.calc(data))
+async def calculate_sim(data: InputSNEModel):
+    return respond(SNEResponse, await executor.run("sne/sim", sim.calc, data))
 
 
 @router.post("/ntm/calculate", response_model=SNEResponse, status_code=200)
-def calculate_ntm(data: InputSNEModel):
-    return SNEResponse(content=ntm.calc(data))
+async def calculate_ntm(data: InputSNEModel):
+    return respond(SNEResponse, await executor.run("sne/ntm", ntm.calc, data))
 
 
 @router.post("/zm/calculate", response_model=SNEResponse, status_code=200)
-def calculate_zm(data: InputSNEModel):
-    return SNEResponse(content=zm.calc(data))
+async def calculate_zm(data: InputSNEModel):
+    return respond(SNEResponse, await executor.run("sne/zm", zm.calc, data))
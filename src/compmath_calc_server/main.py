@@ -1,11 +1,27 @@
 import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, APIRouter
 from fastapi.exceptions import RequestValidationError
 
-from compmath_calc_server.controllers import sne, ni,  aif, slat
+from compmath_calc_server.controllers import sne, ni,  aif, slat, nonlinear, jobs, metrics, ready
 from compmath_calc_server.config import load_config
 from compmath_calc_server.exceptions import APIError, handle_api_error, handle_404_error, handle_pydantic_error
+from compmath_calc_server.utils.cache import ResponseCache, ResponseCacheMiddleware
+from compmath_calc_server.utils.compression import CompressionMiddleware
+from compmath_calc_server.utils.executor import executor
+from compmath_calc_server.utils.metrics import MetricsMiddleware, snapshots
 from compmath_calc_server.utils.openapi import custom_openapi
+from compmath_calc_server.utils.warmup import warmup
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    executor.start()
+    warmup.start(executor, load_config().WARMUP)
+    yield
+    executor.shutdown()
+    snapshots.remove()
 
 
 def create_app():
@@ -18,6 +34,7 @@ def create_app():
         docs_url="/docs",
         redoc_url=None,
         swagger_ui_parameters={"syntaxHighlight.theme": "obsidian"},
+        lifespan=lifespan,
     )
 
     app.openapi = lambda: custom_openapi(app)
@@ -28,7 +45,23 @@ def create_app():
     api_router.include_router(sne.router, prefix="/sne", tags=["SNE"])
     api_router.include_router(ni.router, prefix="/ni", tags=["NI"])
     api_router.include_router(slat.router, prefix="/slat", tags=["SLAT"])
+    api_router.include_router(nonlinear.router, prefix="/nonlinear", tags=["NonLinear"])
+    api_router.include_router(jobs.router, prefix="/jobs", tags=["Jobs"])
     app.include_router(api_router)
+    app.include_router(metrics.router)
+    app.include_router(ready.router)
+
+    if config.RESPONSE_CACHE_BYTES > 0 or config.RESPONSE_CACHE_PATH:
+        cache = ResponseCache(config.RESPONSE_CACHE_BYTES, config.RESPONSE_CACHE_TTL, config.RESPONSE_CACHE_PATH)
+        cache.cleanup()
+        app.add_middleware(ResponseCacheMiddleware, cache=cache, version=config.VERSION)
+
+    # После кэша: в кэше хранятся несжатые ответы, сжимаются и ответы из кэша
+    if config.COMPRESSION:
+        app.add_middleware(CompressionMiddleware, minimum_size=config.COMPRESSION_MIN_SIZE)
+
+    # Последним, чтобы учитывать и ответы из кэша
+    app.add_middleware(MetricsMiddleware)
 
     logging.debug("Регистрация обработчиков исключений")
     app.add_exception_handler(APIError, handle_api_error)
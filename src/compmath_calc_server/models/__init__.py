@@ -1,2 +1,2 @@
 from .error import Error, ErrorType, FieldErrorItem
-from .graphic import GraphicBuilder, GraphicItem, PolygonModel, RectModel, GraphModel, PointModel
+from .graphic import GraphicBuilder, GraphicItem, PolygonModel, RectModel, StripModel, GraphModel, PointModel
@@ -3,51 +3,86 @@ from typing import cast, Callable, Sequence
 
 import numpy as np
 
+from compmath_calc_server.exceptions import BadRequest
 from compmath_calc_server.models.graphic import GraphicBuilder, GraphicItem
-from compmath_calc_server.models.aif.dto import InputAIFModel, ResultAIFItem
+from compmath_calc_server.models.aif.dto import InputAIFModel, OutputAIFModel, ResultAIFItem
+from compmath_calc_server.models.aif.stats import PowerSums
 from compmath_calc_server.utils.func import linfit, expfit, lgsfit, sinfit, pwrfit, gauss_calc
 
 type RegressReturn = tuple[list[GraphicItem], list[str], tuple[float, float] | tuple[None, None], str]
 
 
-def calc(data: InputAIFModel) -> list[ResultAIFItem]:
-    results = []
+def calc(data: InputAIFModel, max_points: int | None = None) -> OutputAIFModel:
+    table = np.array(data.points, dtype=float).reshape(-1, 2)
+    x_vector, y_vector = table[:, 0], table[:, 1]
+
+    stats = PowerSums()
+    stats.add(x_vector, y_vector)
+
+    return calc_points(x_vector, y_vector, stats, data.x_limits, data.y_limits, max_points)
 
-    points = sorted(data.points, key=lambda _: _[0])
 
-    x_vector, y_vector = zip(*points)
-    matrix_a = cast(list[list], [[None for _ in range(4)] for _ in range(4)])
-    for i, row in enumerate(matrix_a):
-        for j, col in enumerate(row):
-            matrix_a[i][j] = sum(x ** (i + j) for x in x_vector)
+def calc_points(
+        x_vector: np.ndarray,
+        y_vector: np.ndarray,
+        stats: PowerSums,
+        x_limits: tuple[float | int, float | int],
+        y_limits: tuple[float | int, float | int],
+        max_points: int | None = None
+) -> OutputAIFModel:
+    """
+    Расчет всех моделей аппроксимации
 
-    b_vector = cast(list[float], [None for _ in range(4)])
-    for i in range(len(b_vector)):
-        b_vector[i] = sum(y * x ** i for x, y in zip(x_vector, y_vector))
+    Исходные точки возвращаются один раз на весь ответ, а не в каждой модели
 
-    results.append(linear_regression(points, matrix_a, b_vector, data.x_limits, data.y_limits))
-    results.append(polynomial_regression(points, 2, matrix_a, b_vector, data.x_limits, data.y_limits))
-    results.append(polynomial_regression(points, 3, matrix_a, b_vector, data.x_limits, data.y_limits))
-    results.append(lclif(points, data.x_limits, data.y_limits))
+    :param x_vector: вектор аргументов
+    :param y_vector: вектор значений
+    :param stats: степенные суммы, накопленные по тем же точкам
+    :param x_limits:
+    :param y_limits:
+    :param max_points: предельное число точек графика; большие наборы прореживаются
+    :return: точки и результаты моделей
+    """
+    if stats.n == 0:
+        raise BadRequest("Не заданы точки")
 
-    results.append(ndp(points, expfit, data.x_limits, data.y_limits))
-    results.append(ndp(points, lgsfit, data.x_limits, data.y_limits))
-    results.append(ndp(points, sinfit, data.x_limits, data.y_limits))
-    results.append(ndp(points, pwrfit, data.x_limits, data.y_limits))
+    results = []
 
-    return [
-        ResultAIFItem(
-            graphic_items=result[0],
-            log=result[1],
-            sum_diff=result[2][0],
-            coefficient=result[2][1],
-            title=result[3]
-        ) for result in results
-    ]
+    order = np.argsort(x_vector, kind="stable")
+    x_vector, y_vector = x_vector[order], y_vector[order]
+
+    matrix_a = stats.matrix_a()
+    b_vector = stats.b_vector()
+
+    results.append(linear_regression(x_vector, y_vector, matrix_a, b_vector, x_limits, y_limits))
+    results.append(polynomial_regression(x_vector, y_vector, 2, matrix_a, b_vector, x_limits, y_limits))
+    results.append(polynomial_regression(x_vector, y_vector, 3, matrix_a, b_vector, x_limits, y_limits))
+    results.append(lclif(x_vector, y_vector, x_limits, y_limits))
+
+    results.append(ndp(x_vector, y_vector, expfit, x_limits, y_limits))
+    results.append(ndp(x_vector, y_vector, lgsfit, x_limits, y_limits))
+    results.append(ndp(x_vector, y_vector, sinfit, x_limits, y_limits))
+    results.append(ndp(x_vector, y_vector, pwrfit, x_limits, y_limits))
+
+    scatter = GraphicBuilder(x_limits, y_limits).add_scatter(x_vector, y_vector, max_points=max_points)
+
+    return OutputAIFModel(
+        points=scatter,
+        results=[
+            ResultAIFItem(
+                graphic_items=result[0],
+                log=result[1],
+                sum_diff=result[2][0],
+                coefficient=result[2][1],
+                title=result[3]
+            ) for result in results
+        ]
+    )
 
 
 def linear_regression(
-        points: list[tuple[float, float]],
+        x: np.ndarray,
+        y: np.ndarray,
         a_matrix: list[list],
         b_vector: list,
         x_limits: tuple[float | int, float | int],
@@ -56,7 +91,8 @@ def linear_regression(
     """
     Линейная регрессия
 
-    :param points: отсортированный двумерный массив точек (x, y)
+    :param x: отсортированный вектор аргументов
+    :param y: вектор значений
     :param x_limits:
     :param a_matrix
     :param b_vector
@@ -67,14 +103,12 @@ def linear_regression(
     log = []
 
     # Коэффициент корреляции
-    n = len(points)
-    x = [point[0] for point in points]
-    y = [point[1] for point in points]
-    sum_x = sum(x)
-    sum_y = sum(y)
-    sum_x2 = sum([i ** 2 for i in x])
-    sum_y2 = sum([i ** 2 for i in y])
-    sum_xy = sum([x[i] * y[i] for i in range(n)])
+    n = len(x)
+    sum_x = float(x.sum())
+    sum_y = float(y.sum())
+    sum_x2 = float(np.dot(x, x))
+    sum_y2 = float(np.dot(y, y))
+    sum_xy = float(np.dot(x, y))
     r = (n * sum_xy - sum_x * sum_y) / ((n * sum_x2 - sum_x ** 2) * (n * sum_y2 - sum_y ** 2)) ** 0.5
     log.append(f"Коэффициент корреляции: r = {r}")
 
@@ -87,11 +121,9 @@ def linear_regression(
     log.append(f"\nУравнение регрессии: \nf(x) = {a0} + {a1} * x\n")
 
     # Сумма квадратов разностей:
-    sum_diff = sum([(y[i] - func(x[i])) ** 2 for i in range(n)])
+    sum_diff = float(np.sum((y - func(x)) ** 2))
     log.append(f"Сумма квадратов разностей: {sum_diff}")
 
-    for point in points:
-        graphic.add_point(point[0], point[1])
     graphic.add_graph(func)
 
     # Gauss
@@ -120,7 +152,8 @@ def linear_regression(
 
 
 def polynomial_regression(
-        points: list[tuple[float, float]],
+        x: np.ndarray,
+        y: np.ndarray,
         degree: int,
         a_matrix: list[list],
         b_vector: list,
@@ -130,7 +163,8 @@ def polynomial_regression(
     """
     Полиномиальная регрессия n-ой степени
 
-    :param points: отсортированный двумерный массив точек (x, y)
+    :param x: отсортированный вектор аргументов
+    :param y: вектор значений
     :param degree: степень полинома
     :param a_matrix
     :param b_vector
@@ -141,30 +175,20 @@ def polynomial_regression(
     graphic = GraphicBuilder(x_limits, y_limits)
     log = []
 
-    # Коэффициент корреляции
-    n = len(points)
-    x = [point[0] for point in points]
-    y = [point[1] for point in points]
-
     coefficients = np.polyfit(x, y, degree)
     log.append(f"Коэффициенты полинома: \n{'\n'.join([str(coefficient) for coefficient in coefficients])}")
     polynomial = np.polynomial.Polynomial(np.flip(coefficients))
     log.append(f"\nУравнение регрессии: f(x) = {polynomial}\n")
 
+    # Сумма квадратов разностей:
+    sum_diff = float(np.sum((y - polynomial(x)) ** 2))
+
     # Индекс корреляции
-    gamma = np.sqrt(
-        1 -
-        sum([(y[i] - polynomial(x[i])) ** 2 for i in range(n)]) /
-        sum([(y[i] - sum(y) / n) ** 2 for i in range(n)])
-    )
+    gamma = np.sqrt(1 - sum_diff / np.sum((y - y.mean()) ** 2))
     log.append(f"Индекс корреляции: γ = {gamma}")
 
-    # Сумма квадратов разностей:
-    sum_diff = sum([(y[i] - polynomial(x[i])) ** 2 for i in range(n)])
     log.append(f"Сумма квадратов разностей: {sum_diff}")
 
-    for point in points:
-        graphic.add_point(point[0], point[1])
     graphic.add_graph(cast(Callable[[float], float], polynomial))
 
     # Gauss
@@ -193,14 +217,16 @@ def polynomial_regression(
 
 
 def lclif(
-        points: list[tuple[float, float]],
+        x: np.ndarray,
+        y: np.ndarray,
         x_limits: tuple[float | int, float | int],
         y_limits: tuple[float | int, float | int]
 ) -> RegressReturn:
     """
     Линейная комбинация линейно-независимых функций
 
-    :param points: отсортированный двумерный массив точек (x, y)
+    :param x: отсортированный вектор аргументов
+    :param y: вектор значений
     :param x_limits:
     :param y_limits:
     :return: график, лог
@@ -208,9 +234,6 @@ def lclif(
     graphic = GraphicBuilder(x_limits, y_limits)
     log = []
 
-    x = [point[0] for point in points]
-    y = [point[1] for point in points]
-
     def f(t): return 1, t, t ** 3, t ** 5, t ** 7
     log.append(f"Функция: f(t) = 1, t, t^3, t^5, t^7\n")
 
@@ -222,36 +245,31 @@ def lclif(
     log.append(f"\nУравнение регрессии: k1(t) = k * f(t)\n")
 
     # Сумма квадратов разностей:
-    sum_diff = sum([(y[i] - k1(x[i])) ** 2 for i in range(len(points))])
+    sum_diff = float(np.sum((y - np.dot(k, np.broadcast_arrays(*f(x)))) ** 2))
     log.append(f"Сумма квадратов разностей: {sum_diff}")
 
     # Индекс корреляции
-    n = len(points)
-    gamma = np.sqrt(
-        1 -
-        sum([(y[i] - k1(x[i])) ** 2 for i in range(n)]) /
-        sum([(y[i] - sum(y) / n) ** 2 for i in range(n)])
-    )
+    gamma = np.sqrt(1 - sum_diff / np.sum((y - y.mean()) ** 2))
     log.append(f"Индекс корреляции: γ = {gamma}")
 
-    for point in points:
-        graphic.add_point(point[0], point[1])
     graphic.add_graph(k1)
 
     return graphic.build(), log, (sum_diff, gamma), "Линейная комбинация линейно-независимых функций"
 
 
 def ndp(
-        points: list[tuple[float, float]],
-        fit: Callable[[list[float], list[float], list[float | int] | None], tuple],
+        x: np.ndarray,
+        y: np.ndarray,
+        fit: Callable[[np.ndarray, np.ndarray, list[float | int] | None], tuple],
         x_limits: tuple[float | int, float | int],
         y_limits: tuple[float | int, float | int]
 ) -> RegressReturn:
     """
     Нелинейная зависимость от параметра
 
+    :param x: отсортированный вектор аргументов
+    :param y: вектор значений
     :param fit: функция регрессии
-    :param points:
     :param x_limits:
     :param y_limits:
     :return:
@@ -260,9 +278,6 @@ def ndp(
     graphic = GraphicBuilder(x_limits, y_limits)
     log = []
 
-    x = [point[0] for point in points]
-    y = [point[1] for point in points]
-
     g = [1, 1, 0]
     try:
         q = fit(x, y, g)
@@ -275,20 +290,13 @@ def ndp(
         return q[1](t)
 
     # Сумма квадратов разностей:
-    sum_diff = sum([(y[i] - func(x[i])) ** 2 for i in range(len(points))])
+    sum_diff = float(np.sum((y - func(x)) ** 2))
     log.append(f"Сумма квадратов разностей: {sum_diff}")
 
     # Индекс корреляции
-    n = len(points)
-    gamma = np.sqrt(
-        1 -
-        sum([(y[i] - func(x[i])) ** 2 for i in range(n)]) /
-        sum([(y[i] - sum(y) / n) ** 2 for i in range(n)])
-    )
+    gamma = np.sqrt(1 - sum_diff / np.sum((y - y.mean()) ** 2))
     log.append(f"Индекс корреляции: γ = {gamma}")
 
-    for point in points:
-        graphic.add_point(point[0], point[1])
     graphic.add_graph(func)
 
     return graphic.build(), log, (sum_diff, gamma), f"Нелинейная зависимость от параметра (метод {fit.__name__})"
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from compmath_calc_server.models.graphic import GraphicItem
+from compmath_calc_server.models.graphic import GraphicItem, ScatterModel
 
 
 class InputAIFModel(BaseModel):
@@ -30,12 +30,17 @@ class ResultAIFItem(BaseModel):
                 "log": ["log1", "log2"],
                 "sum_diff": 1.0,
                 "coefficient": 1.0,
-                "graphic_items": [{"x": 1, "y": 1, "color": "red"}],
+                "graphic_items": [{"kind": "point", "x": 1, "y": 1, "color": "red"}],
                 "title": "Some Method"
             }
         }
 
 
+class OutputAIFModel(BaseModel):
+    points: ScatterModel
+    results: list[ResultAIFItem]
+
+
 class InputInterpModel(BaseModel):
     points: list[tuple[float, float]]
     x: float
@@ -62,7 +67,46 @@ class ResultInterpItem(BaseModel):
         json_schema_extra = {
             "example": {
                 "log": ["log1", "log2"],
-                "graphic_items": [{"x": 1, "y": 1, "color": "red"}],
+                "graphic_items": [{"kind": "point", "x": 1, "y": 1, "color": "red"}],
                 "title": "Some Method"
             }
         }
+
+
+class OutputInterpModel(BaseModel):
+    points: ScatterModel
+    results: list[ResultInterpItem]
+
+
+class InputAIFSessionModel(BaseModel):
+    points: list[tuple[float, float]]
+    y_limits: tuple[float, float] = (-10, 10)
+    x_limits: tuple[float, float] = (-10, 10)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "points": [(1, 1), (2, 2), (3, 2)],
+                "y_limits": (-10, 10),
+                "x_limits": (-10, 10)
+            }
+        }
+
+
+class InputAIFDeltaModel(BaseModel):
+    add: list[tuple[float, float]] = []
+    remove: list[tuple[float, float]] = []
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "add": [(4, 3)],
+                "remove": [(1, 1)]
+            }
+        }
+
+
+class OutputAIFSessionModel(BaseModel):
+    session_id: str
+    n: int
+    results: list[ResultAIFItem]
@@ -1,38 +1,110 @@
+import numpy as np
+from scipy.interpolate import PPoly
+
+from compmath_calc_server.exceptions import BadRequest
 from compmath_calc_server.models.graphic import GraphicBuilder, GraphicItem
-from compmath_calc_server.models.aif.dto import InputInterpModel, ResultInterpItem
-from compmath_calc_server.utils.func import cspline, pspline, lspline
+from compmath_calc_server.models.aif.dto import InputInterpModel, OutputInterpModel, ResultInterpItem
+from compmath_calc_server.utils.func import cspline, pspline, lspline, lagrange_poly, spline_coefficients
 
 type ItemSplineReturn = tuple[list[GraphicItem], list[str], str]
 
+# Полином Лагранжа высокой степени на практике бесполезен (осцилляции),
+# а его веса считаются за O(n^2); для больших наборов он не строится
+LAGRANGE_MAX_NODES = 200
+# Число строк таблиц лога (коэффициенты участков, веса); остальные сокращаются
+LOG_MAX_ROWS = 100
+
+
+def calc(data: InputInterpModel, max_points: int | None = None) -> OutputInterpModel:
+    table = np.array(data.points, dtype=float).reshape(-1, 2)
+    return calc_points(table[:, 0], table[:, 1], data.x, data.x_limits, data.y_limits, max_points)
+
+
+def calc_points(
+        x_vector: np.ndarray,
+        y_vector: np.ndarray,
+        x: float,
+        x_limits: tuple[float | int, float | int],
+        y_limits: tuple[float | int, float | int],
+        max_points: int | None = None
+) -> OutputInterpModel:
+    """
+    Расчет всех моделей интерполяции
+
+    Узлы возвращаются один раз на весь ответ, а не в каждой модели
+
+    :param x_vector: вектор узлов
+    :param y_vector: вектор значений
+    :param x: точка, в которой вычисляется значение полинома Лагранжа
+    :param x_limits:
+    :param y_limits:
+    :param max_points: предельное число точек графика; большие наборы прореживаются
+    :return: узлы и результаты моделей
+    """
+    if len(x_vector) == 0:
+        raise BadRequest("Не заданы точки")
 
-def calc(data: InputInterpModel) -> list[ResultInterpItem]:
     results = []
-    points = sorted(data.points, key=lambda _: _[0])
 
-    results.append(cubic_spline(points, data.x_limits, data.y_limits))
-    results.append(parabolic_spline(points, data.x_limits, data.y_limits))
-    results.append(linear_spline(points, data.x_limits, data.y_limits))
+    order = np.argsort(x_vector, kind="stable")
+    x_vector, y_vector = x_vector[order], y_vector[order]
+
+    repeated = np.flatnonzero(np.diff(x_vector) == 0)
+    if len(repeated):
+        raise BadRequest(f"Узлы интерполяции должны быть различны: x = {x_vector[repeated[0]]} повторяется")
+
+    results.append(cubic_spline(x_vector, y_vector, x_limits, y_limits))
+    results.append(parabolic_spline(x_vector, y_vector, x_limits, y_limits))
+    results.append(linear_spline(x_vector, y_vector, x_limits, y_limits))
+
+    results.append(lagrange(x_vector, y_vector, x_limits, y_limits, x))
+
+    scatter = GraphicBuilder(x_limits, y_limits).add_scatter(x_vector, y_vector, max_points=max_points)
 
-    results.append(lagrange(points, data.x_limits, data.y_limits, data.x))
+    return OutputInterpModel(
+        points=scatter,
+        results=[
+            ResultInterpItem(
+                graphic_items=result[0],
+                log=result[1],
+                title=result[2]
+            ) for result in results
+        ]
+    )
 
-    return [
-        ResultInterpItem(
-            graphic_items=result[0],
-            log=result[1],
-            title=result[2]
-        ) for result in results
+
+def coefficients_log(spline: PPoly) -> list[str]:
+    """
+    Таблица коэффициентов сплайна по участкам
+
+    :param spline: кусочно-полиномиальная функция
+    :return: строки лога
+    """
+    table = spline_coefficients(spline, LOG_MAX_ROWS)
+    degree = len(table[0][2]) - 1 if table else 0
+
+    log = [
+        "Коэффициенты на участках [xᵢ, xᵢ₊₁]: S(t) = Σ aₖ * (t - xᵢ)^k\n",
+        "\t".join(["xᵢ", "xᵢ₊₁", *[f"a{i}" for i in range(degree + 1)]])
     ]
+    for x_left, x_right, coefficients in table:
+        log.append("\t".join(str(round(_, 5)) for _ in (x_left, x_right, *coefficients)))
+    if len(spline.x) - 1 > LOG_MAX_ROWS:
+        log.append(f"... показаны первые {LOG_MAX_ROWS} участков из {len(spline.x) - 1}")
+    return log
 
 
 def cubic_spline(
-        points: list[tuple[float, float]],
+        x_data: np.ndarray,
+        y_data: np.ndarray,
         x_limits: tuple[float | int, float | int],
         y_limits: tuple[float | int, float | int]
 ) -> ItemSplineReturn:
     """
     Кубический сплайн
 
-    :param points: отсортированный двумерный массив точек (x, y)
+    :param x_data: отсортированный вектор узлов
+    :param y_data: вектор значений
     :param x_limits:
     :param y_limits:
     :return: график, лог
@@ -40,29 +112,27 @@ def cubic_spline(
     graphic = GraphicBuilder(x_limits, y_limits)
     log = []
 
-    x_data, y_data = zip(*points)
-
     # Кубический сплайн
     spline = cspline(x_data, y_data)
-    log.append(f"Коэффициенты: \n{spline}")
+    log.extend(coefficients_log(spline))
 
     # График
-    for point in points:
-        graphic.add_point(*point)
     graphic.add_graph(spline)
 
     return graphic.build(), log, "Кубический сплайн"
 
 
 def parabolic_spline(
-        points: list[tuple[float, float]],
+        x_data: np.ndarray,
+        y_data: np.ndarray,
         x_limits: tuple[float | int, float | int],
         y_limits: tuple[float | int, float | int]
 ) -> ItemSplineReturn:
     """
     Параболический сплайн
 
-    :param points: отсортированный двумерный массив точек (x, y)
+    :param x_data: отсортированный вектор узлов
+    :param y_data: вектор значений
     :param x_limits:
     :param y_limits:
     :return: график, лог
@@ -70,29 +140,27 @@ def parabolic_spline(
     graphic = GraphicBuilder(x_limits, y_limits)
     log = []
 
-    x_data, y_data = zip(*points)
-
     # Параболический сплайн
     spline = pspline(x_data, y_data)
-    log.append(f"Коэффициенты: \n{spline}")
+    log.extend(coefficients_log(spline))
 
     # График
-    for point in points:
-        graphic.add_point(*point)
     graphic.add_graph(spline)
 
     return graphic.build(), log, "Параболический сплайн"
 
 
 def linear_spline(
-        points: list[tuple[float, float]],
+        x_data: np.ndarray,
+        y_data: np.ndarray,
         x_limits: tuple[float | int, float | int],
         y_limits: tuple[float | int, float | int]
 ) -> ItemSplineReturn:
     """
     Линейный сплайн
 
-    :param points: отсортированный двумерный массив точек (x, y)
+    :param x_data: отсортированный вектор узлов
+    :param y_data: вектор значений
     :param x_limits:
     :param y_limits:
     :return: график, лог
@@ -100,46 +168,50 @@ def linear_spline(
     graphic = GraphicBuilder(x_limits, y_limits)
     log = []
 
-    x_data, y_data = zip(*points)
-
     # Линейный сплайн
     spline = lspline(x_data, y_data)
-    log.append(f"Коэффициенты: \n{spline}")
-
-    def func(t): return spline(t)
+    log.extend(coefficients_log(spline))
 
     # График
-    for point in points:
-        graphic.add_point(*point)
-    graphic.add_graph(func)
+    graphic.add_graph(spline)
 
     return graphic.build(), log, "Линейный сплайн"
 
 
 def lagrange(
-        points: list[tuple[float, float]],
+        x_data: np.ndarray,
+        y_data: np.ndarray,
         x_limits: tuple[float | int, float | int],
         y_limits: tuple[float | int, float | int],
         x: float
 ) -> ItemSplineReturn:
+    """
+    Полином Лагранжа
+
+    :param x_data: отсортированный вектор узлов
+    :param y_data: вектор значений
+    :param x_limits:
+    :param y_limits:
+    :param x: точка, в которой вычисляется значение полинома
+    :return: график, лог
+    """
     graphic = GraphicBuilder(x_limits, y_limits)
     log = []
 
     x_point = x
-    x_vector, y_vector = zip(*points)
 
-    s = 0
-    for i in range(len(points)):
-        p = 1
-        for j in range(len(points)):
-            if i != j:
-                p = p * (x_point - x_vector[j]) / (x_vector[i] - x_vector[j])
-        s += y_vector[i] * p
+    if len(x_data) > LAGRANGE_MAX_NODES:
+        log.append(f"Полином Лагранжа строится не более чем по {LAGRANGE_MAX_NODES} узлам, задано {len(x_data)}")
+        return graphic.build(), log, "Полином Лагранжа"
+
+    # Барицентрическая форма: веса считаются один раз, значение в точке за O(n)
+    weights, poly = lagrange_poly(x_data, y_data)
+    s = poly(x_point)
 
+    log.append(f"Барицентрические веса: \n{'\n'.join([str(_) for _ in weights[:LOG_MAX_ROWS]])}\n")
     log.append(f"Для x = {x_point}, y = {s}")
 
-    for point in points:
-        graphic.add_point(*point)
+    graphic.add_graph(poly)
     graphic.add_point(x_point, s, color="blue")
 
-    return graphic.build(), log, "Полином Лагранжа",
\ No newline at end of file
+    return graphic.build(), log, "Полином Лагранжа"
@@ -0,0 +1,304 @@
+import json
+import os
+import sqlite3
+import time
+from collections import Counter
+from contextlib import closing
+from typing import Iterable
+from uuid import UUID, uuid4
+
+import numpy as np
+
+from compmath_calc_server.exceptions import APIError, BadRequest, NotFound
+from compmath_calc_server.models.graphic import GraphicBuilder
+from compmath_calc_server.models.aif.dto import (
+    InputAIFSessionModel,
+    InputAIFDeltaModel,
+    OutputAIFSessionModel,
+    ResultAIFItem
+)
+from compmath_calc_server.models.aif.stats import PowerSums, Moments, non_negative
+from compmath_calc_server.utils.lazy import lazy_import
+
+# utils.func тянет sympy и scipy; сессии обходятся без них до первого расчета
+func = lazy_import("compmath_calc_server.utils.func")
+
+Point = tuple[float, float]
+
+
+class Session:
+    """
+    Сессия инкрементной аппроксимации
+
+    Расчет идет по достаточным статистикам точек, поэтому добавление
+    и исключение порции стоит O(размер порции) независимо от объема набора.
+    """
+
+    def __init__(
+            self,
+            x_limits: tuple[float, float],
+            y_limits: tuple[float, float],
+            stats: PowerSums = None,
+            moments: Moments = None
+    ):
+        self.x_limits = x_limits
+        self.y_limits = y_limits
+        self.stats = stats or PowerSums()
+        self.moments = moments or Moments()
+
+    @property
+    def n(self) -> int:
+        return self.moments.n
+
+    def add(self, points: list[Point]) -> None:
+        if not points:
+            return
+        x, y = np.array(points, dtype=float).T
+        self.stats.add(x, y)
+        self.moments.add(x, y)
+
+    def remove(self, points: list[Point]) -> None:
+        """
+        Исключение порции точек
+
+        Принадлежность точек сессии проверяет хранилище (SessionStore.update).
+        """
+        if not points:
+            return
+        if len(points) > self.n:
+            raise BadRequest("Исключается больше точек, чем содержит сессия")
+        x, y = np.array(points, dtype=float).T
+        self.stats.remove(x, y)
+        self.moments.remove(x, y)
+
+    def to_dict(self) -> dict:
+        return {
+            "x_limits": self.x_limits,
+            "y_limits": self.y_limits,
+            "stats": self.stats.to_dict(),
+            "moments": self.moments.to_dict()
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Session":
+        return cls(
+            x_limits=tuple(data["x_limits"]),
+            y_limits=tuple(data["y_limits"]),
+            stats=PowerSums.from_dict(data["stats"]),
+            moments=Moments.from_dict(data["moments"])
+        )
+
+
+def _counts(points: Iterable[Point]) -> Counter[Point]:
+    return Counter((float(x), float(y)) for x, y in points)
+
+
+class SessionStore:
+    """
+    Хранилище сессий в файлах SQLite
+
+    Воркеры gunicorn не разделяют память, поэтому сессия хранится в каталоге,
+    общем для всех воркеров: статистики (несколько десятков чисел) и мультимножество
+    точек, по которому проверяется, что исключаемые точки были добавлены.
+    Изменение выполняется в транзакции с блокировкой файла (BEGIN IMMEDIATE),
+    поэтому одновременные изменения одной сессии применяются по очереди.
+    """
+
+    def __init__(self, path: str, ttl: int):
+        self.path = path
+        self.ttl = ttl
+
+    def _file(self, session_id: str) -> str:
+        try:
+            session_id = UUID(session_id).hex
+        except ValueError:
+            raise NotFound("Сессия не найдена")
+        return os.path.join(self.path, f"{session_id}.sqlite3")
+
+    def _connect(self, session_id: str) -> sqlite3.Connection:
+        # mode=rw: отсутствующая (удаленная) сессия не создается заново
+        try:
+            return sqlite3.connect(
+                f"file:{self._file(session_id)}?mode=rw", uri=True, timeout=10, isolation_level=None
+            )
+        except sqlite3.OperationalError:
+            raise NotFound("Сессия не найдена")
+
+    @staticmethod
+    def _load(connection: sqlite3.Connection) -> Session:
+        try:
+            row = connection.execute("SELECT data FROM state").fetchone()
+        except sqlite3.OperationalError:
+            row = None
+        if row is None:
+            raise NotFound("Сессия не найдена")
+        return Session.from_dict(json.loads(row[0]))
+
+    @staticmethod
+    def _save(connection: sqlite3.Connection, session: Session) -> None:
+        connection.execute("UPDATE state SET data = ?", (json.dumps(session.to_dict()),))
+
+    @staticmethod
+    def _insert(connection: sqlite3.Connection, points: Counter[Point]) -> None:
+        connection.executemany(
+            "INSERT INTO points (x, y, count) VALUES (?, ?, ?) "
+            "ON CONFLICT (x, y) DO UPDATE SET count = count + excluded.count",
+            [(x, y, count) for (x, y), count in points.items()]
+        )
+
+    def create(self, session: Session, points: list[Point]) -> str:
+        os.makedirs(self.path, exist_ok=True)
+        self.cleanup()
+
+        session_id = uuid4().hex
+        with closing(sqlite3.connect(self._file(session_id), isolation_level=None)) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute("CREATE TABLE state (data TEXT)")
+            connection.execute("CREATE TABLE points (x REAL, y REAL, count INTEGER, PRIMARY KEY (x, y))")
+            connection.execute("INSERT INTO state (data) VALUES (?)", (json.dumps(session.to_dict()),))
+            self._insert(connection, _counts(points))
+            connection.execute("COMMIT")
+        return session_id
+
+    def get(self, session_id: str) -> Session:
+        with closing(self._connect(session_id)) as connection:
+            return self._load(connection)
+
+    def update(self, session_id: str, add: list[Point], remove: list[Point]) -> Session:
+        """
+        Исключение и добавление точек одной транзакцией
+
+        :raises BadRequest: исключаемая точка не входит в сессию
+        """
+        with closing(self._connect(session_id)) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                session = self._load(connection)
+                for (x, y), count in _counts(remove).items():
+                    row = connection.execute("SELECT count FROM points WHERE x = ? AND y = ?", (x, y)).fetchone()
+                    if row is None or row[0] < count:
+                        raise BadRequest(f"Точка ({x}, {y}) не входит в сессию")
+                    if row[0] == count:
+                        connection.execute("DELETE FROM points WHERE x = ? AND y = ?", (x, y))
+                    else:
+                        connection.execute("UPDATE points SET count = count - ? WHERE x = ? AND y = ?", (count, x, y))
+
+                session.remove(remove)
+                session.add(add)
+                self._insert(connection, _counts(add))
+                self._save(connection, session)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        return session
+
+    def delete(self, session_id: str) -> None:
+        try:
+            os.remove(self._file(session_id))
+        except FileNotFoundError:
+            raise NotFound("Сессия не найдена")
+
+    def cleanup(self) -> None:
+        """
+        Удаление сессий, которые не изменялись дольше ttl секунд
+        """
+        deadline = time.time() - self.ttl
+        for entry in os.scandir(self.path):
+            try:
+                if entry.is_file() and entry.stat().st_mtime < deadline:
+                    os.remove(entry.path)
+            except FileNotFoundError:
+                continue
+
+
+def create(store: SessionStore, data: InputAIFSessionModel) -> OutputAIFSessionModel:
+    session = Session(data.x_limits, data.y_limits)
+    session.add(data.points)
+    session_id = store.create(session, data.points)
+    return calc(session_id, session)
+
+
+def update(store: SessionStore, session_id: str, data: InputAIFDeltaModel) -> OutputAIFSessionModel:
+    try:
+        session = store.update(session_id, data.add, data.remove)
+    except ValueError as error:
+        raise APIError(str(error), status_code=500)
+    return calc(session_id, session)
+
+
+def calc(session_id: str, session: Session) -> OutputAIFSessionModel:
+    results = []
+    try:
+        if session.n > 1:
+            results.append(linear_regression(session))
+        for degree in (2, 3):
+            if session.n > degree:
+                results.append(polynomial_regression(session, degree))
+    except ValueError as error:
+        raise APIError(str(error), status_code=500)
+
+    return OutputAIFSessionModel(session_id=session_id, n=session.n, results=results)
+
+
+def linear_regression(session: Session) -> ResultAIFItem:
+    """
+    Линейная регрессия по моментам Уэлфорда
+
+    :param session: сессия
+    :return: результат модели
+    """
+    graphic = GraphicBuilder(session.x_limits, session.y_limits)
+    log = []
+    moments = session.moments
+    title = "Линейная регрессия"
+
+    if moments.m2_x == 0 or moments.m2_y == 0:
+        log.append("Все точки имеют одинаковые x или y, регрессия не определена")
+        return ResultAIFItem(graphic_items=[], log=log, sum_diff=None, coefficient=None, title=title)
+
+    r = moments.r
+    log.append(f"Коэффициент корреляции: r = {r}")
+
+    a1 = moments.c_xy / moments.m2_x
+    a0 = moments.mean_y - a1 * moments.mean_x
+    log.append(f"\nУравнение регрессии: \nf(x) = {a0} + {a1} * x\n")
+
+    sum_diff = non_negative(moments.m2_y - moments.c_xy ** 2 / moments.m2_x, moments.m2_y)
+    log.append(f"Сумма квадратов разностей: {sum_diff}")
+
+    graphic.add_graph(lambda x: a0 + a1 * x)
+
+    return ResultAIFItem(graphic_items=graphic.build(), log=log, sum_diff=sum_diff, coefficient=r, title=title)
+
+
+def polynomial_regression(session: Session, degree: int) -> ResultAIFItem:
+    """
+    Полиномиальная регрессия n-ой степени по степенным суммам
+
+    :param session: сессия
+    :param degree: степень полинома
+    :return: результат модели
+    """
+    graphic = GraphicBuilder(session.x_limits, session.y_limits)
+    log = []
+    title = f"Полиномиальная регрессия {degree}-степени"
+
+    gauss_vector = func.gauss_calc(session.stats.matrix_a(), session.stats.b_vector(), degree + 1)
+    if gauss_vector is None:
+        log.append("Система нормальных уравнений вырождена")
+        return ResultAIFItem(graphic_items=[], log=log, sum_diff=None, coefficient=None, title=title)
+
+    coefficients = gauss_vector[0]
+    log.append(f"Коэффициенты полинома: \n{'\n'.join([str(coefficient) for coefficient in coefficients])}")
+    polynomial = np.polynomial.Polynomial(coefficients)
+    log.append(f"\nУравнение регрессии: f(x) = {polynomial}\n")
+
+    sum_diff = session.stats.sum_diff(coefficients)
+    gamma = float(np.sqrt(non_negative(1 - sum_diff / session.moments.m2_y, 1))) if session.moments.m2_y else None
+    log.append(f"Индекс корреляции: γ = {gamma}")
+    log.append(f"Сумма квадратов разностей: {sum_diff}")
+
+    graphic.add_graph(polynomial)
+
+    return ResultAIFItem(graphic_items=graphic.build(), log=log, sum_diff=sum_diff, coefficient=gamma, title=title)
@@ -0,0 +1,210 @@
+from typing import Sequence
+
+import numpy as np
+
+# Относительная погрешность округления, в пределах которой отрицательная
+# сумма квадратов считается нулем
+ROUNDING_TOLERANCE = 1e-9
+
+
+def non_negative(value: float, scale: float) -> float:
+    """
+    Величина, неотрицательная по смыслу (сумма квадратов отклонений)
+
+    Отрицательное значение в пределах погрешности округления заменяется нулем;
+    большее означает, что статистики не соответствуют ни одному набору точек.
+
+    :param value: вычисленное значение
+    :param scale: порядок слагаемых, из которых оно получено
+    :raises ValueError: статистики повреждены
+    """
+    if value < -ROUNDING_TOLERANCE * abs(scale):
+        raise ValueError("Статистики повреждены: отрицательная сумма квадратов")
+    return max(value, 0.0)
+
+
+class PowerSums:
+    """
+    Степенные суммы для нормальных уравнений МНК
+
+    Хранит n, Σx^k (k = 0..2m), Σy*x^k (k = 0..m) и Σy^2, где m - максимальная
+    степень полинома. Суммы накапливаются порциями, поэтому данные
+    не обязательно держать целиком до начала расчёта.
+    """
+
+    def __init__(self, degree: int = 3):
+        self.degree = degree
+        self.x_powers = np.zeros(2 * degree + 1)
+        self.xy_powers = np.zeros(degree + 1)
+        self.sum_y2 = 0.0
+
+    @property
+    def n(self) -> int:
+        return int(self.x_powers[0])
+
+    def add(self, x: np.ndarray, y: np.ndarray) -> None:
+        """
+        Добавление порции точек
+
+        :param x: вектор аргументов
+        :param y: вектор значений
+        """
+        x_powers, xy_powers, sum_y2 = self._sums(x, y)
+        self.x_powers += x_powers
+        self.xy_powers += xy_powers
+        self.sum_y2 += sum_y2
+
+    def remove(self, x: np.ndarray, y: np.ndarray) -> None:
+        """
+        Исключение ранее добавленных точек
+
+        :param x: вектор аргументов
+        :param y: вектор значений
+        """
+        x_powers, xy_powers, sum_y2 = self._sums(x, y)
+        self.x_powers -= x_powers
+        self.xy_powers -= xy_powers
+        self.sum_y2 -= sum_y2
+
+    def _sums(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray, float]:
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+
+        powers = x[:, None] ** np.arange(2 * self.degree + 1)
+        return powers.sum(axis=0), y @ powers[:, :self.degree + 1], float(y @ y)
+
+    def matrix_a(self) -> list[list[float]]:
+        """
+        Матрица нормальных уравнений: a[i][j] = Σx^(i + j)
+        """
+        size = self.degree + 1
+        return [[float(self.x_powers[i + j]) for j in range(size)] for i in range(size)]
+
+    def b_vector(self) -> list[float]:
+        """
+        Правая часть нормальных уравнений: b[i] = Σy*x^i
+        """
+        return [float(_) for _ in self.xy_powers]
+
+    def sum_diff(self, coefficients: Sequence[float]) -> float:
+        """
+        Сумма квадратов разностей для полинома без обращения к точкам
+
+        Σ(y - p(x))^2 = Σy^2 - 2 * c·b + c·A·c
+
+        :param coefficients: коэффициенты полинома по возрастанию степени
+        :return: сумма квадратов разностей
+        """
+        c = np.asarray(coefficients, dtype=float)
+        size = len(c)
+        matrix_a = np.array(self.matrix_a())[:size, :size]
+        value = self.sum_y2 - 2 * c @ self.xy_powers[:size] + c @ matrix_a @ c
+        return non_negative(float(value), self.sum_y2)
+
+    def to_dict(self) -> dict:
+        return {
+            "degree": self.degree,
+            "x_powers": self.x_powers.tolist(),
+            "xy_powers": self.xy_powers.tolist(),
+            "sum_y2": self.sum_y2
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PowerSums":
+        stats = cls(data["degree"])
+        stats.x_powers = np.array(data["x_powers"], dtype=float)
+        stats.xy_powers = np.array(data["xy_powers"], dtype=float)
+        stats.sum_y2 = float(data["sum_y2"])
+        return stats
+
+
+class Moments:
+    """
+    Выборочные моменты для коэффициента корреляции (алгоритм Уэлфорда)
+
+    Хранит n, средние x и y, суммы квадратов отклонений M2x, M2y
+    и совместный момент Cxy. Порции точек объединяются и исключаются
+    по формулам Чана, поэтому обновление стоит O(размер порции) и не страдает
+    от вычитания больших степенных сумм.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.m2_x = 0.0
+        self.m2_y = 0.0
+        self.c_xy = 0.0
+
+    @staticmethod
+    def _batch(x: np.ndarray, y: np.ndarray) -> tuple[int, float, float, float, float, float]:
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        n = len(x)
+        if n == 0:
+            return 0, 0.0, 0.0, 0.0, 0.0, 0.0
+
+        mean_x = float(x.mean())
+        mean_y = float(y.mean())
+        dx = x - mean_x
+        dy = y - mean_y
+        return n, mean_x, mean_y, float(dx @ dx), float(dy @ dy), float(dx @ dy)
+
+    def add(self, x: np.ndarray, y: np.ndarray) -> None:
+        n_b, mean_x_b, mean_y_b, m2_x_b, m2_y_b, c_xy_b = self._batch(x, y)
+        if n_b == 0:
+            return
+
+        n = self.n + n_b
+        dx = mean_x_b - self.mean_x
+        dy = mean_y_b - self.mean_y
+        factor = self.n * n_b / n
+
+        self.mean_x += dx * n_b / n
+        self.mean_y += dy * n_b / n
+        self.m2_x += m2_x_b + dx * dx * factor
+        self.m2_y += m2_y_b + dy * dy * factor
+        self.c_xy += c_xy_b + dx * dy * factor
+        self.n = n
+
+    def remove(self, x: np.ndarray, y: np.ndarray) -> None:
+        n_b, mean_x_b, mean_y_b, m2_x_b, m2_y_b, c_xy_b = self._batch(x, y)
+        if n_b == 0:
+            return
+
+        n = self.n - n_b
+        if n < 0:
+            raise ValueError("Исключается больше точек, чем было добавлено")
+        if n == 0:
+            self.__init__()
+            return
+
+        mean_x = (self.n * self.mean_x - n_b * mean_x_b) / n
+        mean_y = (self.n * self.mean_y - n_b * mean_y_b) / n
+        dx = mean_x_b - mean_x
+        dy = mean_y_b - mean_y
+        factor = n * n_b / self.n
+
+        self.m2_x = non_negative(self.m2_x - m2_x_b - dx * dx * factor, self.m2_x)
+        self.m2_y = non_negative(self.m2_y - m2_y_b - dy * dy * factor, self.m2_y)
+        self.c_xy -= c_xy_b + dx * dy * factor
+        self.mean_x = mean_x
+        self.mean_y = mean_y
+        self.n = n
+
+    @property
+    def r(self) -> float:
+        """
+        Коэффициент корреляции
+        """
+        return self.c_xy / (self.m2_x * self.m2_y) ** 0.5
+
+    def to_dict(self) -> dict:
+        return dict(vars(self))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Moments":
+        moments = cls()
+        for key, value in data.items():
+            setattr(moments, key, value)
+        return moments
@@ -1,17 +1,36 @@
 from collections import deque
-from typing import Callable, cast
+from typing import Annotated, Callable, Literal
 
 import numpy as np
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from compmath_calc_server.config import load_config
+from compmath_calc_server.utils.downsample import lttb
+
+config = load_config()
+
+# Предельное число фигур в полосе (StripModel); при большем числе интервалов
+# квадратура показывается заливкой под графиком функции
+STRIP_MAX_ITEMS = 5000
 
 
 class PointModel(BaseModel):
+    kind: Literal["point"] = "point"
     x: float | int
     y: float | int
     color: str
 
 
+class ScatterModel(BaseModel):
+    kind: Literal["scatter"] = "scatter"
+    x_data: list[float]
+    y_data: list[float]
+    color: str
+    total: int
+
+
 class GraphModel(BaseModel):
+    kind: Literal["graph"] = "graph"
     x_data: list[float | None]
     y_data: list[float | None]
     color: str
@@ -20,6 +39,7 @@ class GraphModel(BaseModel):
 
 
 class RectModel(BaseModel):
+    kind: Literal["rect"] = "rect"
     x1: float | int
     y1: float | int
     x2: float | int
@@ -30,22 +50,107 @@ class RectModel(BaseModel):
 
 
 class PolygonModel(BaseModel):
+    kind: Literal["polygon"] = "polygon"
     points: list[tuple[float | int, float | int]]
     color: str
     width: float | int
     fill: str | None
 
 
+class StripModel(BaseModel):
+    """
+    Полоса фигур на общем основании (квадратурные прямоугольники или трапеции)
+
+    shape="rect": heights - высота каждого из len(x_edges) - 1 прямоугольников;
+    shape="trapezoid": heights - значения на границах x_edges (по одному на границу).
+    """
+    kind: Literal["strip"] = "strip"
+    x_edges: list[float]
+    heights: list[float]
+    base: float | int
+    shape: str
+    color: str
+    width: float | int
+    fill: str | None
+
+
 class MeshModel(BaseModel):
+    kind: Literal["mesh"] = "mesh"
     vertexes: list[list[float]]
     faces: list[list[int]]
     shader: str
 
 
-type GraphicItem = PointModel | GraphModel | RectModel | PolygonModel | MeshModel
+# Тип элемента указан в поле kind: клиент и pydantic выбирают модель по нему, а не перебором
+type GraphicItem = Annotated[
+    PointModel | ScatterModel | GraphModel | RectModel | PolygonModel | StripModel | MeshModel,
+    Field(discriminator="kind")
+]
+
+
+def sample_function(func: Callable, args: np.ndarray) -> np.ndarray:
+    """
+    Вычисление функции на массиве аргументов
+
+    Функция вызывается один раз со всем массивом; если она не поддерживает
+    массивы (или вернула результат другой формы), значения считаются поточечно.
+
+    :param func: функция одного аргумента
+    :param args: массив аргументов
+    :return: массив значений
+    """
+    try:
+        with np.errstate(all='ignore'):
+            values = np.asarray(func(args), dtype=float)
+    except (TypeError, ValueError, ZeroDivisionError):
+        values = None
+
+    if values is not None and values.ndim == 0:
+        return np.full(args.shape, values, dtype=float)
+
+    if values is None or values.shape != args.shape:
+        values = np.array([func(arg) for arg in args.tolist()], dtype=float)
+
+    return values
+
+
+def clip_to_limits(values: np.ndarray, limits: tuple[float | int, float | int]) -> list[float | None]:
+    """
+    Замена значений вне пределов (и NaN) на None
+
+    :param values: массив значений
+    :param limits: пределы
+    :return: список значений
+    """
+    with np.errstate(invalid='ignore'):
+        mask = np.isnan(values) | (values < limits[0]) | (values > limits[1])
+
+    result = values.astype(object)
+    result[mask] = None
+    return result.tolist()
+
+
+def mask_to_limits(values: np.ndarray, limits: tuple[float | int, float | int]) -> np.ndarray:
+    """
+    Замена значений вне пределов на NaN (при кодировании в JSON - null)
+
+    :param values: массив значений
+    :param limits: пределы
+    :return: массив значений
+    """
+    with np.errstate(invalid='ignore'):
+        return np.where((values < limits[0]) | (values > limits[1]), np.nan, values)
 
 
 class GraphicBuilder:
+    """
+    Построитель элементов графика
+
+    При FAST_SERIALIZATION элементы создаются без проверки (model_construct),
+    а данные графиков остаются массивами numpy: ответ кодируется напрямую
+    (см. utils.serialization), и проверка тысяч элементов не нужна.
+    """
+
     def __init__(
             self,
             x_limits: tuple[float | int, float | int] = None,
@@ -53,9 +158,15 @@ class GraphicBuilder:
     ):
         self.x_limits = x_limits
         self.y_limits = y_limits
+        self.fast = config.FAST_SERIALIZATION
 
         self.graphs = deque()
 
+    def _item[T: BaseModel](self, model: type[T], **fields) -> T:
+        if self.fast:
+            return model.model_construct(**fields)
+        return model(**fields)
+
     def add_graph(
             self,
             fx: Callable[[float | int], float] = None,
@@ -83,33 +194,36 @@ class GraphicBuilder:
                 x_limits[0],
                 x_limits[1],
                 step
-            ).tolist()
+            )
             if len(x_data) != 0 and x_data[-1] != x_limits[1]:
-                x_data.append(x_limits[1])
+                x_data = np.append(x_data, x_limits[1])
 
-            y_data = cast(list[float | None], [fx(x) for x in x_data])
-            for i, el in enumerate(y_data):
-                if cast(float, el) < y_limits[0] or cast(float, el) > y_limits[1] or np.isnan(el):
-                    y_data[i] = None
+            y_data = sample_function(fx, x_data)
+            if self.fast:
+                y_data = mask_to_limits(y_data, y_limits)
+            else:
+                x_data, y_data = x_data.tolist(), clip_to_limits(y_data, y_limits)
         elif fy:
             y_data = np.arange(
                 y_limits[0],
                 y_limits[1],
                 step
-            ).tolist()
+            )
             if len(y_data) != 0 and y_data[-1] != y_limits[1]:
-                y_data.append(y_limits[1])
+                y_data = np.append(y_data, y_limits[1])
 
-            x_data = cast(list[float | None], [fy(y) for y in y_data])
-            for i, el in enumerate(x_data):
-                if cast(float, el) < x_limits[0] or cast(float, el) > x_limits[1] or np.isnan(el):
-                    x_data[i] = None
+            x_data = sample_function(fy, y_data)
+            if self.fast:
+                x_data = mask_to_limits(x_data, x_limits)
+            else:
+                x_data, y_data = clip_to_limits(x_data, x_limits), y_data.tolist()
         else:
             raise ValueError("Не задана функция")
 
-        graph = GraphModel(
-            x_data=list(x_data),
-            y_data=list(y_data),
+        graph = self._item(
+            GraphModel,
+            x_data=x_data if self.fast else list(x_data),
+            y_data=y_data if self.fast else list(y_data),
             color=color,
             width=width,
             fill=fill
@@ -123,13 +237,45 @@ class GraphicBuilder:
             color: str = 'red'
     ) -> None:
         return self.graphs.append(
-            PointModel(
+            self._item(
+                PointModel,
                 x=x,
                 y=y,
                 color=color
             )
         )
 
+    def add_scatter(
+            self,
+            x_data: np.ndarray,
+            y_data: np.ndarray,
+            color: str = 'red',
+            max_points: int | None = None
+    ) -> ScatterModel:
+        """
+        Добавление облака точек одним элементом
+
+        :param x_data: вектор аргументов, отсортированный по возрастанию
+        :param y_data: вектор значений
+        :param color: цвет точек
+        :param max_points: предельное число точек; большее облако прореживается (LTTB)
+        :return: элемент графика
+        """
+        total = len(x_data)
+        if max_points is not None:
+            x_data, y_data = lttb(x_data, y_data, max_points)
+
+        x_data, y_data = np.asarray(x_data, dtype=float), np.asarray(y_data, dtype=float)
+        scatter = self._item(
+            ScatterModel,
+            x_data=x_data if self.fast else x_data.tolist(),
+            y_data=y_data if self.fast else y_data.tolist(),
+            color=color,
+            total=total
+        )
+        self.graphs.append(scatter)
+        return scatter
+
     def add_rect(
             self,
             x1: int | float,
@@ -141,7 +287,8 @@ class GraphicBuilder:
             fill: str | None = None
     ) -> None:
         self.graphs.append(
-            RectModel(
+            self._item(
+                RectModel,
                 x1=x1,
                 y1=y1,
                 x2=x2,
@@ -160,7 +307,8 @@ class GraphicBuilder:
             fill: str | None = None
     ) -> None:
         self.graphs.append(
-            PolygonModel(
+            self._item(
+                PolygonModel,
                 points=points,
                 color=color,
                 width=width,
@@ -168,6 +316,72 @@ class GraphicBuilder:
             )
         )
 
+    def _add_strip(
+            self,
+            shape: str,
+            x_edges: np.ndarray,
+            heights: np.ndarray,
+            base: int | float,
+            color: str,
+            width: int | float,
+            fill: str | None
+    ) -> StripModel:
+        x_edges, heights = np.asarray(x_edges, dtype=float), np.asarray(heights, dtype=float)
+        strip = self._item(
+            StripModel,
+            x_edges=x_edges if self.fast else x_edges.tolist(),
+            heights=heights if self.fast else heights.tolist(),
+            base=base,
+            shape=shape,
+            color=color,
+            width=width,
+            fill=fill
+        )
+        self.graphs.append(strip)
+        return strip
+
+    def add_rect_strip(
+            self,
+            x_edges: np.ndarray,
+            heights: np.ndarray,
+            base: int | float = 0,
+            color: str = 'blue',
+            width: int | float = 1,
+            fill: str | None = None
+    ) -> StripModel:
+        """
+        Добавление ряда прямоугольников одним элементом
+
+        :param x_edges: границы прямоугольников (n + 1 значение)
+        :param heights: высоты прямоугольников (n значений)
+        :param base: основание прямоугольников по y
+        :return: элемент графика
+        """
+        if len(heights) != len(x_edges) - 1:
+            raise ValueError("Число высот должно быть на единицу меньше числа границ")
+        return self._add_strip("rect", x_edges, heights, base, color, width, fill)
+
+    def add_trapezoid_strip(
+            self,
+            x_edges: np.ndarray,
+            heights: np.ndarray,
+            base: int | float = 0,
+            color: str = 'blue',
+            width: int | float = 1,
+            fill: str | None = None
+    ) -> StripModel:
+        """
+        Добавление ряда трапеций одним элементом
+
+        :param x_edges: границы трапеций (n + 1 значение)
+        :param heights: значения на границах (n + 1 значение)
+        :param base: основание трапеций по y
+        :return: элемент графика
+        """
+        if len(heights) != len(x_edges):
+            raise ValueError("Число значений должно совпадать с числом границ")
+        return self._add_strip("trapezoid", x_edges, heights, base, color, width, fill)
+
     def add_mesh(
             self,
             vertexes: list[list[float]],
@@ -175,7 +389,8 @@ class GraphicBuilder:
             shader: str = "normalColor"
     ) -> None:
         self.graphs.append(
-            MeshModel(
+            self._item(
+                MeshModel,
                 vertexes=vertexes,
                 faces=faces,
                 shader=shader
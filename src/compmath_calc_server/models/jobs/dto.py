@@ -0,0 +1,38 @@
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    ERROR = "error"
+    CANCELLED = "cancelled"
+
+
+class InputJobModel(BaseModel):
+    method: str
+    params: dict[str, Any]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "method": "slat/sim",
+                "params": {
+                    "a_matrix": [[10, 1, 1], [2, 10, 1], [2, 2, 10]],
+                    "b_vector": [12, 13, 14],
+                    "eps": 0.001,
+                    "iters_limit": 100
+                }
+            }
+        }
+
+
+class OutputJobModel(BaseModel):
+    job_id: str
+    method: str
+    status: JobStatus
+    error: str | None = None
+    result: Any = None
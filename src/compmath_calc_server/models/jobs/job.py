@@ -0,0 +1,309 @@
+import json
+import logging
+import os
+import time
+from collections import deque
+from functools import partial
+from typing import Any, Callable
+from uuid import UUID, uuid4
+
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+
+from compmath_calc_server.config import load_config
+from compmath_calc_server.exceptions import APIError, BadRequest, NotFound
+from compmath_calc_server.models.aif.dto import InputAIFModel, InputInterpModel
+from compmath_calc_server.models.jobs.dto import InputJobModel, JobStatus, OutputJobModel
+from compmath_calc_server.models.ni.dto import InputNIModel, InputNInterModel
+from compmath_calc_server.models.nonlinear.dto import InputNonLinearModel, InputRootsModel
+from compmath_calc_server.models.slat.dto import InputSLATModel
+from compmath_calc_server.models.sne.dto import InputSNEModel
+from compmath_calc_server.utils.lazy import lazy_import
+from compmath_calc_server.utils.progress import reporting
+from compmath_calc_server.utils.serialization import jsonable
+from compmath_calc_server.views import (
+    AIFResponse,
+    InterpResponse,
+    NIResponse,
+    NInterResponse,
+    NonLinearResponse,
+    RootsResponse,
+    SLATResponse,
+    SNEResponse
+)
+
+config = load_config()
+
+alsm = lazy_import("compmath_calc_server.models.aif.alsm")
+interspline = lazy_import("compmath_calc_server.models.aif.interspline")
+lrm = lazy_import("compmath_calc_server.models.ni.lrm")
+mrm = lazy_import("compmath_calc_server.models.ni.mrm")
+rrm = lazy_import("compmath_calc_server.models.ni.rrm")
+sm1 = lazy_import("compmath_calc_server.models.ni.sm1")
+sm2 = lazy_import("compmath_calc_server.models.ni.sm2")
+tm = lazy_import("compmath_calc_server.models.ni.tm")
+intermediate = lazy_import("compmath_calc_server.models.ni.intermediate")
+slat_sim = lazy_import("compmath_calc_server.models.slat.sim")
+slat_zm = lazy_import("compmath_calc_server.models.slat.zm")
+slat_gm = lazy_import("compmath_calc_server.models.slat.gm")
+sne_sim = lazy_import("compmath_calc_server.models.sne.sim")
+sne_ntm = lazy_import("compmath_calc_server.models.sne.ntm")
+sne_zm = lazy_import("compmath_calc_server.models.sne.zm")
+nonlinear_hdm = lazy_import("compmath_calc_server.models.nonlinear.hdm")
+nonlinear_mcs = lazy_import("compmath_calc_server.models.nonlinear.mcs")
+nonlinear_mcs_one = lazy_import("compmath_calc_server.models.nonlinear.mcs_one")
+nonlinear_mcs_two = lazy_import("compmath_calc_server.models.nonlinear.mcs_two")
+nonlinear_ntm = lazy_import("compmath_calc_server.models.nonlinear.ntm")
+nonlinear_sim = lazy_import("compmath_calc_server.models.nonlinear.sim")
+nonlinear_roots = lazy_import("compmath_calc_server.models.nonlinear.roots")
+
+# Метод задачи: модель входных данных, функция расчета, представление результата
+METHODS: dict[str, tuple[type[BaseModel], Callable[[Any], Any], type[BaseModel]]] = {
+    "aif/alsm": (InputAIFModel, partial(alsm.calc, max_points=config.SCATTER_MAX_POINTS), AIFResponse),
+    "aif/interp": (InputInterpModel, partial(interspline.calc, max_points=config.SCATTER_MAX_POINTS), InterpResponse),
+    "ni/lrm": (InputNIModel, lrm.calc, NIResponse),
+    "ni/mrm": (InputNIModel, mrm.calc, NIResponse),
+    "ni/rrm": (InputNIModel, rrm.calc, NIResponse),
+    "ni/sm1": (InputNIModel, sm1.calc, NIResponse),
+    "ni/sm2": (InputNIModel, sm2.calc, NIResponse),
+    "ni/tm": (InputNIModel, tm.calc, NIResponse),
+    "ni/intermediate": (InputNInterModel, intermediate.calc, NInterResponse),
+    "slat/sim": (InputSLATModel, slat_sim.calc, SLATResponse),
+    "slat/zm": (InputSLATModel, slat_zm.calc, SLATResponse),
+    "slat/gm": (InputSLATModel, slat_gm.calc, SLATResponse),
+    "sne/sim": (InputSNEModel, sne_sim.calc, SNEResponse),
+    "sne/ntm": (InputSNEModel, sne_ntm.calc, SNEResponse),
+    "sne/zm": (InputSNEModel, sne_zm.calc, SNEResponse),
+    "nonlinear/hdm": (InputNonLinearModel, nonlinear_hdm.calc, NonLinearResponse),
+    "nonlinear/mcs": (InputNonLinearModel, nonlinear_mcs.calc, NonLinearResponse),
+    "nonlinear/mcs_one": (InputNonLinearModel, nonlinear_mcs_one.calc, NonLinearResponse),
+    "nonlinear/mcs_two": (InputNonLinearModel, nonlinear_mcs_two.calc, NonLinearResponse),
+    "nonlinear/ntm": (InputNonLinearModel, nonlinear_ntm.calc, NonLinearResponse),
+    "nonlinear/sim": (InputNonLinearModel, nonlinear_sim.calc, NonLinearResponse),
+    "nonlinear/roots": (InputRootsModel, nonlinear_roots.calc, RootsResponse),
+}
+
+FINAL_STATUSES = (JobStatus.DONE, JobStatus.ERROR, JobStatus.CANCELLED)
+
+# Не чаще одного события о ходе расчета за интервал (секунды)
+PROGRESS_INTERVAL = 0.2
+
+# Строки таблицы в одном событии; остальные доступны в итоговом результате
+PROGRESS_ROWS = 100
+
+
+class JobCancelled(Exception):
+    ...
+
+
+class JobStore:
+    """
+    Хранилище задач в файлах
+
+    Задача выполняется в процессе пула, а события о ходе расчета и отмену
+    может запросить любой воркер gunicorn, поэтому состояние задачи хранится
+    в общем каталоге:
+
+    - <id>.json - статус задачи
+    - <id>.events - события о ходе расчета, по одному JSON в строке
+    - <id>.result.json - результат
+    - <id>.cancel - признак запрошенной отмены
+    """
+
+    def __init__(self, path: str, ttl: int):
+        self.path = path
+        self.ttl = ttl
+
+    def _file(self, job_id: str, suffix: str) -> str:
+        try:
+            job_id = UUID(job_id).hex
+        except ValueError:
+            raise NotFound("Задача не найдена")
+        return os.path.join(self.path, f"{job_id}{suffix}")
+
+    def create(self, method: str) -> str:
+        os.makedirs(self.path, exist_ok=True)
+        self.cleanup()
+
+        job_id = uuid4().hex
+        open(self._file(job_id, ".events"), "w").close()
+        self.save(OutputJobModel(job_id=job_id, method=method, status=JobStatus.PENDING))
+        return job_id
+
+    def get(self, job_id: str) -> OutputJobModel:
+        try:
+            with open(self._file(job_id, ".json"), encoding="utf-8") as file:
+                job = OutputJobModel.model_validate_json(file.read())
+        except FileNotFoundError:
+            raise NotFound("Задача не найдена")
+
+        if job.status == JobStatus.DONE:
+            with open(self._file(job_id, ".result.json"), encoding="utf-8") as file:
+                job.result = json.load(file)
+        return job
+
+    def save(self, job: OutputJobModel) -> None:
+        filename = self._file(job.job_id, ".json")
+        temp_filename = f"{filename}.{os.getpid()}.tmp"
+        with open(temp_filename, "w", encoding="utf-8") as file:
+            file.write(job.model_dump_json(exclude={"result"}))
+        os.replace(temp_filename, filename)
+
+    def set_status(self, job_id: str, status: JobStatus, error: str | None = None, result: Any = None) -> None:
+        job = self.get(job_id)
+        if result is not None:
+            with open(self._file(job_id, ".result.json"), "w", encoding="utf-8") as file:
+                json.dump(result, file)
+
+        job.status = status
+        job.error = error
+        self.save(job)
+
+        event = {"type": status.value}
+        if error is not None:
+            event["error"] = error
+        self.append_event(job_id, event)
+
+    def append_event(self, job_id: str, event: dict[str, Any]) -> None:
+        line = json.dumps(event, default=float) + "\n"
+        with open(self._file(job_id, ".events"), "a", encoding="utf-8") as file:
+            file.write(line)
+
+    def read_events(self, job_id: str, position: int = 0) -> tuple[list[dict[str, Any]], int]:
+        """
+        Чтение событий, добавленных после позиции position
+
+        :param job_id: идентификатор задачи
+        :param position: смещение в файле событий
+        :return: события и новое смещение
+        """
+        try:
+            with open(self._file(job_id, ".events"), "rb") as file:
+                file.seek(position)
+                data = file.read()
+        except FileNotFoundError:
+            raise NotFound("Задача не найдена")
+
+        # Последняя строка может быть записана не полностью
+        cut = data.rfind(b"\n") + 1
+        events = [json.loads(line) for line in data[:cut].splitlines() if line]
+        return events, position + cut
+
+    def cancel(self, job_id: str) -> OutputJobModel:
+        job = self.get(job_id)
+        if job.status not in FINAL_STATUSES:
+            open(self._file(job_id, ".cancel"), "w").close()
+        return job
+
+    def is_cancelled(self, job_id: str) -> bool:
+        return os.path.exists(self._file(job_id, ".cancel"))
+
+    def cleanup(self) -> None:
+        """
+        Удаление файлов задач, которые не изменялись дольше ttl секунд
+        """
+        deadline = time.time() - self.ttl
+        for entry in os.scandir(self.path):
+            try:
+                if entry.is_file() and entry.stat().st_mtime < deadline:
+                    os.remove(entry.path)
+            except FileNotFoundError:
+                continue
+
+
+class JobReporter:
+    """
+    Обработчик сообщений о ходе расчета задачи
+
+    Сообщения приходят на каждой итерации; в файл событий записывается
+    последнее из них (со строками таблицы, накопленными с предыдущей записи)
+    не чаще раза в PROGRESS_INTERVAL секунд. При той же записи проверяется
+    запрос отмены.
+    """
+
+    def __init__(self, store: JobStore, job_id: str):
+        self.store = store
+        self.job_id = job_id
+
+        self._last = None
+        self._rows = deque(maxlen=PROGRESS_ROWS)
+        self._written = 0.0
+
+    def __call__(self, event: dict[str, Any]) -> None:
+        row = event.pop("row", None)
+        if row is not None:
+            self._rows.append(row)
+        self._last = event
+
+        if time.monotonic() - self._written >= PROGRESS_INTERVAL:
+            self.flush()
+            if self.store.is_cancelled(self.job_id):
+                raise JobCancelled()
+
+    def flush(self) -> None:
+        if self._last is None:
+            return
+        self.store.append_event(self.job_id, {"type": "progress", **self._last, "rows": list(self._rows)})
+        self._last = None
+        self._rows.clear()
+        self._written = time.monotonic()
+
+
+def submit(store: JobStore, data: InputJobModel) -> tuple[OutputJobModel, BaseModel]:
+    """
+    Создание задачи
+
+    :param store: хранилище задач
+    :param data: метод и его входные данные
+    :return: задача и проверенные входные данные
+    """
+    if data.method not in METHODS:
+        raise BadRequest(f"Неизвестный метод: {data.method}")
+
+    input_model = METHODS[data.method][0]
+    try:
+        params = input_model.model_validate(data.params)
+    except ValidationError as error:
+        raise RequestValidationError([
+            {**item, "loc": ("body", "params", *item["loc"])} for item in error.errors()
+        ])
+
+    job_id = store.create(data.method)
+    return store.get(job_id), params
+
+
+def run(path: str, ttl: int, job_id: str, method: str, params: BaseModel) -> None:
+    """
+    Выполнение задачи (в процессе пула)
+
+    :param path: каталог хранилища задач
+    :param ttl: время хранения задач
+    :param job_id: идентификатор задачи
+    :param method: метод
+    :param params: входные данные метода
+    """
+    store = JobStore(path, ttl)
+    if store.is_cancelled(job_id):
+        store.set_status(job_id, JobStatus.CANCELLED)
+        return
+
+    _, calc, view = METHODS[method]
+    store.set_status(job_id, JobStatus.RUNNING)
+    reporter = JobReporter(store, job_id)
+
+    try:
+        with reporting(reporter):
+            content = calc(params)
+        reporter.flush()
+    except JobCancelled:
+        store.set_status(job_id, JobStatus.CANCELLED)
+        return
+    except APIError as error:
+        store.set_status(job_id, JobStatus.ERROR, error=error.message)
+        return
+    except Exception as error:
+        logging.exception(error)
+        store.set_status(job_id, JobStatus.ERROR, error="Внутренняя ошибка расчета")
+        return
+
+    store.set_status(job_id, JobStatus.DONE, result=jsonable(view, content))
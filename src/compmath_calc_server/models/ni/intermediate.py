@@ -1,8 +1,8 @@
 import numpy as np
-from sympy import integrate, sympify, pi
+from sympy import sympify, pi
 
 from compmath.utils.func import make_callable
-from compmath_calc_server.utils.func import arc_length
+from compmath_calc_server.utils.func import arc_length, definite_integral
 from compmath_calc_server.exceptions import BadRequest
 from compmath_calc_server.models import GraphicBuilder
 from compmath_calc_server.models.ni.dto import InputNInterModel, OutputNInterModel
@@ -19,9 +19,9 @@ def calc(data: InputNInterModel) -> OutputNInterModel:
     if a > b:
         raise BadRequest("Левая граница интервала не может быть больше правой")
 
-    reference_result = integrate(fx, ('x', a, b)).evalf()
+    reference_result = definite_integral(fx, a, b)
     surface_area_value = surface_area(fx_str, a, b, 'x')
-    volume = (pi * integrate(fx ** 2, ('x', a, b))).evalf()
+    volume = (pi * definite_integral(fx ** 2, a, b)).evalf()
     arc_length_value = arc_length(fx_str, a, b, 'x')
 
     # Границы по переменной v
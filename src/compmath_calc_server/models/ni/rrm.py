@@ -1,16 +1,20 @@
 from collections import deque
 
-from sympy import integrate, sympify
+import numpy as np
 
 from compmath_calc_server.models.ni.dto import TableRow
-from compmath_calc_server.utils.func import make_callable
+from compmath_calc_server.utils.func import make_callable, definite_integral
 from compmath_calc_server.exceptions import BadRequest
 from compmath_calc_server.models import GraphicBuilder
+from compmath_calc_server.models.graphic import STRIP_MAX_ITEMS
 from compmath_calc_server.models.ni.dto import InputNIModel, OutputNIModel
+from compmath_calc_server.utils.metrics import stage
+from compmath_calc_server.utils.progress import report
 
 
 def calc(data: InputNIModel) -> OutputNIModel:
-    function = make_callable(data.fx)
+    with stage("parse"):
+        function = make_callable(data.fx)
     a = data.a
     b = data.b
     n = data.intervals
@@ -20,41 +24,53 @@ def calc(data: InputNIModel) -> OutputNIModel:
     if a > b:
         raise BadRequest("Левая граница интервала не может быть больше правой")
 
-    graphic = GraphicBuilder(x_limits=x_limits, y_limits=y_limits)
-    graphic.add_graph(function)
-    graphic.add_graph(lambda x: 0, width=2)
-    graphic.add_graph(fy=lambda y: a, width=2, y_limits=(function(a), 0))
-    graphic.add_graph(fy=lambda y: b, width=2, y_limits=(function(b), 0))
-
-    rows = deque(maxlen=1000)
-
-    h = (b - a) / n
-    result = 0
-    for i in range(n):
-        x = a + i * h
-        y = function(x + h)
-        s = y * h
-        result += s
-
-        if n <= 100:
-            graphic.add_rect(x, y, x + h, 0, color="red")
-
-        if n <= 1000 or i == 0 or i == n - 1:
-            rows.append(TableRow(num=i, x=x, y=y, value=s))
-
-    graphic.add_graph(
-        function,
-        x_limits=(a, b),
-        width=2,
-        fill="red" if n > 100 else None
-    )
+    with stage("plot"):
+        graphic = GraphicBuilder(x_limits=x_limits, y_limits=y_limits)
+        graphic.add_graph(function)
+        graphic.add_graph(lambda x: 0, width=2)
+        graphic.add_graph(fy=lambda y: a, width=2, y_limits=(function(a), 0))
+        graphic.add_graph(fy=lambda y: b, width=2, y_limits=(function(b), 0))
+
+    with stage("compute"):
+        rows = deque(maxlen=1000)
+
+        h = (b - a) / n
+        result = 0
+        heights = []
+        for i in range(n):
+            x = a + i * h
+            y = function(x + h)
+            s = y * h
+            result += s
+
+            if n <= STRIP_MAX_ITEMS:
+                heights.append(y)
 
-    reference_result = integrate(sympify(data.fx), ('x', a, b)).evalf()
+            if n <= 1000 or i == 0 or i == n - 1:
+                rows.append(TableRow(num=i, x=x, y=y, value=s))
+
+            report(iteration=i + 1, total=n, value=result)
+
+    with stage("plot"):
+        if heights:
+            graphic.add_rect_strip(a + h * np.arange(n + 1), heights, color="red")
+        graphic.add_graph(
+            function,
+            x_limits=(a, b),
+            width=2,
+            fill="red" if n > STRIP_MAX_ITEMS else None
+        )
+
+    with stage("reference"):
+        reference_result = definite_integral(data.fx, a, b)
     abs_delta = abs(reference_result - result)
     relative_delta = abs(abs_delta / reference_result) * 100
 
+    with stage("plot"):
+        graphic_items = graphic.build()
+
     return OutputNIModel(
-        graphic_items=graphic.build(),
+        graphic_items=graphic_items,
         table=list(rows),
         result=result,
         abs_delta=abs_delta,
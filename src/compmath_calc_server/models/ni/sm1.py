@@ -1,13 +1,14 @@
-from sympy import integrate, sympify
-
-from compmath_calc_server.utils.func import make_callable
+from compmath_calc_server.utils.func import make_callable, definite_integral
 from compmath_calc_server.exceptions import BadRequest
 from compmath_calc_server.models import GraphicBuilder
 from compmath_calc_server.models.ni.dto import OutputNIModel, InputNIModel
+from compmath_calc_server.utils.metrics import stage
+from compmath_calc_server.utils.progress import report
 
 
 def calc(data: InputNIModel) -> OutputNIModel:
-    function = make_callable(data.fx)
+    with stage("parse"):
+        function = make_callable(data.fx)
     a = data.a
     b = data.b
     n = data.intervals
@@ -17,24 +18,31 @@ def calc(data: InputNIModel) -> OutputNIModel:
     if a > b:
         raise BadRequest("Левая граница интервала не может быть больше правой")
 
-    graphic = GraphicBuilder(x_limits=x_limits, y_limits=y_limits)
-    graphic.add_graph(function)
-    graphic.add_graph(lambda x: 0, width=2, x_limits=(a, b))
-    graphic.add_graph(fy=lambda y: a, width=2, y_limits=(function(a), 0))
-    graphic.add_graph(fy=lambda y: b, width=2, y_limits=(function(b), 0))
-
-    h = (b - a) / n
-    s = (function(b) - function(a)) / 2
-    for i in range(n):
-        s += function(a + h * i) + 2 * function(a + i * h + h / 2)
-    result = s * (h / 3)
-
-    reference_result = integrate(sympify(data.fx), ('x', a, b)).evalf()
+    with stage("plot"):
+        graphic = GraphicBuilder(x_limits=x_limits, y_limits=y_limits)
+        graphic.add_graph(function)
+        graphic.add_graph(lambda x: 0, width=2, x_limits=(a, b))
+        graphic.add_graph(fy=lambda y: a, width=2, y_limits=(function(a), 0))
+        graphic.add_graph(fy=lambda y: b, width=2, y_limits=(function(b), 0))
+
+    with stage("compute"):
+        h = (b - a) / n
+        s = (function(b) - function(a)) / 2
+        for i in range(n):
+            s += function(a + h * i) + 2 * function(a + i * h + h / 2)
+            report(iteration=i + 1, total=n)
+        result = s * (h / 3)
+
+    with stage("reference"):
+        reference_result = definite_integral(data.fx, a, b)
     abs_delta = abs(reference_result - result)
     relative_delta = abs(abs_delta / reference_result) * 100
 
+    with stage("plot"):
+        graphic_items = graphic.build()
+
     return OutputNIModel(
-        graphic_items=graphic.build(),
+        graphic_items=graphic_items,
         table=[],
         result=result,
         abs_delta=abs_delta,
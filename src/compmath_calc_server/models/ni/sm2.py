@@ -1,13 +1,14 @@
-from sympy import integrate, sympify
-
-from compmath_calc_server.utils.func import make_callable
+from compmath_calc_server.utils.func import make_callable, definite_integral
 from compmath_calc_server.exceptions import BadRequest
 from compmath_calc_server.models import GraphicBuilder
 from compmath_calc_server.models.ni.dto import OutputNIModel, InputNIModel
+from compmath_calc_server.utils.metrics import stage
+from compmath_calc_server.utils.progress import report
 
 
 def calc(data: InputNIModel) -> OutputNIModel:
-    function = make_callable(data.fx)
+    with stage("parse"):
+        function = make_callable(data.fx)
     a = data.a
     b = data.b
     n = data.intervals
@@ -17,29 +18,36 @@ def calc(data: InputNIModel) -> OutputNIModel:
     if a > b:
         raise BadRequest("Левая граница интервала не может быть больше правой")
 
-    graphic = GraphicBuilder(x_limits=x_limits, y_limits=y_limits)
-    graphic.add_graph(function)
-    graphic.add_graph(lambda x: 0, width=2, x_limits=(a, b))
-    graphic.add_graph(fy=lambda y: a, width=2, y_limits=(function(a), 0))
-    graphic.add_graph(fy=lambda y: b, width=2, y_limits=(function(b), 0))
-
-    h = (b - a) / (2 * n)
-    sum1 = 0
-    sum2 = 0
-    for i in range(2 * n):
-        if i % 2 != 0:
-            sum1 += function(a + i * h)
-        elif i != 0:
-            sum2 += function(a + i * h)
-
-    result = h / 3 * (function(a) + 4 * sum1 + 2 * sum2 + function(b))
-
-    reference_result = integrate(sympify(data.fx), ('x', a, b)).evalf()
+    with stage("plot"):
+        graphic = GraphicBuilder(x_limits=x_limits, y_limits=y_limits)
+        graphic.add_graph(function)
+        graphic.add_graph(lambda x: 0, width=2, x_limits=(a, b))
+        graphic.add_graph(fy=lambda y: a, width=2, y_limits=(function(a), 0))
+        graphic.add_graph(fy=lambda y: b, width=2, y_limits=(function(b), 0))
+
+    with stage("compute"):
+        h = (b - a) / (2 * n)
+        sum1 = 0
+        sum2 = 0
+        for i in range(2 * n):
+            if i % 2 != 0:
+                sum1 += function(a + i * h)
+            elif i != 0:
+                sum2 += function(a + i * h)
+            report(iteration=i + 1, total=2 * n)
+
+        result = h / 3 * (function(a) + 4 * sum1 + 2 * sum2 + function(b))
+
+    with stage("reference"):
+        reference_result = definite_integral(data.fx, a, b)
     abs_delta = abs(reference_result - result)
     relative_delta = abs(abs_delta / reference_result) * 100
 
+    with stage("plot"):
+        graphic_items = graphic.build()
+
     return OutputNIModel(
-        graphic_items=graphic.build(),
+        graphic_items=graphic_items,
         table=[],
         result=result,
         abs_delta=abs_delta,
@@ -0,0 +1,40 @@
+from pydantic import BaseModel
+from compmath_calc_server.models.graphic import GraphicItem
+
+
+class InputNonLinearModel(BaseModel):
+    fx: str
+    interval: tuple[float, float]
+    eps: float
+    iters_limit: int
+    x_limits: tuple[float, float]
+    y_limits: tuple[float, float]
+
+
+class InputRootsModel(InputNonLinearModel):
+    grid: int = 10000
+
+
+class TableRow(BaseModel):
+    iter_num: int
+    x: float | None
+    fx: float | None
+    a: float | None = None
+    fa: float | None = None
+    b: float | None = None
+    fb: float | None = None
+    distance: float | None = None
+
+
+class OutputNonLinearModel(BaseModel):
+    graphic_items: list[GraphicItem]
+    table: list[TableRow]
+    result: float | None
+    iters: int
+
+
+class OutputRootsModel(BaseModel):
+    graphic_items: list[GraphicItem]
+    table: list[TableRow]
+    roots: list[float]
+    iters: int
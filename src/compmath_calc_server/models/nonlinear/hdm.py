@@ -0,0 +1,23 @@
+from compmath_calc_server.models.nonlinear.dto import InputNonLinearModel, OutputNonLinearModel
+from compmath_calc_server.models.nonlinear.utils import parse, check_bracket, log_row, output
+
+
+def calc(data: InputNonLinearModel) -> OutputNonLinearModel:
+    """
+    Метод половинного деления
+    """
+    function = parse(data)
+    a, b = data.interval
+    check_bracket(function, a, b)
+
+    table = []
+    while abs(a - b) > data.eps and len(table) < data.iters_limit:
+        x = (a + b) / 2
+        log_row(table, x=x, fx=function(x), a=a, fa=function(a), b=b, fb=function(b), distance=abs(a - b))
+
+        if function(a) * function(x) < 0:
+            b = x
+        else:
+            a = x
+
+    return output(data, function, table, (a + b) / 2)
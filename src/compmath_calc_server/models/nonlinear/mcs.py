@@ -0,0 +1,30 @@
+from compmath_calc_server.models.nonlinear.dto import InputNonLinearModel, OutputNonLinearModel
+from compmath_calc_server.models.nonlinear.utils import parse, check_bracket, secant_step, log_row, output
+
+
+def calc(data: InputNonLinearModel) -> OutputNonLinearModel:
+    """
+    Метод хорд
+    """
+    function = parse(data)
+    a, b = data.interval
+    check_bracket(function, a, b)
+
+    table = []
+    x = None
+    while abs(a - b) > data.eps and len(table) < data.iters_limit:
+        x = secant_step(function, a, b)
+        log_row(table, x=x, fx=function(x), a=a, fa=function(a), b=b, fb=function(b), distance=abs(a - b))
+
+        if function(x) == 0:
+            break
+
+        if function(a) * function(x) < 0:
+            b = x
+        else:
+            a = x
+
+        if abs(function(x)) < data.eps:
+            break
+
+    return output(data, function, table, x)
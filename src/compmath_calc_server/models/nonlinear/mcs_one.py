@@ -0,0 +1,27 @@
+from compmath_calc_server.models.nonlinear.dto import InputNonLinearModel, OutputNonLinearModel
+from compmath_calc_server.models.nonlinear.utils import parse, check_bracket, secant_step, log_row, output
+from compmath_calc_server.utils.func import differentiate
+
+
+def calc(data: InputNonLinearModel) -> OutputNonLinearModel:
+    """
+    Метод секущих (одношаговый): неподвижный конец c выбирается по знаку f''
+    """
+    function = parse(data)
+    a, b = data.interval
+    check_bracket(function, a, b)
+
+    if differentiate(data.fx).d2f(a) * function(a) > 0:
+        c, x = b, a
+    else:
+        c, x = a, b
+
+    table = []
+    while True:
+        x = secant_step(function, x, c)
+        log_row(table, x=x, fx=function(x), a=a, fa=function(a), b=b, fb=function(b), distance=abs(a - b))
+
+        if abs(function(x)) <= data.eps or len(table) >= data.iters_limit:
+            break
+
+    return output(data, function, table, x)
@@ -0,0 +1,21 @@
+from compmath_calc_server.models.nonlinear.dto import InputNonLinearModel, OutputNonLinearModel
+from compmath_calc_server.models.nonlinear.utils import parse, secant_step, log_row, output
+
+
+def calc(data: InputNonLinearModel) -> OutputNonLinearModel:
+    """
+    Метод секущих (двухшаговый)
+    """
+    function = parse(data)
+    a, b = data.interval
+
+    table = []
+    while True:
+        x = secant_step(function, b, a)
+        a, b = b, x
+        log_row(table, x=x, fx=function(x), a=a, fa=function(a), b=b, fb=function(b), distance=abs(a - b))
+
+        if abs(b - a) <= data.eps or len(table) > data.iters_limit:
+            break
+
+    return output(data, function, table, x)
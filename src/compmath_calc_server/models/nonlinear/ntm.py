@@ -0,0 +1,31 @@
+from compmath_calc_server.exceptions import BadRequest
+from compmath_calc_server.models.nonlinear.dto import InputNonLinearModel, OutputNonLinearModel
+from compmath_calc_server.models.nonlinear.utils import parse, check_bracket, log_row, output
+from compmath_calc_server.utils.func import differentiate
+
+
+def calc(data: InputNonLinearModel) -> OutputNonLinearModel:
+    """
+    Метод Ньютона (касательных)
+    """
+    function = parse(data)
+    derivatives = differentiate(data.fx)
+    a, b = data.interval
+    check_bracket(function, a, b)
+
+    x = a if function(a) * derivatives.d2f(a) > 0 else b
+
+    table = []
+    while True:
+        slope = float(derivatives.df(x))
+        if slope == 0:
+            raise BadRequest(f"Производная равна нулю в точке {x}")
+
+        h = - function(x) / slope
+        x += h
+        log_row(table, x=x, fx=function(x), a=a, fa=function(a), b=b, fb=function(b), distance=abs(a - b))
+
+        if abs(h) <= data.eps or len(table) >= data.iters_limit:
+            break
+
+    return output(data, function, table, x)
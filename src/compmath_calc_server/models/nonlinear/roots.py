@@ -0,0 +1,89 @@
+import numpy as np
+
+from compmath_calc_server.exceptions import BadRequest
+from compmath_calc_server.models import GraphicBuilder
+from compmath_calc_server.models.graphic import sample_function
+from compmath_calc_server.models.nonlinear.dto import InputRootsModel, OutputRootsModel, TableRow
+from compmath_calc_server.models.nonlinear.utils import parse
+from compmath_calc_server.utils.progress import is_reporting, report
+
+# Наибольшее число узлов сетки поиска
+GRID_MAX = 1_000_000
+
+
+def calc(data: InputRootsModel) -> OutputRootsModel:
+    """
+    Поиск всех корней на интервале
+
+    Функция вычисляется на равномерной сетке; каждый отрезок сетки со сменой
+    знака уточняется половинным делением, причем все отрезки делятся
+    одновременно (одно векторное вычисление функции на итерацию).
+    Смена знака на разрыве (например, tan(x) в pi/2) корнем не считается:
+    у корня |f| в найденной точке не больше, чем на концах отрезка сетки.
+    """
+    function = parse(data)
+    a, b = data.interval
+
+    if not 0 < data.grid <= GRID_MAX:
+        raise BadRequest(f"Число узлов сетки должно быть от 1 до {GRID_MAX}")
+
+    x = np.linspace(a, b, data.grid + 1)
+    y = sample_function(function, x)
+
+    with np.errstate(invalid="ignore"):
+        brackets = np.flatnonzero(y[:-1] * y[1:] < 0)
+    left, right = x[brackets], x[brackets + 1]
+    f_left, f_right = y[brackets], y[brackets + 1]
+    f_bound = np.maximum(np.abs(f_left), np.abs(f_right))
+
+    iters = 0
+    while len(left) and iters < data.iters_limit and np.max(right - left) > data.eps:
+        iters += 1
+        middle = (left + right) / 2
+        f_middle = sample_function(function, middle)
+        same = np.sign(f_middle) == np.sign(f_left)
+        left, f_left = np.where(same, middle, left), np.where(same, f_middle, f_left)
+        right, f_right = np.where(same, right, middle), np.where(same, f_right, f_middle)
+        if is_reporting():
+            report(iteration=iters, total=data.iters_limit, delta=float(np.max(right - left)))
+
+    roots = (left + right) / 2
+    f_roots = sample_function(function, roots)
+    with np.errstate(invalid="ignore"):
+        is_root = np.abs(f_roots) <= f_bound
+
+    # Корни в узлах сетки
+    exact = np.flatnonzero(y == 0)
+
+    root_x = np.concatenate((roots[is_root], x[exact]))
+    root_f = np.concatenate((f_roots[is_root], y[exact]))
+    root_a = np.concatenate((left[is_root], x[exact]))
+    root_b = np.concatenate((right[is_root], x[exact]))
+    root_fa = np.concatenate((f_left[is_root], y[exact]))
+    root_fb = np.concatenate((f_right[is_root], y[exact]))
+    order = np.argsort(root_x)
+
+    table = [
+        TableRow(
+            iter_num=i + 1,
+            x=root_x[j],
+            fx=root_f[j],
+            a=root_a[j],
+            fa=root_fa[j],
+            b=root_b[j],
+            fb=root_fb[j],
+            distance=root_b[j] - root_a[j]
+        )
+        for i, j in enumerate(order.tolist())
+    ]
+
+    graphic = GraphicBuilder(x_limits=data.x_limits, y_limits=data.y_limits)
+    graphic.add_graph(function)
+    graphic.add_scatter(root_x[order], root_f[order], color="red")
+
+    return OutputRootsModel(
+        graphic_items=graphic.build(),
+        table=table,
+        roots=root_x[order].tolist(),
+        iters=iters
+    )
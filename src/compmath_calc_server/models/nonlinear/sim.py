@@ -0,0 +1,32 @@
+import math
+
+from compmath_calc_server.exceptions import BadRequest
+from compmath_calc_server.models.nonlinear.dto import InputNonLinearModel, OutputNonLinearModel
+from compmath_calc_server.models.nonlinear.utils import parse, log_row, output
+
+
+def calc(data: InputNonLinearModel) -> OutputNonLinearModel:
+    """
+    Метод простых итераций x = phi(x), где phi - функция уравнения
+    """
+    function = parse(data)
+    phi = function
+    a, b = data.interval
+
+    if function(a) * function(b) > 0:
+        raise BadRequest("Метод не сходится")
+
+    table = []
+    x = a
+    while True:
+        x0 = x
+        x = phi(x0)
+        if not math.isfinite(x):
+            raise BadRequest(f"Метод расходится на итерации {len(table) + 1}")
+
+        log_row(table, x=x0, fx=x, a=x0, fa=function(a), distance=abs(x - x0))
+
+        if abs(x - x0) <= data.eps or len(table) >= data.iters_limit:
+            break
+
+    return output(data, function, table, x)
@@ -0,0 +1,102 @@
+from typing import Callable
+
+import numpy as np
+
+from compmath_calc_server.exceptions import BadRequest
+from compmath_calc_server.models import GraphicBuilder
+from compmath_calc_server.models.nonlinear.dto import InputNonLinearModel, OutputNonLinearModel, TableRow
+from compmath_calc_server.utils.func import make_callable, FunctionValidateError
+from compmath_calc_server.utils.progress import is_reporting, report
+
+
+def memoize(function: Callable) -> Callable:
+    """
+    Функция с запоминанием значений
+
+    Методы многократно обращаются к f(a), f(b) и f(x) одной итерации;
+    каждая точка вычисляется один раз. Массив аргументов передается
+    функции как есть (векторное вычисление без запоминания).
+    """
+    values: dict[float, float] = {}
+
+    def wrapped(x: float | np.ndarray) -> float | np.ndarray:
+        if isinstance(x, np.ndarray):
+            return function(x)
+
+        x = float(x)
+        try:
+            return values[x]
+        except KeyError:
+            pass
+        try:
+            with np.errstate(all="ignore"):
+                value = float(function(x))
+        except (OverflowError, ZeroDivisionError):
+            value = float("nan")
+        values[x] = value
+        return value
+
+    return wrapped
+
+
+def parse(data: InputNonLinearModel) -> Callable[[float], float]:
+    """
+    Проверка входных данных и функция уравнения
+    """
+    if data.interval[0] >= data.interval[1]:
+        raise BadRequest("Неверный интервал")
+
+    if not 0 < data.eps < 1:
+        raise BadRequest("Неверная точность")
+
+    if data.iters_limit <= 0:
+        raise BadRequest("Неверный параметр ограничения итераций")
+
+    try:
+        return memoize(make_callable(data.fx))
+    except FunctionValidateError:
+        raise BadRequest("Инвалидная функция")
+
+
+def check_bracket(function: Callable[[float], float], a: float, b: float) -> None:
+    if function(a) * function(b) > 0:
+        raise BadRequest("На данном интервале нет корней")
+
+
+def secant_step(function: Callable[[float], float], x: float, c: float) -> float:
+    """
+    Точка пересечения с осью X прямой через (x, f(x)) и (c, f(c))
+    """
+    if function(x) == function(c):
+        raise BadRequest("Метод не применим: значения функции на концах хорды совпадают")
+    return x - function(x) * (x - c) / (function(x) - function(c))
+
+
+def log_row(table: list[TableRow], **values) -> None:
+    """
+    Запись строки таблицы итераций (и события хода расчета)
+    """
+    table.append(TableRow(iter_num=len(table) + 1, **values))
+    if is_reporting():
+        report(iteration=len(table), row=table[-1].model_dump())
+
+
+def output(
+        data: InputNonLinearModel,
+        function: Callable[[float], float],
+        table: list[TableRow],
+        result: float | None
+) -> OutputNonLinearModel:
+    """
+    Результат метода: график функции (общий для всех итераций) и таблица
+
+    Кадры итераций клиент строит сам по строкам таблицы.
+    """
+    graphic = GraphicBuilder(x_limits=data.x_limits, y_limits=data.y_limits)
+    graphic.add_graph(function)
+    return OutputNonLinearModel(
+        graphic_items=graphic.build(),
+        table=table,
+        result=result,
+        iters=len(table)
+    )
@@ -3,6 +3,7 @@ from typing import Sequence
 
 from compmath_calc_server.models.slat.dto import InputSLATModel, TableRow
 from compmath_calc_server.models.slat.utils import is_diagonal_dominance, normalize_matrix
+from compmath_calc_server.utils.progress import is_reporting, report
 
 
 def calc(data: InputSLATModel) -> list[tuple[list[str], list[TableRow], str]]:
@@ -52,6 +53,8 @@ def calc_sim(
                 delta=delta
             )
         )
+        if is_reporting():
+            report(iteration=k, delta=delta, row=table[-1].model_dump())
 
         if delta <= eps or k >= iters_limit:
             break
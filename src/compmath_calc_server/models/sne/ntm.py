@@ -1,13 +1,13 @@
 from typing import cast
 
 import numpy as np
-from sympy import diff
 
-from compmath_calc_server.utils.func import make_callable, solve_rel_var
+from compmath_calc_server.utils.func import make_callable, solve_rel_var, symbolic_diff
 from compmath_calc_server.exceptions import BadRequest
 from compmath_calc_server.models import GraphicBuilder
 from compmath_calc_server.models.sne.dto import InputSNEModel, OutputSNEModel, TableRow
 from compmath_calc_server.utils.func import is_converges, evenly_spaced_elements
+from compmath_calc_server.utils.progress import is_reporting, report
 
 
 def calc(data: InputSNEModel) -> OutputSNEModel:
@@ -45,8 +45,8 @@ def calc(data: InputSNEModel) -> OutputSNEModel:
 
     # Матрица Якоби
     w = [
-        [diff(func_str_1, "x"), diff(func_str_1, "y")],
-        [diff(func_str_2, "x"), diff(func_str_2, "y")]
+        [symbolic_diff(func_str_1, "x"), symbolic_diff(func_str_1, "y")],
+        [symbolic_diff(func_str_2, "x"), symbolic_diff(func_str_2, "y")]
     ]
     x_vector = np.array([0, 0], dtype=float)
 
@@ -80,6 +80,8 @@ def calc(data: InputSNEModel) -> OutputSNEModel:
         delta = np.mean(np.abs(delta_x))
 
         table.append(TableRow(iter_num=k, vector=x_vector, delta=delta))
+        if is_reporting():
+            report(iteration=k, delta=float(delta), row=table[-1].model_dump())
         graphic = GraphicBuilder(x_limits=x_limits, y_limits=y_limits)
         graphic.add_graph(fx=fi_x_y[0], color="blue")
         graphic.add_graph(fy=fi_x_y[1], color="red")
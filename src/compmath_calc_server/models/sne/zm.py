@@ -6,6 +6,7 @@ from compmath_calc_server.exceptions import BadRequest
 from compmath_calc_server.models.graphic import GraphicBuilder
 from compmath_calc_server.utils.func import make_callable, solve_rel_var, is_converges, evenly_spaced_elements
 from compmath_calc_server.models.sne.dto import InputSNEModel, OutputSNEModel, TableRow
+from compmath_calc_server.utils.progress import is_reporting, report
 
 
 def calc(data: InputSNEModel) -> OutputSNEModel:
@@ -56,6 +57,8 @@ def calc(data: InputSNEModel) -> OutputSNEModel:
         delta = np.max(np.abs(x_vector - x0))
 
         table.append(TableRow(iter_num=k,vector=list(x_vector), delta=delta))
+        if is_reporting():
+            report(iteration=k, delta=float(delta), row=table[-1].model_dump())
         graphic = GraphicBuilder(x_limits=x_limits, y_limits=y_limits)
         graphic.add_graph(fx=fi_x_y[0], color="blue")
         graphic.add_graph(fy=fi_x_y[1], color="red")
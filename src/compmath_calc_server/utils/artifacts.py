@@ -0,0 +1,283 @@
+import hashlib
+import logging
+import os
+import pickle
+import sqlite3
+import stat
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+from functools import wraps
+from typing import Any, Callable
+
+from compmath_calc_server.config import load_config
+
+# Записей в кэше процесса (первый уровень)
+LOCAL_ITEMS = 256
+# Обращений, после которых время использования и счетчики записываются в файл
+FLUSH_EVERY = 32
+# Вставок, после которых проверяется переполнение файла
+EVICT_EVERY = 64
+
+
+def check_private(path: str) -> None:
+    """
+    Проверка, что файл или каталог принадлежит текущему пользователю и закрыт для других
+
+    Значения кэша читаются через pickle, поэтому подложенный чужой файл означал бы
+    выполнение чужого кода в сервере расчетов.
+
+    :param path: проверяемый путь (символическая ссылка не допускается)
+    :raises PermissionError: владелец другой пользователь или есть доступ для группы/всех
+    """
+    info = os.lstat(path)
+    if stat.S_ISLNK(info.st_mode):
+        raise PermissionError(f"{path} - символическая ссылка")
+    if hasattr(os, "getuid") and info.st_uid != os.getuid():
+        raise PermissionError(f"{path} принадлежит другому пользователю")
+    if os.name == "posix" and info.st_mode & 0o077:
+        raise PermissionError(f"{path} доступен другим пользователям")
+
+
+def private_file(path: str) -> str:
+    """
+    Подготовка файла в личном каталоге пользователя
+
+    Каталог создается с правами 0700; существующие каталог и файл проверяются
+    (check_private).
+
+    :param path: путь к файлу
+    :return: тот же путь
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    check_private(directory)
+    if os.path.lexists(path):
+        check_private(path)
+    return path
+
+
+class ArtifactStore:
+    """
+    Общий кэш символьных вычислений
+
+    Интегралы, решения и производные sympy дороги, а воркеры gunicorn и процессы
+    пула расчетов не разделяют память, поэтому результаты хранятся в файле SQLite,
+    доступном всем процессам. Перед файлом стоит небольшой LRU процесса.
+
+    Число записей в файле ограничено max_items: при переполнении удаляются
+    давно не использованные. Счетчики попаданий, промахов и вытеснений общие.
+
+    Чтение не пишет в файл: время использования и счетчики копятся в процессе
+    и записываются одной транзакцией раз в FLUSH_EVERY обращений, а переполнение
+    проверяется раз в EVICT_EVERY вставок (файл может ненадолго превысить max_items).
+    Запись, которую не удалось прочитать, считается промахом и удаляется.
+
+    В режиме пула потоков (CALC_PROCESSES=0) к хранилищу обращаются разные
+    потоки: соединение и буферы общие и защищены блокировкой.
+    """
+
+    def __init__(self, path: str, max_items: int):
+        """
+        :param path: файл базы SQLite, пустая строка - только кэш процесса
+        :param max_items: максимальное число записей в файле
+        """
+        self.path = path
+        self.max_items = max_items
+
+        self._local: OrderedDict[str, Any] = OrderedDict()
+        self._connection: sqlite3.Connection | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+
+        self._used: dict[str, float] = {}
+        self._counts: Counter[str] = Counter()
+        self._pending = 0
+        self._inserts = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        # Соединение SQLite нельзя передавать между процессами
+        if self._connection is None or self._pid != os.getpid():
+            self._used.clear()
+            self._counts.clear()
+            self._pending = self._inserts = 0
+
+            private_file(self.path)
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            os.chmod(self.path, 0o600)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS artifacts (key TEXT PRIMARY KEY, value BLOB, used REAL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS artifacts_used ON artifacts (used)")
+            connection.execute("CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER)")
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def _count(self, connection: sqlite3.Connection, name: str, value: int = 1) -> None:
+        self._counts[name] += value
+        self._pending += 1
+        if self._pending >= FLUSH_EVERY:
+            self._flush(connection)
+
+    def _flush(self, connection: sqlite3.Connection) -> None:
+        """
+        Запись накопленных времени использования и счетчиков
+        """
+        if not self._used and not self._counts:
+            return
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany(
+                "UPDATE artifacts SET used = ? WHERE key = ?",
+                [(used, key) for key, used in self._used.items()]
+            )
+            connection.executemany(
+                "INSERT INTO stats (name, value) VALUES (?, ?) ON CONFLICT (name) DO UPDATE SET value = value + ?",
+                [(name, value, value) for name, value in self._counts.items()]
+            )
+            connection.execute("COMMIT")
+        except sqlite3.Error:
+            connection.execute("ROLLBACK")
+            raise
+        finally:
+            self._used.clear()
+            self._counts.clear()
+            self._pending = 0
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._local[key] = value
+        self._local.move_to_end(key)
+        if len(self._local) > LOCAL_ITEMS:
+            self._local.popitem(last=False)
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """
+        :return: признак наличия и значение
+        """
+        with self._lock:
+            return self._get(key)
+
+    def _get(self, key: str) -> tuple[bool, Any]:
+        if key in self._local:
+            self._local.move_to_end(key)
+            return True, self._local[key]
+
+        if not self.path:
+            return False, None
+
+        connection = self._connect()
+        row = connection.execute("SELECT value FROM artifacts WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self._count(connection, "misses")
+            return False, None
+
+        try:
+            value = pickle.loads(row[0])
+        except Exception as error:
+            # Поврежденная или несовместимая запись - промах
+            logging.warning(f"Запись общего кэша не прочитана: {error!r}")
+            connection.execute("DELETE FROM artifacts WHERE key = ?", (key,))
+            self._count(connection, "misses")
+            return False, None
+
+        self._used[key] = time.time()
+        self._count(connection, "hits")
+        self._remember(key, value)
+        return True, value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._set(key, value)
+
+    def _set(self, key: str, value: Any) -> None:
+        self._remember(key, value)
+        if not self.path:
+            return
+
+        blob = pickle.dumps(value)
+        connection = self._connect()
+        connection.execute(
+            "INSERT OR REPLACE INTO artifacts (key, value, used) VALUES (?, ?, ?)",
+            (key, blob, time.time())
+        )
+
+        self._inserts += 1
+        if self._inserts % EVICT_EVERY != 1:
+            return
+
+        self._flush(connection)
+        excess = connection.execute("SELECT COUNT(*) FROM artifacts").fetchone()[0] - self.max_items
+        if excess > 0:
+            connection.execute(
+                "DELETE FROM artifacts WHERE key IN (SELECT key FROM artifacts ORDER BY used LIMIT ?)",
+                (excess,)
+            )
+            self._count(connection, "evictions", excess)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Счетчики общего кэша: items, hits, misses, evictions
+        """
+        result = {"items": 0, "hits": 0, "misses": 0, "evictions": 0}
+        if not self.path:
+            return result
+
+        with self._lock:
+            connection = self._connect()
+            self._flush(connection)
+            result.update(connection.execute("SELECT name, value FROM stats").fetchall())
+            result["items"] = connection.execute("SELECT COUNT(*) FROM artifacts").fetchone()[0]
+        return result
+
+
+config = load_config()
+store = ArtifactStore(config.ARTIFACTS_PATH, config.ARTIFACTS_MAX_ITEMS)
+
+
+def _argument_key(value: Any) -> str:
+    # Выражение sympy возможно, только если sympy уже загружен: импортировать его здесь незачем
+    sympy = sys.modules.get("sympy")
+    if sympy is not None and isinstance(value, sympy.Basic):
+        return sympy.srepr(value)
+    return repr(value)
+
+
+def shared_cache(namespace: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Кэширование результата функции в общем кэше
+
+    Ключ - пространство имен, версия сервера и аргументы (выражения sympy
+    учитываются в точной форме srepr). Результат должен допускать pickle.
+    Ошибка кэша не прерывает расчет: значение вычисляется заново.
+
+    :param namespace: имя группы значений, например "integral"
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(func)
+        def wrapper(*args: Any) -> Any:
+            key = hashlib.sha256(
+                "\n".join([namespace, config.VERSION, *map(_argument_key, args)]).encode()
+            ).hexdigest()
+
+            try:
+                found, value = store.get(key)
+                if found:
+                    return value
+            except (sqlite3.Error, OSError) as error:
+                logging.warning(f"Общий кэш недоступен: {error}")
+
+            value = func(*args)
+
+            try:
+                store.set(key, value)
+            except (sqlite3.Error, OSError, pickle.PicklingError, TypeError, AttributeError) as error:
+                logging.warning(f"Не удалось сохранить значение в общий кэш: {error}")
+            return value
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,216 @@
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from compmath_calc_server.utils.metrics import registry
+
+
+def request_key(version: str, path: str, body: bytes) -> str | None:
+    """
+    Ключ запроса: хэш версии сервера, маршрута и нормализованного тела
+
+    Тело приводится к каноническому JSON (сортировка ключей, без пробелов),
+    поэтому запросы, отличающиеся только форматированием, дают один ключ.
+
+    :return: ключ или None, если тело не является JSON
+    """
+    try:
+        data = json.loads(body)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(f"{version}\n{path}\n{canonical}".encode()).hexdigest()
+
+
+class ResponseCache:
+    """
+    Кэш тел ответов
+
+    В памяти процесса - LRU с ограничением суммарного объема и временем жизни
+    записей. Если задан каталог, записи дополнительно сохраняются в файлы
+    <ключ>.json и доступны всем воркерам gunicorn.
+    """
+
+    def __init__(self, max_bytes: int, ttl: int, path: str | None = None):
+        """
+        :param max_bytes: объем кэша в памяти (байты), 0 - без кэша в памяти
+        :param ttl: время жизни записи (секунды)
+        :param path: каталог общего кэша на диске
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.path = path
+
+        self._items: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._size = 0
+
+        if path:
+            os.makedirs(path, exist_ok=True)
+
+    def get(self, key: str) -> bytes | None:
+        item = self._items.get(key)
+        if item is not None:
+            expires, body = item
+            if expires > time.monotonic():
+                self._items.move_to_end(key)
+                return body
+            self._remove(key)
+
+        if not self.path:
+            return None
+
+        filename = os.path.join(self.path, f"{key}.json")
+        try:
+            if os.path.getmtime(filename) + self.ttl < time.time():
+                return None
+            with open(filename, "rb") as file:
+                body = file.read()
+        except FileNotFoundError:
+            return None
+
+        self._put(key, body)
+        return body
+
+    def set(self, key: str, body: bytes) -> None:
+        self._put(key, body)
+
+        if self.path:
+            filename = os.path.join(self.path, f"{key}.json")
+            temp_filename = f"{filename}.{os.getpid()}.tmp"
+            with open(temp_filename, "wb") as file:
+                file.write(body)
+            os.replace(temp_filename, filename)
+
+    def _put(self, key: str, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+
+        if key in self._items:
+            self._remove(key)
+        self._items[key] = (time.monotonic() + self.ttl, body)
+        self._size += len(body)
+
+        while self._size > self.max_bytes:
+            self._remove(next(iter(self._items)))
+
+    def _remove(self, key: str) -> None:
+        _, body = self._items.pop(key)
+        self._size -= len(body)
+
+    def cleanup(self) -> None:
+        """
+        Удаление файлов кэша старше ttl секунд
+        """
+        if not self.path:
+            return
+        deadline = time.time() - self.ttl
+        for entry in os.scandir(self.path):
+            try:
+                if entry.is_file() and entry.stat().st_mtime < deadline:
+                    os.remove(entry.path)
+            except FileNotFoundError:
+                continue
+
+
+class ResponseCacheMiddleware:
+    """
+    Кэширование ответов расчетных обработчиков
+
+    Ответ обработчика .../calculate полностью определяется телом запроса,
+    поэтому повторный запрос с тем же телом отдается из кэша без расчета.
+    ETag ответа - ключ запроса: клиент, приславший его в If-None-Match,
+    получает 304 без тела. Кэшируются только успешные ответы.
+    """
+
+    def __init__(self, app: ASGIApp, cache: ResponseCache, version: str, suffix: str = "/calculate"):
+        self.app = app
+        self.cache = cache
+        self.version = version
+        self.suffix = suffix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST" or not scope["path"].endswith(self.suffix):
+            await self.app(scope, receive, send)
+            return
+
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body", False):
+                break
+
+        async def replay() -> Message:
+            nonlocal body
+            if body is None:
+                return await receive()
+            message, body = {"type": "http.request", "body": body, "more_body": False}, None
+            return message
+
+        key = request_key(self.version, scope["path"], body)
+        if key is None:
+            await self.app(scope, replay, send)
+            return
+
+        etag = f'"{key}"'
+        if etag in Headers(scope=scope).get("if-none-match", ""):
+            registry.inc("compmath_response_cache_requests_total", result="not_modified")
+            await self._send(send, 304, etag, b"")
+            return
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            registry.inc("compmath_response_cache_requests_total", result="hit")
+            await self._send(send, 200, etag, cached, "HIT")
+            return
+        registry.inc("compmath_response_cache_requests_total", result="miss")
+
+        start: Message | None = None
+        chunks: list[bytes] = []
+
+        async def capture(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            response_body = b"".join(chunks)
+            if start["status"] == 200:
+                headers = MutableHeaders(scope=start)
+                headers["ETag"] = etag
+                headers["X-Cache"] = "MISS"
+                try:
+                    self.cache.set(key, response_body)
+                except OSError as error:
+                    logging.warning(f"Не удалось сохранить ответ в кэш: {error}")
+
+            await send(start)
+            await send({"type": "http.response.body", "body": response_body})
+
+        await self.app(scope, replay, capture)
+
+    @staticmethod
+    async def _send(send: Send, status: int, etag: str, body: bytes, cache_status: str | None = None) -> None:
+        headers = [(b"etag", etag.encode())]
+        if status == 200:
+            headers += [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"x-cache", cache_status.encode())
+            ]
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,139 @@
+import gzip
+from typing import Callable
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Тела больше этого размера сжимаются в потоке, чтобы не блокировать цикл событий
+THREAD_SIZE = 64 * 1024
+
+
+def _gzip(body: bytes) -> bytes:
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
+
+def _zstd(body: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=3).compress(body)
+
+
+def available_encodings() -> dict[str, Callable[[bytes], bytes]]:
+    """
+    Поддерживаемые кодировки в порядке предпочтения
+    """
+    encodings = {}
+    if zstandard is not None:
+        encodings["zstd"] = _zstd
+    encodings["gzip"] = _gzip
+    return encodings
+
+
+def negotiate(accept_encoding: str, encodings: dict[str, Callable[[bytes], bytes]]) -> str | None:
+    """
+    Выбор кодировки по заголовку Accept-Encoding
+
+    Из принятых клиентом кодировок (q > 0) выбирается с наибольшим q,
+    при равных - первая в порядке предпочтения сервера.
+
+    :param accept_encoding: значение заголовка, например "gzip;q=0.8, zstd"
+    :param encodings: кодировки сервера
+    :return: имя кодировки или None
+    """
+    weights = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if name:
+            weights[name] = q
+
+    best, best_q = None, 0.0
+    for name in encodings:
+        q = weights.get(name, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+class CompressionMiddleware:
+    """
+    Сжатие ответов (zstd, gzip) по заголовку Accept-Encoding
+
+    Сжимаются ответы не меньше minimum_size байт; потоки событий
+    (text/event-stream) и уже сжатые ответы передаются как есть.
+    ETag сжатого ответа становится слабым (W/"..."): представление то же,
+    кодировка другая, поэтому If-None-Match по-прежнему дает 304.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = available_encodings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        chunks: list[bytes] = []
+        passthrough = False
+
+        async def compress(message: Message) -> None:
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                passthrough = (
+                    "content-encoding" in headers
+                    or headers.get("content-type", "").startswith("text/event-stream")
+                )
+                if passthrough:
+                    await send(message)
+                else:
+                    start = message
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(chunks)
+            if len(body) >= self.minimum_size:
+                encoder = self.encodings[encoding]
+                if len(body) > THREAD_SIZE:
+                    body = await anyio.to_thread.run_sync(encoder, body)
+                else:
+                    body = encoder(body)
+
+                headers = MutableHeaders(scope=start)
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                headers.add_vary_header("Accept-Encoding")
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["ETag"] = f"W/{etag}"
+
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, compress)
@@ -0,0 +1,46 @@
+import numpy as np
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Прореживание точек алгоритмом Largest-Triangle-Three-Buckets
+
+    Точки делятся на threshold - 2 корзины по x; из каждой корзины берется точка,
+    образующая треугольник наибольшей площади с выбранной точкой предыдущей корзины
+    и центром следующей. Первая и последняя точки сохраняются, поэтому
+    форма облака и выбросы остаются видны.
+
+    :param x: вектор аргументов, отсортированный по возрастанию
+    :param y: вектор значений
+    :param threshold: число точек после прореживания
+    :return: прореженные векторы (x, y)
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return x, y
+
+    # Границы корзин для внутренних точек [1, n - 1)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    centers_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / np.diff(edges)
+    centers_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / np.diff(edges)
+    centers_x = np.append(centers_x[1:], x[-1])
+    centers_y = np.append(centers_y[1:], y[-1])
+
+    selected = np.empty(threshold, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    previous = 0
+    for i in range(threshold - 2):
+        start, stop = edges[i], edges[i + 1]
+        ax, ay = x[previous], y[previous]
+        area = np.abs(
+            (ax - centers_x[i]) * (y[start:stop] - ay) -
+            (ax - x[start:stop]) * (centers_y[i] - ay)
+        )
+        previous = start + int(np.argmax(area))
+        selected[i + 1] = previous
+
+    return x[selected], y[selected]
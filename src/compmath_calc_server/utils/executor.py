@@ -0,0 +1,158 @@
+import asyncio
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+
+from starlette.concurrency import run_in_threadpool
+
+from compmath_calc_server.config import load_config
+from compmath_calc_server.exceptions import APIError
+from compmath_calc_server.utils.metrics import record_spans, registry, timed_call
+from compmath_calc_server.utils.warmup import warm_up
+
+
+def ping() -> bool:
+    return True
+
+
+class CalcExecutor:
+    """
+    Исполнитель вычислительных обработчиков
+
+    Расчеты на sympy и циклах Python удерживают GIL, поэтому в пуле потоков
+    один тяжелый запрос задерживает все остальные запросы воркера.
+    Исполнитель отправляет расчеты в пул процессов, оставляя цикл событий
+    свободным для ввода-вывода, и ограничивает число одновременных расчетов
+    каждого обработчика.
+
+    При processes = 0 расчеты выполняются в пуле потоков, как раньше.
+    """
+
+    def __init__(self, processes: int, concurrency: int, limits: dict[str, int] | None = None):
+        """
+        :param processes: число процессов пула
+        :param concurrency: ограничение одновременных расчетов обработчика по умолчанию
+        :param limits: ограничения для отдельных обработчиков ("ni/lrm") или групп ("ni")
+        """
+        self.processes = processes
+        self.concurrency = concurrency
+        self.limits = limits or {}
+
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+        self._pings: list[Future] = []
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._running: dict[str, int] = {}
+        self._waiting: dict[str, int] = {}
+
+    def start(self) -> None:
+        if self.processes <= 0 or self._pool is not None:
+            return
+
+        # spawn: процессы не наследуют цикл событий и потоки воркера uvicorn
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=warm_up
+        )
+        # Пул создает процессы по мере надобности; задачи-пустышки запускают все сразу,
+        # и каждая завершается после прогрева своего процесса
+        self._pings = [self._pool.submit(ping) for _ in range(self.processes)]
+        registry.set("compmath_calc_pool_processes", self.processes)
+        logging.debug(f"Запущен пул из {self.processes} процессов")
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            self._pings = []
+            registry.set("compmath_calc_pool_processes", 0)
+
+    def restart(self, pool: ProcessPoolExecutor) -> None:
+        """
+        Пересоздание поврежденного пула
+
+        Несколько запросов могут получить BrokenProcessPool одновременно;
+        пул пересоздается только если текущий - тот самый, на котором
+        произошел сбой, иначе новый пул (и задачи в нем) не трогаются.
+
+        :param pool: пул, в котором выполнялся расчет
+        """
+        with self._pool_lock:
+            if self._pool is not pool:
+                return
+            logging.error("Пул процессов поврежден, перезапуск")
+            self.shutdown()
+            self.start()
+
+    def pool_state(self) -> tuple[int, int]:
+        """
+        :return: число прогретых процессов пула и размер пула
+        """
+        if self._pool is None:
+            return 0, 0
+        return sum(future.done() for future in self._pings), self.processes
+
+    def limit(self, key: str) -> int:
+        """
+        Ограничение одновременных расчетов: обработчик, затем группа, затем по умолчанию
+        """
+        if key in self.limits:
+            return self.limits[key]
+        return self.limits.get(key.split("/")[0], self.concurrency)
+
+    def _semaphore(self, key: str) -> asyncio.Semaphore:
+        if key not in self._semaphores:
+            self._semaphores[key] = asyncio.Semaphore(self.limit(key))
+        return self._semaphores[key]
+
+    async def run(self, key: str, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Выполнение расчета
+
+        :param key: имя обработчика, например "ni/lrm"
+        :param func: функция уровня модуля (передается в процесс по имени)
+        :param args: аргументы, допускающие pickle
+        :return: результат функции
+        """
+        self._count(self._waiting, "compmath_calc_waiting", key, 1)
+        start = time.perf_counter()
+        try:
+            await self._semaphore(key).acquire()
+        finally:
+            self._count(self._waiting, "compmath_calc_waiting", key, -1)
+        registry.observe("compmath_calc_wait_seconds", time.perf_counter() - start, handler=key)
+
+        self._count(self._running, "compmath_calc_running", key, 1)
+        try:
+            pool = self._pool
+            if pool is None:
+                result, spans = await run_in_threadpool(timed_call, func, *args)
+            else:
+                try:
+                    result, spans = await asyncio.get_running_loop().run_in_executor(
+                        pool, timed_call, func, *args
+                    )
+                except BrokenProcessPool:
+                    # Процесс пула аварийно завершился (например, нехватка памяти): пул пересоздается
+                    self.restart(pool)
+                    raise APIError("Расчет аварийно завершен", status_code=500)
+        finally:
+            self._count(self._running, "compmath_calc_running", key, -1)
+            self._semaphore(key).release()
+
+        record_spans(key, spans)
+        return result
+
+    @staticmethod
+    def _count(counts: dict[str, int], metric: str, key: str, delta: int) -> None:
+        counts[key] = counts.get(key, 0) + delta
+        registry.set(metric, counts[key], handler=key)
+
+
+config = load_config()
+executor = CalcExecutor(config.CALC_PROCESSES, config.CALC_CONCURRENCY, config.CALC_LIMITS)
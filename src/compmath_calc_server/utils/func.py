@@ -1,15 +1,22 @@
 from copy import deepcopy
+from dataclasses import dataclass
+from functools import lru_cache
 from math import pi
 from typing import Callable, Protocol, cast, Sequence
 
 import numpy as np
 from numpy.linalg import lstsq
 from scipy.integrate import quad
-from scipy.interpolate import interp1d
+from scipy.interpolate import CubicSpline, PPoly, make_interp_spline
 from scipy.optimize import curve_fit
-from sympy import sympify, lambdify, SympifyError, Basic, solve, symbols, diff, sqrt
+from sympy import sympify, lambdify, SympifyError, Basic, solve, symbols, diff, sqrt, integrate, Derivative, DiracDelta, S
 from sympy.core import Symbol
 
+from compmath_calc_server.utils.artifacts import shared_cache
+
+# Наибольшее число элементов блока матрицы разностей в lagrange_poly
+LAGRANGE_BLOCK_SIZE = 1 << 20
+
 
 class FunctionValidateError(Exception):
     ...
@@ -81,6 +88,7 @@ def make_callable(func: str | Basic) -> FuncReturn:
     return wrapped_func
 
 
+@shared_cache("solve")
 def solve_rel_var(func: str | Basic, var: str):
     """
     Решение уравнения относительно переменной
@@ -102,6 +110,31 @@ def solve_rel_var(func: str | Basic, var: str):
     return solve(expr, var)
 
 
+@shared_cache("diff")
+def symbolic_diff(func: str | Basic, var: str) -> Basic:
+    """
+    Символьная производная
+
+    :param func: функция
+    :param var: переменная дифференцирования
+    :return: выражение производной
+    """
+    return diff(func, var)
+
+
+@shared_cache("integral")
+def definite_integral(func: str | Basic, a: float | int, b: float | int) -> Basic:
+    """
+    Определенный интеграл по x, вычисленный символьно
+
+    :param func: подынтегральная функция
+    :param a: нижний предел
+    :param b: верхний предел
+    :return: численное значение интеграла (evalf)
+    """
+    return integrate(sympify(func), ('x', a, b)).evalf()
+
+
 def derivative(fx: Callable[[float | int], float], h: float = 0.0001) -> Callable[[float | int], float]:
     """
     Вычисление производной функции
@@ -114,19 +147,97 @@ def derivative(fx: Callable[[float | int], float], h: float = 0.0001) -> Callabl
     return lambda x: (fx(x + h) - fx(x)) / h
 
 
-def tangent(fx: Callable[[float | int], float], x0: float | int) -> Callable[[float | int], float]:
+def central_derivative(
+        fx: Callable[[float | int], float],
+        order: int = 1,
+        h: float = 0.001
+) -> Callable[[float | int], float]:
+    """
+    Производная по пятиточечной центральной разности (погрешность O(h^4))
+
+    :param fx: функция
+    :param order: порядок производной (1 или 2)
+    :param h: шаг
+    :return: производная функции fx
+    """
+    if order == 1:
+        return lambda x: (-fx(x + 2 * h) + 8 * fx(x + h) - 8 * fx(x - h) + fx(x - 2 * h)) / (12 * h)
+    if order == 2:
+        return lambda x: (
+            -fx(x + 2 * h) + 16 * fx(x + h) - 30 * fx(x) + 16 * fx(x - h) - fx(x - 2 * h)
+        ) / (12 * h * h)
+    raise ValueError(f"Неподдерживаемый порядок производной: {order}")
+
+
+@dataclass(frozen=True)
+class Derivatives:
+    """
+    Функция f(x) и ее первая и вторая производные
+
+    symbolic - производные получены sympy; иначе - центральные разности
+    """
+    f: FuncReturn
+    df: Callable[[float | int], float]
+    d2f: Callable[[float | int], float]
+    symbolic: bool
+
+
+@lru_cache(maxsize=256)
+def differentiate(func: str) -> Derivatives:
+    """
+    Функция и ее производные по x, построенные один раз на выражение
+
+    Производные берутся символьно по вещественному x (так Abs(x)' = sign(x))
+    и компилируются вместе с функцией; дельта-функции в точках разрыва
+    производной отбрасываются. Если sympy не может продифференцировать
+    выражение (в результате остается Derivative) или производная не
+    компилируется, используются центральные разности. Комплексный шаг не
+    применяется: для функций вроде Abs он молча дает неверный результат.
+
+    :param func: строка с функцией
+    :return: функция и производные
+    """
+    try:
+        expr = sympify(func)
+    except (SympifyError, TypeError):
+        raise FunctionValidateError(f"Invalid literal: {func}")
+
+    f = make_callable(expr)
+    x, real_x = Symbol("x"), Symbol("x", real=True)
+    try:
+        df_expr = symbolic_diff(expr.subs(x, real_x), real_x)
+        d2f_expr = symbolic_diff(df_expr, real_x)
+        if df_expr.has(Derivative) or d2f_expr.has(Derivative):
+            raise ValueError(f"Нет символьной производной: {func}")
+        df_expr, d2f_expr = (
+            derived.replace(DiracDelta, lambda *args: S.Zero).subs(real_x, x)
+            for derived in (df_expr, d2f_expr)
+        )
+        return Derivatives(f, make_callable(df_expr), make_callable(d2f_expr), True)
+    except (ValueError, TypeError, AttributeError, NameError):
+        return Derivatives(f, central_derivative(f), central_derivative(f, order=2), False)
+
+
+def tangent(
+        fx: Callable[[float | int], float],
+        x0: float | int,
+        dfx: Callable[[float | int], float] | None = None
+) -> Callable[[float | int], float]:
     """
     Уравнение касательной
 
     y = f(x0) + f'(x0)(x-x0)
 
+    f(x0) и f'(x0) вычисляются один раз, а не в каждой точке графика.
 
     :param fx: функция графика
     :param x0: точка касания
+    :param dfx: производная (по умолчанию - центральная разность)
     :return: уравнение касательной
     """
-
-    return lambda x: fx(x0) + derivative(fx)(x0) * (x - x0)
+    y0 = fx(x0)
+    slope = (dfx or central_derivative(fx))(x0)
+    return lambda x: y0 + slope * (x - x0)
 
 
 def line_between_points(
@@ -171,7 +282,8 @@ def linfit(x: list[float], y: list[float], func: Callable[[float], tuple]) -> tu
     # Подготовка данных для метода наименьших квадратов
     x_data = np.array(x)
     y_data = np.array(y)
-    A = np.array([func(xi) for xi in x_data])
+    # Столбцы матрицы считаются сразу по всему вектору: func поэлементна
+    A = np.column_stack(np.broadcast_arrays(*func(x_data)))
 
     # Решение методом наименьших квадратов
     parameters_values, _ = lstsq(A, y_data, rcond=None)[:2]
@@ -328,50 +440,128 @@ def pwrfit(x: list[float], y: list[float], g: list[float | int] = None) -> tuple
     return tuple(popt), lambda x: popt[0] * x ** popt[1] + popt[2]
 
 
-def cspline(x: list[float], y: list[float]) -> interp1d:
+def cspline(x: list[float], y: list[float]) -> PPoly:
     """
     Кубический сплайн
 
+    Сплайн строится один раз в виде кусочно-полиномиальной функции
+    и вычисляется сразу на массиве аргументов.
+
     :param x: вектор аргументов
     :param y: вектор значений
-    :return:
+    :return: кусочно-полиномиальная функция
     """
 
     x_data = np.array(x)
     y_data = np.array(y)
 
-    return interp1d(x_data, y_data, kind='cubic', fill_value="extrapolate")
+    return CubicSpline(x_data, y_data, extrapolate=True)
 
 
-def pspline(x: list[float], y: list[float]):
+def pspline(x: list[float], y: list[float]) -> PPoly:
     """
     Параболический сплайн
 
     :param x: список значений x
     :param y: список значений y
-    :return: вектор коэффициентов параболического сплайна
+    :return: кусочно-полиномиальная функция
     """
 
     x_data = np.array(x)
     y_data = np.array(y)
 
-    return interp1d(x_data, y_data, kind='quadratic', fill_value="extrapolate")
+    return PPoly.from_spline(make_interp_spline(x_data, y_data, k=2), extrapolate=True)
 
 
-def lspline(x: list[float], y: list[float]):
+def lspline(x: list[float], y: list[float]) -> PPoly:
     """
     Линейный сплайн
 
     :param x: список значений x
     :param y: список значений y
-    :return: вектор коэффициентов линейного сплайна
+    :return: кусочно-полиномиальная функция
     """
-    # Используем CubicSpline для интерполяции
 
     x_data = np.array(x)
     y_data = np.array(y)
 
-    return interp1d(x_data, y_data, kind='linear', fill_value="extrapolate")
+    return PPoly.from_spline(make_interp_spline(x_data, y_data, k=1), extrapolate=True)
+
+
+def spline_coefficients(spline: PPoly, limit: int | None = None) -> list[tuple[float, float, tuple[float, ...]]]:
+    """
+    Коэффициенты сплайна по участкам
+
+    На участке [x_i, x_i+1] сплайн имеет вид
+    S(t) = a0 + a1 * (t - x_i) + a2 * (t - x_i)^2 + ...
+
+    :param spline: кусочно-полиномиальная функция
+    :param limit: наибольшее число участков (None - все)
+    :return: список (x_i, x_i+1, (a0, a1, ...)) для участков ненулевой длины
+    """
+    breakpoints = spline.x
+    coefficients = np.flip(spline.c, axis=0).T
+
+    table = []
+    for i in range(len(breakpoints) - 1):
+        if limit is not None and len(table) >= limit:
+            break
+        if breakpoints[i + 1] > breakpoints[i]:
+            table.append((float(breakpoints[i]), float(breakpoints[i + 1]), tuple(float(_) for _ in coefficients[i])))
+    return table
+
+
+def lagrange_poly(x: list[float], y: list[float]) -> tuple[tuple, Callable[[float | np.ndarray], float | np.ndarray]]:
+    """
+    Интерполяционный полином Лагранжа в барицентрической форме
+
+    Веса w_j = 1 / П(x_j - x_k) вычисляются один раз для набора узлов,
+    после чего значение в каждой точке t находится за O(n):
+
+    L(t) = sum(w_j * y_j / (t - x_j)) / sum(w_j / (t - x_j))
+
+    :param x: вектор узлов интерполяции (без повторов)
+    :param y: вектор значений
+    :return: кортеж барицентрических весов (с точностью до общего множителя)
+    и функция, принимающая число или массив
+    """
+    x_data = np.array(x, dtype=float)
+    y_data = np.array(y, dtype=float)
+
+    if len(np.unique(x_data)) != len(x_data):
+        raise ValueError("Узлы интерполяции должны быть различны")
+
+    # Матрицы разностей строятся блоками строк, чтобы память не росла как n^2
+    block = max(1, LAGRANGE_BLOCK_SIZE // len(x_data))
+
+    # Масштабирование разностей защищает произведение от переполнения при большом числе узлов
+    scale = 4 / (x_data.max() - x_data.min()) if len(x_data) > 1 else 1
+    weights = np.empty(len(x_data))
+    for start in range(0, len(x_data), block):
+        diff_matrix = (x_data[start:start + block, None] - x_data[None, :]) * scale
+        diff_matrix[np.arange(len(diff_matrix)), np.arange(start, start + len(diff_matrix))] = 1
+        weights[start:start + block] = 1 / np.prod(diff_matrix, axis=1)
+
+    def poly(t: float | np.ndarray) -> float | np.ndarray:
+        t_data = np.asarray(t, dtype=float)
+        is_scalar = t_data.ndim == 0
+        t_data = np.atleast_1d(t_data)
+
+        result = np.empty(len(t_data))
+        for start in range(0, len(t_data), block):
+            t_diff = t_data[start:start + block, None] - x_data[None, :]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                terms = weights / t_diff
+                values = (terms @ y_data) / terms.sum(axis=1)
+
+            # В узлах интерполяции формула вырождается, значение известно точно
+            rows, cols = np.nonzero(t_diff == 0)
+            values[rows] = y_data[cols]
+            result[start:start + block] = values
+
+        return float(result[0]) if is_scalar else result
+
+    return tuple(weights), poly
 
 
 def arc_length(fx_str: str, a: float | int, b: float | int, symbol: str) -> float:
@@ -387,7 +577,7 @@ def arc_length(fx_str: str, a: float | int, b: float | int, symbol: str) -> floa
     x = symbols('x')
 
     # Производная функции
-    df_dx_str = str(diff(fx_str, 'x'))
+    df_dx_str = str(symbolic_diff(fx_str, 'x'))
     df_dx = lambdify(x, df_dx_str, "numpy")
 
     def integrand(x):
@@ -409,7 +599,7 @@ def surface_area(fx_str: str, a: float | int, b: float | int, symbol: str) -> fl
     """
     x = symbols('x')
     fx_lambda = lambdify(symbol, fx_str, 'numpy')
-    df_dx = lambdify(x, diff(fx_str, x), "numpy")
+    df_dx = lambdify(x, symbolic_diff(fx_str, 'x'), "numpy")
 
     def integrand(x):
         return abs(fx_lambda(x)) * sqrt(1 + df_dx(x) ** 2)
@@ -493,13 +683,13 @@ def is_converges(
     )
 
     fi_1_x_y = (
-        diff(fi_x_y[0], "x"),
-        diff(fi_x_y[0], "y")
+        symbolic_diff(fi_x_y[0], "x"),
+        symbolic_diff(fi_x_y[0], "y")
     )
 
     fi_2_x_y = (
-        diff(fi_x_y[1], "x"),
-        diff(fi_x_y[1], "y")
+        symbolic_diff(fi_x_y[1], "x"),
+        symbolic_diff(fi_x_y[1], "y")
     )
 
     a, b = initial_guess
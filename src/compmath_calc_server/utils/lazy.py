@@ -0,0 +1,65 @@
+import importlib
+from typing import Any, Callable
+
+
+class LazyFunction:
+    """
+    Функция модуля, который импортируется при первом вызове
+
+    В процесс пула передается по имени (pickle хранит только путь),
+    поэтому воркер, отправляющий расчеты в пул, не импортирует модуль вовсе.
+    """
+
+    __slots__ = ("module", "name", "_func")
+
+    def __init__(self, module: str, name: str):
+        self.module = module
+        self.name = name
+        self._func: Callable[..., Any] | None = None
+
+    def resolve(self) -> Callable[..., Any]:
+        if self._func is None:
+            self._func = getattr(importlib.import_module(self.module), self.name)
+        return self._func
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __reduce__(self) -> tuple[type, tuple[str, str]]:
+        return LazyFunction, (self.module, self.name)
+
+    def __repr__(self) -> str:
+        return f"<LazyFunction {self.module}.{self.name}>"
+
+
+class LazyModule:
+    """
+    Модуль, который импортируется при первом вызове его функции
+
+        lrm = lazy_import("compmath_calc_server.models.ni.lrm")
+        executor.run("ni/lrm", lrm.calc, data)  # lrm.calc - LazyFunction
+    """
+
+    def __init__(self, name: str):
+        self.__name = name
+
+    def __getattr__(self, name: str) -> LazyFunction:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return LazyFunction(self.__name, name)
+
+    def __repr__(self) -> str:
+        return f"<LazyModule {self.__name}>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """
+    Отложенный импорт модуля с функциями расчета
+
+    Модули расчетов тянут sympy и scipy (около секунды на импорт), поэтому
+    обработчики ссылаются на них лениво: модуль загружается при первом
+    расчете или фоновом прогреве воркера (см. utils.warmup).
+
+    :param name: полное имя модуля
+    """
+    return LazyModule(name)
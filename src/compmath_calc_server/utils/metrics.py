@@ -0,0 +1,402 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Iterator
+
+from fastapi.routing import APIRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from compmath_calc_server.config import load_config
+
+# Границы корзин гистограмм длительности (секунды)
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Не чаще одного сохранения снимка метрик воркера за интервал (секунды)
+SNAPSHOT_INTERVAL = 1.0
+
+# Имя метрики: тип и описание
+METRICS = {
+    "compmath_http_requests_total": ("counter", "Число запросов"),
+    "compmath_http_request_duration_seconds": ("histogram", "Длительность обработки запроса"),
+    "compmath_stage_duration_seconds": ("histogram", "Длительность этапа обработки запроса"),
+    "compmath_response_cache_requests_total": ("counter", "Запросы к кэшу ответов"),
+    "compmath_calc_wait_seconds": ("histogram", "Ожидание свободного места для расчета"),
+    "compmath_calc_running": ("gauge", "Выполняемые расчеты"),
+    "compmath_calc_waiting": ("gauge", "Расчеты в очереди"),
+    "compmath_calc_pool_processes": ("gauge", "Процессы пула расчетов"),
+    "compmath_artifact_cache_items": ("gauge", "Записи общего кэша символьных вычислений"),
+    "compmath_artifact_cache_hits_total": ("counter", "Попадания в общий кэш символьных вычислений"),
+    "compmath_artifact_cache_misses_total": ("counter", "Промахи общего кэша символьных вычислений"),
+    "compmath_artifact_cache_evictions_total": ("counter", "Вытеснения из общего кэша символьных вычислений"),
+}
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class Registry:
+    """
+    Метрики процесса воркера
+
+    Счетчики, значения и гистограммы с метками. Каждый воркер gunicorn
+    ведет свой реестр и периодически сохраняет его снимок в общий каталог;
+    /metrics складывает снимки всех живых воркеров.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters: dict[tuple[str, Labels], float] = defaultdict(float)
+        self.gauges: dict[tuple[str, Labels], float] = {}
+        # Счетчики по корзинам (последняя - +Inf), сумма, количество
+        self.histograms: dict[tuple[str, Labels], list[float]] = {}
+
+    @staticmethod
+    def _key(name: str, labels: dict[str, Any]) -> tuple[str, Labels]:
+        return name, tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    def inc(self, name: str, value: float = 1, **labels: Any) -> None:
+        with self._lock:
+            self.counters[self._key(name, labels)] += value
+
+    def set(self, name: str, value: float, **labels: Any) -> None:
+        with self._lock:
+            self.gauges[self._key(name, labels)] = value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        key = self._key(name, labels)
+        with self._lock:
+            if key not in self.histograms:
+                self.histograms[key] = [0] * (len(DURATION_BUCKETS) + 3)
+            histogram = self.histograms[key]
+            for i, bound in enumerate(DURATION_BUCKETS):
+                if value <= bound:
+                    histogram[i] += 1
+            histogram[-3] += 1
+            histogram[-2] += value
+            histogram[-1] += 1
+
+    def snapshot(self) -> dict[str, list]:
+        with self._lock:
+            return {
+                "counters": [[name, labels, value] for (name, labels), value in self.counters.items()],
+                "gauges": [[name, labels, value] for (name, labels), value in self.gauges.items()],
+                "histograms": [[name, labels, values] for (name, labels), values in self.histograms.items()],
+            }
+
+
+def merge(snapshots: list[dict[str, list]]) -> Registry:
+    """
+    Сложение снимков метрик нескольких воркеров
+    """
+    total = Registry()
+    for snapshot in snapshots:
+        for name, labels, value in snapshot["counters"]:
+            total.counters[name, tuple(map(tuple, labels))] += value
+        for name, labels, value in snapshot["gauges"]:
+            key = name, tuple(map(tuple, labels))
+            total.gauges[key] = total.gauges.get(key, 0) + value
+        for name, labels, values in snapshot["histograms"]:
+            key = name, tuple(map(tuple, labels))
+            if key not in total.histograms:
+                total.histograms[key] = [0] * len(values)
+            total.histograms[key] = [a + b for a, b in zip(total.histograms[key], values)]
+    return total
+
+
+def _format_labels(labels: Labels, extra: tuple[str, str] | None = None) -> str:
+    items = list(labels) + ([extra] if extra else [])
+    if not items:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"') for _, value in items)
+    return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(items, escaped)) + "}"
+
+
+def render(registry: Registry) -> str:
+    """
+    Метрики в текстовом формате Prometheus
+    """
+    series: dict[str, list[str]] = defaultdict(list)
+
+    for (name, labels), value in sorted(registry.counters.items()):
+        series[name].append(f"{name}{_format_labels(labels)} {value}")
+    for (name, labels), value in sorted(registry.gauges.items()):
+        series[name].append(f"{name}{_format_labels(labels)} {value}")
+    for (name, labels), values in sorted(registry.histograms.items()):
+        bounds = [str(bound) for bound in DURATION_BUCKETS] + ["+Inf"]
+        for bound, count in zip(bounds, values):
+            series[name].append(f"{name}_bucket{_format_labels(labels, ('le', bound))} {count}")
+        series[name].append(f"{name}_sum{_format_labels(labels)} {values[-2]}")
+        series[name].append(f"{name}_count{_format_labels(labels)} {values[-1]}")
+
+    lines = []
+    for name, items in series.items():
+        metric_type, description = METRICS.get(name, ("untyped", name))
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        lines.extend(items)
+    return "\n".join(lines) + "\n"
+
+
+class SnapshotStore:
+    """
+    Снимки метрик воркеров в файлах <pid>.json
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._written = 0.0
+
+    def _file(self, pid: int) -> str:
+        return os.path.join(self.path, f"{pid}.json")
+
+    def save(self, registry: Registry) -> None:
+        if time.monotonic() - self._written < SNAPSHOT_INTERVAL:
+            return
+        self._written = time.monotonic()
+
+        os.makedirs(self.path, exist_ok=True)
+        filename = self._file(os.getpid())
+        temp_filename = f"{filename}.tmp"
+        with open(temp_filename, "w", encoding="utf-8") as file:
+            json.dump(registry.snapshot(), file)
+        os.replace(temp_filename, filename)
+
+    def load(self) -> list[dict[str, list]]:
+        """
+        Снимки остальных живых воркеров; снимки завершенных удаляются
+        """
+        snapshots = []
+        # В Windows сервер работает в одном процессе uvicorn, а os.kill(pid, 0) завершает процесс
+        if os.name == "nt" or not os.path.isdir(self.path):
+            return snapshots
+
+        for entry in os.scandir(self.path):
+            pid, _, suffix = entry.name.partition(".")
+            if suffix != "json" or not pid.isdigit() or int(pid) == os.getpid():
+                continue
+            try:
+                os.kill(int(pid), 0)
+            except ProcessLookupError:
+                os.remove(entry.path)
+                continue
+            except PermissionError:
+                pass
+
+            try:
+                with open(entry.path, encoding="utf-8") as file:
+                    snapshots.append(json.load(file))
+            except (FileNotFoundError, json.JSONDecodeError):
+                continue
+        return snapshots
+
+    def remove(self) -> None:
+        try:
+            os.remove(self._file(os.getpid()))
+        except FileNotFoundError:
+            pass
+
+
+config = load_config()
+registry = Registry()
+snapshots = SnapshotStore(config.METRICS_PATH)
+
+# Этапы обработки текущего запроса: имя этапа -> длительность
+_spans: ContextVar[dict[str, float] | None] = ContextVar("spans", default=None)
+
+# Отметки начала и конца вызова обработчика текущего запроса
+_marks: ContextVar[dict[str, Any] | None] = ContextVar("marks", default=None)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """
+    Замер этапа расчета (parse, compute, reference, plot)
+
+    Длительности повторных этапов с одним именем складываются.
+    Вне замеряемого вызова блок выполняется без замера.
+    """
+    spans = _spans.get()
+    if spans is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        spans[name] = spans.get(name, 0.0) + time.perf_counter() - start
+
+
+def timed_call(func: Callable[..., Any], *args: Any) -> tuple[Any, dict[str, float]]:
+    """
+    Вызов функции с замером этапов (выполняется в процессе пула)
+
+    :return: результат функции и длительности этапов
+    """
+    spans = {}
+    token = _spans.set(spans)
+    start = time.perf_counter()
+    try:
+        result = func(*args)
+    finally:
+        _spans.reset(token)
+    spans["calc"] = time.perf_counter() - start
+    return result, spans
+
+
+def record_spans(key: str, spans: dict[str, float]) -> None:
+    """
+    Учет этапов расчета: в метриках текущего запроса или, вне запроса, под именем обработчика
+    """
+    marks = _marks.get()
+    if marks is not None:
+        marks["spans"].update(spans)
+        return
+    for name, seconds in spans.items():
+        registry.observe("compmath_stage_duration_seconds", seconds, route=key, stage=name)
+
+
+def route_label(path: str, route_path: str) -> str:
+    """
+    Шаблон маршрута с префиксами подключенных роутеров
+
+    В зависимости от версии FastAPI маршрут подключенного роутера хранит
+    полный шаблон или только свою часть; недостающий префикс берется
+    из пути запроса: /api/jobs/5f1c + /{job_id} -> /api/jobs/{job_id}
+
+    :param path: путь запроса
+    :param route_path: шаблон маршрута
+    """
+    depth = route_path.count("/")
+    prefix = path.rstrip("/").rsplit("/", depth)[0] if depth else path
+    return prefix + route_path
+
+
+def mark(name: str) -> None:
+    """
+    Отметка времени в замере текущего запроса (start, end)
+
+    Повторная отметка не перезаписывает первую: обработчик, сериализующий
+    ответ сам, отмечает конец расчета до сериализации.
+    """
+    marks = _marks.get()
+    if marks is not None:
+        marks.setdefault(name, time.perf_counter())
+
+
+def _timed_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    # include_router пересоздает маршруты с уже обернутым обработчиком
+    if getattr(endpoint, "__measured__", False):
+        return endpoint
+
+    if asyncio.iscoroutinefunction(endpoint):
+        @wraps(endpoint)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            mark("start")
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                mark("end")
+    else:
+        @wraps(endpoint)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            mark("start")
+            try:
+                return endpoint(*args, **kwargs)
+            finally:
+                mark("end")
+    wrapper.__measured__ = True
+    return wrapper
+
+
+class MeasuredRoute(APIRoute):
+    """
+    Маршрут с замером этапов
+
+    request_parse - чтение и проверка тела запроса до вызова обработчика,
+    serialize - проверка и сериализация ответа после него.
+    Этапы расчета (в том числе parse - разбор выражений) приходят
+    из исполнителя (см. record_spans).
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        super().__init__(path, _timed_endpoint(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def measured_handler(request):
+            marks = {"spans": {}}
+            token = _marks.set(marks)
+            start = time.perf_counter()
+            try:
+                return await handler(request)
+            finally:
+                end = time.perf_counter()
+                _marks.reset(token)
+
+                spans = marks["spans"]
+                if "start" in marks:
+                    spans["request_parse"] = marks["start"] - start
+                if "end" in marks:
+                    spans["serialize"] = end - marks["end"]
+                route = route_label(request.url.path, self.path)
+                for name, seconds in spans.items():
+                    registry.observe("compmath_stage_duration_seconds", seconds, route=route, stage=name)
+
+        return measured_handler
+
+
+class MetricsMiddleware:
+    """
+    Число и длительность запросов по маршрутам
+
+    Маршрут берется из шаблона (/api/jobs/{job_id}), чтобы метки не зависели
+    от параметров пути. Ответы из кэша не доходят до маршрутизатора
+    и учитываются по пути запроса.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in ("/metrics", "/ready"):
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            if route is not None:
+                route_path = route_label(scope["path"], route.path)
+            else:
+                route_path = scope["path"] if status < 400 else "unmatched"
+
+            registry.observe(
+                "compmath_http_request_duration_seconds",
+                time.perf_counter() - start,
+                method=scope["method"],
+                route=route_path
+            )
+            registry.inc("compmath_http_requests_total", method=scope["method"], route=route_path, status=status)
+
+            try:
+                snapshots.save(registry)
+            except OSError as error:
+                logging.warning(f"Не удалось сохранить метрики: {error}")
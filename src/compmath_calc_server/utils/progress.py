@@ -0,0 +1,38 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator
+
+_reporter: ContextVar[Callable[[dict[str, Any]], None] | None] = ContextVar("reporter", default=None)
+
+
+def is_reporting() -> bool:
+    """
+    Установлен ли обработчик сообщений о ходе расчета
+
+    Позволяет не собирать дорогие поля сообщения (строку таблицы) вне задачи.
+    """
+    return _reporter.get() is not None
+
+
+def report(**event: Any) -> None:
+    """
+    Сообщение о ходе расчета (номер итерации, текущая погрешность, строка таблицы)
+
+    Вне задачи (обычный синхронный запрос) вызов ничего не делает.
+    Обработчик задачи может прервать расчет, выбросив исключение.
+    """
+    reporter = _reporter.get()
+    if reporter is not None:
+        reporter(event)
+
+
+@contextmanager
+def reporting(reporter: Callable[[dict[str, Any]], None]) -> Iterator[None]:
+    """
+    Установка обработчика сообщений о ходе расчета на время выполнения блока
+    """
+    token = _reporter.set(reporter)
+    try:
+        yield
+    finally:
+        _reporter.reset(token)
@@ -0,0 +1,87 @@
+from typing import Any
+
+import numpy as np
+import pydantic_core
+from pydantic import BaseModel
+from starlette.responses import Response
+
+from compmath_calc_server.config import load_config
+from compmath_calc_server.utils.metrics import mark
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+config = load_config()
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.__dict__
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Тип {type(value).__name__} не сериализуется в JSON")
+
+
+def _plain(value: Any) -> Any:
+    """
+    Замена моделей на словари их полей (массивы numpy остаются как есть)
+    """
+    if isinstance(value, BaseModel):
+        return {name: _plain(item) for name, item in value.__dict__.items()}
+    if isinstance(value, (list, tuple)) and value and not isinstance(value[0], (int, float, str, np.ndarray)):
+        return [_plain(item) for item in value]
+    return value
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Кодирование ответа в JSON без проверки моделей
+
+    Модели (в том числе созданные model_construct) кодируются по значениям
+    полей, массивы numpy - напрямую, NaN - как null. Используется orjson,
+    если он установлен, иначе pydantic_core.
+
+    :param value: модели, словари, списки, массивы numpy
+    """
+    if orjson is not None:
+        return orjson.dumps(value, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return pydantic_core.to_json(_plain(value), inf_nan_mode="null", fallback=_default)
+
+
+def jsonable(view: type[BaseModel], content: Any) -> Any:
+    """
+    Содержимое ответа в виде значений JSON (для хранения результата задачи)
+    """
+    if config.FAST_SERIALIZATION:
+        return pydantic_core.from_json(dumps(content))
+    return view(content=content).model_dump(mode="json")["content"]
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def respond(view: type[BaseModel], content: Any, status_code: int = 200) -> BaseModel | Response:
+    """
+    Ответ обработчика
+
+    По умолчанию - модель представления: FastAPI проверяет ее по response_model
+    и сериализует. При FAST_SERIALIZATION ответ кодируется сразу (см. dumps),
+    минуя повторную проверку; схема OpenAPI по-прежнему строится из response_model.
+
+    :param view: модель представления, например NIResponse
+    :param content: содержимое ответа
+    :param status_code: код ответа
+    """
+    if not config.FAST_SERIALIZATION:
+        return view(content=content)
+
+    mark("end")
+    return FastJSONResponse({"content": content, "error": None}, status_code=status_code)
@@ -0,0 +1,122 @@
+from io import StringIO
+from typing import AsyncIterator, Callable
+
+import numpy as np
+
+# Точка в бинарном потоке: два числа float64 (x, y) в порядке little-endian
+POINT_DTYPE = np.dtype("<f8")
+POINT_SIZE = 2 * POINT_DTYPE.itemsize
+
+
+class StreamFormatError(Exception):
+    ...
+
+
+async def iter_csv_points(
+        stream: AsyncIterator[bytes],
+        delimiter: str = ","
+) -> AsyncIterator[tuple[np.ndarray, np.ndarray]]:
+    """
+    Чтение точек из CSV-потока порциями
+
+    Каждая строка - пара "x<delimiter>y". Пустые строки и строки,
+    начинающиеся с "#", пропускаются. Неполная последняя строка порции
+    переносится в следующую.
+
+    :param stream: асинхронный поток байтов тела запроса
+    :param delimiter: разделитель столбцов
+    :return: порции векторов (x, y)
+    """
+    tail = b""
+    async for chunk in stream:
+        data = tail + chunk
+        cut = data.rfind(b"\n") + 1
+        data, tail = data[:cut], data[cut:]
+        if data:
+            yield parse_csv(data, delimiter)
+
+    if tail.strip():
+        yield parse_csv(tail, delimiter)
+
+
+def parse_csv(data: bytes, delimiter: str = ",") -> tuple[np.ndarray, np.ndarray]:
+    try:
+        table = np.loadtxt(
+            StringIO(data.decode()),
+            delimiter=delimiter,
+            comments="#",
+            dtype=float,
+            ndmin=2
+        )
+    except (UnicodeDecodeError, ValueError) as error:
+        raise StreamFormatError(f"Неверный формат CSV: {error}")
+
+    if table.size == 0:
+        return np.empty(0), np.empty(0)
+
+    if table.shape[1] != 2:
+        raise StreamFormatError("Каждая строка CSV должна содержать два числа: x и y")
+
+    return table[:, 0], table[:, 1]
+
+
+async def iter_binary_points(stream: AsyncIterator[bytes]) -> AsyncIterator[tuple[np.ndarray, np.ndarray]]:
+    """
+    Чтение точек из бинарного потока порциями
+
+    Поток - последовательность пар float64 (x, y) little-endian.
+    Неполная пара в конце порции переносится в следующую.
+
+    :param stream: асинхронный поток байтов тела запроса
+    :return: порции векторов (x, y)
+    """
+    tail = b""
+    async for chunk in stream:
+        data = tail + chunk
+        cut = len(data) - len(data) % POINT_SIZE
+        data, tail = data[:cut], data[cut:]
+        if data:
+            table = np.frombuffer(data, dtype=POINT_DTYPE).reshape(-1, 2)
+            yield table[:, 0], table[:, 1]
+
+    if tail:
+        raise StreamFormatError(f"Длина бинарного потока должна быть кратна {POINT_SIZE} байтам")
+
+
+async def read_points(
+        stream: AsyncIterator[bytes],
+        content_type: str,
+        on_chunk: Callable[[np.ndarray, np.ndarray], None] | None = None,
+        delimiter: str = ","
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Чтение всех точек из потока
+
+    :param stream: асинхронный поток байтов тела запроса
+    :param content_type: text/csv или application/octet-stream
+    :param on_chunk: обработчик каждой прочитанной порции (например, накопление статистик)
+    :param delimiter: разделитель столбцов CSV
+    :return: векторы (x, y) из конечных чисел
+    """
+    media_type = content_type.split(";")[0].strip().lower()
+    if media_type == "text/csv":
+        chunks = iter_csv_points(stream, delimiter)
+    elif media_type == "application/octet-stream":
+        chunks = iter_binary_points(stream)
+    else:
+        raise StreamFormatError(f"Неподдерживаемый тип данных: {content_type}")
+
+    x_chunks = []
+    y_chunks = []
+    async for x, y in chunks:
+        # JSON-модели отклоняют NaN и бесконечности, поток должен вести себя так же
+        if not (np.isfinite(x).all() and np.isfinite(y).all()):
+            raise StreamFormatError("Поток содержит NaN или бесконечность")
+        if on_chunk is not None:
+            on_chunk(x, y)
+        x_chunks.append(x)
+        y_chunks.append(y)
+
+    if not x_chunks:
+        return np.empty(0), np.empty(0)
+    return np.concatenate(x_chunks), np.concatenate(y_chunks)
@@ -0,0 +1,110 @@
+import importlib
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from compmath_calc_server.utils.executor import CalcExecutor
+
+# Модули расчетов: импортируются в каждом процессе пула до первого запроса
+WARM_UP_MODULES = (
+    "numpy",
+    "scipy.optimize",
+    "scipy.interpolate",
+    "sympy",
+    "compmath_calc_server.utils.func",
+    "compmath_calc_server.models.aif.alsm",
+    "compmath_calc_server.models.aif.interspline",
+    "compmath_calc_server.models.ni.lrm",
+    "compmath_calc_server.models.ni.mrm",
+    "compmath_calc_server.models.ni.rrm",
+    "compmath_calc_server.models.ni.sm1",
+    "compmath_calc_server.models.ni.sm2",
+    "compmath_calc_server.models.ni.tm",
+    "compmath_calc_server.models.ni.intermediate",
+    "compmath_calc_server.models.sne.sim",
+    "compmath_calc_server.models.sne.zm",
+    "compmath_calc_server.models.sne.ntm",
+    "compmath_calc_server.models.slat.sim",
+    "compmath_calc_server.models.slat.zm",
+    "compmath_calc_server.models.slat.gm",
+    "compmath_calc_server.models.nonlinear.roots",
+)
+
+# Модули, нужные воркеру при расчетах в пуле: сессии аппроксимации считаются в самом воркере
+WORKER_MODULES = (
+    "compmath_calc_server.utils.func",
+)
+
+
+def warm_up(modules: tuple[str, ...] = WARM_UP_MODULES) -> None:
+    """
+    Прогрев процесса: импорт тяжелых модулей и первый разбор выражения sympy
+    """
+    for module in modules:
+        importlib.import_module(module)
+
+    from compmath_calc_server.utils.func import make_callable
+    make_callable("sin(x) + x**2")(1.0)
+
+
+class WarmUp:
+    """
+    Фоновый прогрев воркера
+
+    Воркер принимает запросы сразу после запуска, а модули расчетов
+    импортируются в фоновом потоке (запрос, пришедший раньше, дождется
+    импорта на блокировке модуля). Готовность - конец прогрева и запуск
+    всех процессов пула; ее сообщает обработчик /ready.
+    """
+
+    def __init__(self):
+        self.started: float | None = None
+        self.finished: float | None = None
+        self.error: str | None = None
+        self._thread: threading.Thread | None = None
+        self._executor: "CalcExecutor | None" = None
+
+    def start(self, executor: "CalcExecutor", enabled: bool = True) -> None:
+        """
+        :param executor: исполнитель расчетов (его пул прогревается сам)
+        :param enabled: False - без прогрева, модули загрузятся при первом расчете
+        """
+        self._executor = executor
+        self.started = time.monotonic()
+        if not enabled:
+            self.finished = self.started
+            return
+
+        # При расчетах в пуле воркеру нужны только модули сессий
+        modules = WORKER_MODULES if executor.processes > 0 else WARM_UP_MODULES
+        self._thread = threading.Thread(target=self._run, args=(modules,), name="warm-up", daemon=True)
+        self._thread.start()
+
+    def _run(self, modules: tuple[str, ...]) -> None:
+        try:
+            warm_up(modules)
+        except Exception as error:
+            logging.exception(error)
+            self.error = f"{type(error).__name__}: {error}"
+            return
+        self.finished = time.monotonic()
+        logging.debug(f"Воркер прогрет за {self.finished - self.started:.2f} с")
+
+    def state(self) -> dict[str, Any]:
+        """
+        Состояние прогрева: ready, warm_up_seconds, pool_ready, pool_processes, error
+        """
+        pool_ready, pool_processes = self._executor.pool_state() if self._executor else (0, 0)
+        warm = self.finished is not None
+        return {
+            "ready": warm and self.error is None and pool_ready == pool_processes,
+            "warm_up_seconds": round(self.finished - self.started, 3) if warm else None,
+            "pool_ready": pool_ready,
+            "pool_processes": pool_processes,
+            "error": self.error,
+        }
+
+
+warmup = WarmUp()
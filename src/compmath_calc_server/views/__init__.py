@@ -1,5 +1,7 @@
 from .base import BaseView
-from .aif import AIFResponse, InterpResponse
+from .aif import AIFResponse, InterpResponse, AIFSessionResponse
 from .sne import SNEResponse
 from .ni import NIResponse, NInterResponse
 from .slat import SLATResponse
+from .nonlinear import NonLinearResponse, RootsResponse
+from .jobs import JobResponse
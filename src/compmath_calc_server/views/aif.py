@@ -1,10 +1,14 @@
-from compmath_calc_server.models.aif.dto import ResultAIFItem, ResultInterpItem
+from compmath_calc_server.models.aif.dto import OutputAIFModel, OutputInterpModel, OutputAIFSessionModel
 from compmath_calc_server.views import BaseView
 
 
 class AIFResponse(BaseView):
-    content: list[ResultAIFItem]
+    content: OutputAIFModel
 
 
 class InterpResponse(BaseView):
-    content: list[ResultInterpItem]
+    content: OutputInterpModel
+
+
+class AIFSessionResponse(BaseView):
+    content: OutputAIFSessionModel
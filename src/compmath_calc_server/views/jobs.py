@@ -0,0 +1,6 @@
+from compmath_calc_server.models.jobs.dto import OutputJobModel
+from compmath_calc_server.views import BaseView
+
+
+class JobResponse(BaseView):
+    content: OutputJobModel
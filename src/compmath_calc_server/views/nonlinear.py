@@ -0,0 +1,10 @@
+from compmath_calc_server.models.nonlinear.dto import OutputNonLinearModel, OutputRootsModel
+from compmath_calc_server.views import BaseView
+
+
+class NonLinearResponse(BaseView):
+    content: OutputNonLinearModel
+
+
+class RootsResponse(BaseView):
+    content: OutputRootsModel
@@ -0,0 +1,76 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from compmath_calc_server.utils import artifacts
+from compmath_calc_server.utils.artifacts import ArtifactStore, check_private
+
+
+class ArtifactStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "store", "artifacts.sqlite3")
+        self.store = ArtifactStore(self.path, max_items=1000)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_value_is_shared_through_file(self):
+        self.store.set("key", {"value": 1})
+
+        other = ArtifactStore(self.path, max_items=1000)
+        self.assertEqual(other.get("key"), (True, {"value": 1}))
+        self.assertEqual(other.get("missing"), (False, None))
+
+    def test_store_is_private(self):
+        self.store.set("key", 1)
+
+        check_private(os.path.dirname(self.path))
+        check_private(self.path)
+
+    @unittest.skipUnless(os.name == "posix", "права доступа POSIX")
+    def test_shared_directory_is_refused(self):
+        directory = os.path.join(self.directory.name, "shared")
+        os.makedirs(directory)
+        os.chmod(directory, 0o777)
+
+        with self.assertRaises(PermissionError):
+            ArtifactStore(os.path.join(directory, "artifacts.sqlite3"), max_items=10).set("key", 1)
+
+    def test_broken_record_is_a_miss(self):
+        self.store.set("key", 1)
+        with sqlite3.connect(self.path) as connection:
+            connection.execute("UPDATE artifacts SET value = ? WHERE key = ?", (b"not a pickle", "key"))
+
+        other = ArtifactStore(self.path, max_items=1000)
+        self.assertEqual(other.get("key"), (False, None))
+        self.assertEqual(other.stats()["items"], 0)
+
+    def test_threads_share_the_store(self):
+        # Режим CALC_PROCESSES=0: расчеты и кэш выполняются в пуле потоков
+        def round_trip(i: int) -> tuple[bool, Any]:
+            self.store.set(f"key{i % 50}", i % 50)
+            return self.store.get(f"key{i % 50}")
+
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(round_trip, range(400)))
+
+        self.assertEqual(results, [(True, i % 50) for i in range(400)])
+        self.assertEqual(self.store.stats()["items"], 50)
+
+    def test_eviction_keeps_max_items(self):
+        store = ArtifactStore(self.path, max_items=10)
+        for i in range(artifacts.EVICT_EVERY + 2):
+            store.set(f"key{i}", i)
+
+        stats = store.stats()
+        self.assertLess(stats["items"], artifacts.EVICT_EVERY)
+        self.assertGreater(stats["evictions"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import tempfile
+import unittest
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from compmath_calc_server.utils.cache import ResponseCache, ResponseCacheMiddleware, request_key
+
+
+class RequestKeyTest(unittest.TestCase):
+
+    def test_formatting_does_not_change_key(self):
+        self.assertEqual(
+            request_key("1", "/api/calc", b'{"a": 1, "b": [1, 2]}'),
+            request_key("1", "/api/calc", b'{"b":[1,2],"a":1}')
+        )
+
+    def test_version_and_path_change_key(self):
+        key = request_key("1", "/api/calc", b"{}")
+        self.assertNotEqual(key, request_key("2", "/api/calc", b"{}"))
+        self.assertNotEqual(key, request_key("1", "/api/other", b"{}"))
+
+    def test_non_json_body_has_no_key(self):
+        self.assertIsNone(request_key("1", "/api/calc", b"x,y\n1,2"))
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    def test_size_limit_evicts_oldest(self):
+        cache = ResponseCache(max_bytes=10, ttl=60)
+        cache.set("a", b"12345")
+        cache.set("b", b"12345")
+        cache.set("c", b"12345")
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("c"), b"12345")
+
+    def test_directory_is_shared_between_workers(self):
+        with tempfile.TemporaryDirectory() as path:
+            ResponseCache(max_bytes=1024, ttl=60, path=path).set("key", b"body")
+
+            self.assertEqual(ResponseCache(max_bytes=1024, ttl=60, path=path).get("key"), b"body")
+
+    def test_expired_file_is_a_miss(self):
+        with tempfile.TemporaryDirectory() as path:
+            ResponseCache(max_bytes=1024, ttl=-1, path=path).set("key", b"body")
+
+            self.assertIsNone(ResponseCache(max_bytes=1024, ttl=-1, path=path).get("key"))
+
+
+class ResponseCacheMiddlewareTest(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = 0
+        app = FastAPI()
+
+        @app.post("/api/calc/calculate")
+        def calculate(data: dict):
+            self.calls += 1
+            if data.get("fail"):
+                return JSONResponse({"error": "fail"}, status_code=400)
+            return {"result": data["x"] * 2}
+
+        app.add_middleware(ResponseCacheMiddleware, cache=ResponseCache(max_bytes=1024, ttl=60), version="1")
+        self.client = TestClient(app)
+
+    def test_repeated_request_is_served_from_cache(self):
+        headers = {"Content-Type": "application/json"}
+        first = self.client.post("/api/calc/calculate", content=b'{"x": 2}', headers=headers)
+        second = self.client.post("/api/calc/calculate", content=b'{ "x":2 }', headers=headers)
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(first.headers["x-cache"], "MISS")
+        self.assertEqual(second.headers["x-cache"], "HIT")
+        self.assertEqual(second.json(), {"result": 4})
+        self.assertEqual(first.headers["etag"], second.headers["etag"])
+
+    def test_matching_etag_gets_not_modified(self):
+        etag = self.client.post("/api/calc/calculate", json={"x": 3}).headers["etag"]
+
+        response = self.client.post("/api/calc/calculate", json={"x": 3}, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(self.calls, 1)
+
+    def test_errors_are_not_cached(self):
+        self.client.post("/api/calc/calculate", json={"fail": True})
+        response = self.client.post("/api/calc/calculate", json={"fail": True})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertNotIn("etag", response.headers)
+        self.assertEqual(self.calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+import numpy as np
+
+from compmath_calc_server.utils.downsample import lttb
+
+
+class LTTBTest(unittest.TestCase):
+
+    def setUp(self):
+        self.x = np.linspace(0, 10, 10_000)
+        self.y = np.sin(self.x)
+
+    def test_threshold_and_end_points(self):
+        x, y = lttb(self.x, self.y, 100)
+
+        self.assertEqual(len(x), 100)
+        self.assertEqual((x[0], x[-1]), (self.x[0], self.x[-1]))
+        self.assertTrue(np.all(np.diff(x) > 0))
+        np.testing.assert_array_equal(y, np.sin(x))
+
+    def test_small_sets_are_unchanged(self):
+        for threshold in (2, 10_000, 20_000):
+            with self.subTest(threshold=threshold):
+                x, y = lttb(self.x, self.y, threshold)
+                np.testing.assert_array_equal(x, self.x)
+
+    def test_outlier_is_kept(self):
+        y = self.y.copy()
+        y[4321] = 50
+
+        _, sampled = lttb(self.x, y, 50)
+
+        self.assertIn(50, sampled)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from compmath_calc_server.utils import metrics
+from compmath_calc_server.utils.metrics import MeasuredRoute, record_spans
+
+
+def stages(route: str) -> set[str]:
+    return {
+        dict(labels)["stage"]
+        for (name, labels) in metrics.registry.histograms
+        if name == "compmath_stage_duration_seconds" and dict(labels)["route"] == route
+    }
+
+
+class MeasuredRouteTest(unittest.TestCase):
+
+    def setUp(self):
+        metrics.registry = metrics.Registry()
+        self.calls = 0
+
+        router = APIRouter(route_class=MeasuredRoute)
+
+        @router.post("/calc")
+        def calc(data: dict):
+            self.calls += 1
+            # Этапы расчета, как их передает исполнитель
+            record_spans("test/calc", {"parse": 0.5, "calc": 1.0})
+            return data
+
+        self.router = router
+
+    def test_request_parse_does_not_replace_expression_parse(self):
+        app = FastAPI()
+        app.include_router(self.router, prefix="/api")
+
+        response = TestClient(app).post("/api/calc", json={"fx": "x"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue({"request_parse", "parse", "calc", "serialize"} <= stages("/api/calc"))
+        histogram = metrics.registry.histograms[
+            metrics.Registry._key("compmath_stage_duration_seconds", {"route": "/api/calc", "stage": "parse"})
+        ]
+        self.assertEqual(histogram[-2], 0.5)
+
+    def test_endpoint_is_wrapped_once(self):
+        # Так include_router (в версиях FastAPI, копирующих маршруты) пересоздает маршрут
+        route = self.router.routes[0]
+        copy = MeasuredRoute(route.path, route.endpoint, methods=route.methods)
+
+        self.assertIs(copy.endpoint, route.endpoint)
+
+        app = FastAPI()
+        app.router.routes.append(copy)
+        TestClient(app).post("/calc", json={})
+        self.assertEqual(self.calls, 1)
+        self.assertIn("request_parse", stages("/calc"))
+
+if __name__ == "__main__":
+    unittest.main()
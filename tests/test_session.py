@@ -0,0 +1,74 @@
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from compmath_calc_server.exceptions import BadRequest, NotFound
+from compmath_calc_server.models.aif.session import Session, SessionStore
+
+POINTS = [(1.0, 0.28), (1.64, 0.19), (2.28, 0.15), (2.91, 0.11), (3.56, 0.09)]
+
+
+class SessionStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = SessionStore(self.directory.name, ttl=3600)
+
+        session = Session((-10, 10), (-10, 10))
+        session.add(POINTS)
+        self.session_id = self.store.create(session, POINTS)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def assertSameStats(self, session: Session, points: list[tuple[float, float]]):
+        expected = Session((-10, 10), (-10, 10))
+        expected.add(points)
+        self.assertEqual(session.n, len(points))
+        for actual, value in zip(session.stats.b_vector(), expected.stats.b_vector()):
+            self.assertAlmostEqual(actual, value)
+        self.assertAlmostEqual(session.moments.r, expected.moments.r)
+
+    def test_update_matches_recalculation(self):
+        session = self.store.update(self.session_id, add=[(4.19, 0.08)], remove=[POINTS[0]])
+
+        self.assertSameStats(session, [*POINTS[1:], (4.19, 0.08)])
+        self.assertSameStats(self.store.get(self.session_id), [*POINTS[1:], (4.19, 0.08)])
+
+    def test_removing_foreign_point_is_rejected(self):
+        with self.assertRaises(BadRequest):
+            self.store.update(self.session_id, add=[(9.0, 9.0)], remove=[(100.0, 100.0)])
+
+        # Транзакция откатывается целиком, добавление тоже не применяется
+        self.assertSameStats(self.store.get(self.session_id), POINTS)
+
+    def test_point_is_removed_as_many_times_as_added(self):
+        # Исключение проверяется по точкам сессии до добавления порции
+        with self.assertRaises(BadRequest):
+            self.store.update(self.session_id, add=[POINTS[0]], remove=[POINTS[0], POINTS[0]])
+
+        self.store.update(self.session_id, add=[POINTS[0]], remove=[])
+        self.store.update(self.session_id, add=[], remove=[POINTS[0], POINTS[0]])
+
+        with self.assertRaises(BadRequest):
+            self.store.update(self.session_id, add=[], remove=[POINTS[0]])
+
+    def test_concurrent_updates_are_serialized(self):
+        with ThreadPoolExecutor(8) as pool:
+            list(pool.map(lambda i: self.store.update(self.session_id, add=[(10.0 + i, 1.0)], remove=[]), range(20)))
+
+        self.assertEqual(self.store.get(self.session_id).n, len(POINTS) + 20)
+
+    def test_deleted_and_unknown_sessions(self):
+        self.store.delete(self.session_id)
+
+        for session_id in (self.session_id, "not-a-uuid"):
+            with self.subTest(session_id=session_id):
+                with self.assertRaises(NotFound):
+                    self.store.get(session_id)
+                with self.assertRaises(NotFound):
+                    self.store.update(session_id, add=[(1.0, 1.0)], remove=[])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import asyncio
+import unittest
+from typing import AsyncIterator
+
+import numpy as np
+
+from compmath_calc_server.utils.stream import StreamFormatError, read_points
+
+
+async def chunks(*parts: bytes) -> AsyncIterator[bytes]:
+    for part in parts:
+        yield part
+
+
+def read(content_type: str, *parts: bytes, on_chunk=None) -> tuple[np.ndarray, np.ndarray]:
+    return asyncio.run(read_points(chunks(*parts), content_type, on_chunk))
+
+
+class ReadPointsTest(unittest.TestCase):
+
+    def test_csv_row_split_between_chunks(self):
+        x, y = read("text/csv; charset=utf-8", b"# x,y\n1,2\n3.", b"5,4\n\n5,6")
+
+        np.testing.assert_array_equal(x, [1, 3.5, 5])
+        np.testing.assert_array_equal(y, [2, 4, 6])
+
+    def test_binary_pair_split_between_chunks(self):
+        data = np.array([[1, 2], [3, 4], [5, 6]], dtype="<f8").tobytes()
+
+        x, y = read("application/octet-stream", data[:5], data[5:21], data[21:])
+
+        np.testing.assert_array_equal(x, [1, 3, 5])
+        np.testing.assert_array_equal(y, [2, 4, 6])
+
+    def test_every_chunk_is_passed_to_handler(self):
+        sizes = []
+        data = np.arange(8, dtype="<f8").tobytes()
+
+        read("application/octet-stream", data[:32], data[32:], on_chunk=lambda x, y: sizes.append(len(x)))
+
+        self.assertEqual(sizes, [2, 2])
+
+    def test_incomplete_binary_pair(self):
+        with self.assertRaises(StreamFormatError):
+            read("application/octet-stream", np.arange(3, dtype="<f8").tobytes())
+
+    def test_non_finite_values(self):
+        for content_type, data in (
+                ("text/csv", b"1,2\n2,nan\n"),
+                ("text/csv", b"1,inf\n"),
+                ("application/octet-stream", np.array([1, np.nan], dtype="<f8").tobytes())
+        ):
+            with self.subTest(content_type=content_type, data=data), self.assertRaises(StreamFormatError):
+                read(content_type, data)
+
+    def test_wrong_csv_width(self):
+        with self.assertRaises(StreamFormatError):
+            read("text/csv", b"1,2,3\n")
+
+    def test_unsupported_content_type(self):
+        with self.assertRaises(StreamFormatError):
+            read("application/json", b"[]")
+
+    def test_empty_stream(self):
+        x, y = read("text/csv")
+
+        self.assertEqual((len(x), len(y)), (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()